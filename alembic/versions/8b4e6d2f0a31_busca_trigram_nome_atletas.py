@@ -0,0 +1,66 @@
+"""busca trigram no nome dos atletas
+
+Revision ID: 8b4e6d2f0a31
+Revises: 3f1c2a7b9d10
+Create Date: 2026-10-17 10:03:27.540912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b4e6d2f0a31'
+down_revision = '3f1c2a7b9d10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        # Alternativa ao pg_trgm: índice FTS5 com tokenizador trigram, mantido por triggers.
+        # DDL congelado nesta revisão, independente do hook em atleta_model: mudanças no índice
+        # vão em uma nova migração
+        op.execute(
+            "CREATE VIRTUAL TABLE atletas_fts USING fts5("
+            "nome, content='atletas', content_rowid='pk_id', tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER atletas_fts_ai AFTER INSERT ON atletas BEGIN "
+            "INSERT INTO atletas_fts(rowid, nome) VALUES (new.pk_id, new.nome); END"
+        )
+        op.execute(
+            "CREATE TRIGGER atletas_fts_ad AFTER DELETE ON atletas BEGIN "
+            "INSERT INTO atletas_fts(atletas_fts, rowid, nome) VALUES ('delete', old.pk_id, old.nome); END"
+        )
+        op.execute(
+            "CREATE TRIGGER atletas_fts_au AFTER UPDATE OF nome ON atletas BEGIN "
+            "INSERT INTO atletas_fts(atletas_fts, rowid, nome) VALUES ('delete', old.pk_id, old.nome); "
+            "INSERT INTO atletas_fts(rowid, nome) VALUES (new.pk_id, new.nome); END"
+        )
+        op.execute("INSERT INTO atletas_fts(atletas_fts) VALUES ('rebuild')")
+        return
+    
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY não bloqueia escritas em atletas, mas não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_atletas_nome_trgm',
+            'atletas',
+            ['nome'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'nome': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for trigger in ('atletas_fts_ai', 'atletas_fts_ad', 'atletas_fts_au'):
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        op.execute('DROP TABLE IF EXISTS atletas_fts')
+        return
+    
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_atletas_nome_trgm', table_name='atletas', postgresql_concurrently=True)
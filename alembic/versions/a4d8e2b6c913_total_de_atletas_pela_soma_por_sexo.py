@@ -0,0 +1,30 @@
+"""total de atletas pela soma por sexo
+
+Revision ID: a4d8e2b6c913
+Revises: f3a9c1d7e582
+Create Date: 2026-10-17 18:20:44.731925
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4d8e2b6c913'
+down_revision = 'f3a9c1d7e582'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # O total passa a ser a soma das linhas por sexo; a linha única disputada por toda escrita sai
+    op.execute("DELETE FROM atletas_estatisticas WHERE dimensao = 'total'")
+
+
+def downgrade() -> None:
+    op.execute(
+        'INSERT INTO atletas_estatisticas (dimensao, chave, contagem, soma_peso, soma_altura, soma_idade) '
+        "SELECT 'total', '', coalesce(sum(contagem), 0), coalesce(sum(soma_peso), 0), "
+        'coalesce(sum(soma_altura), 0), coalesce(sum(soma_idade), 0) '
+        "FROM atletas_estatisticas WHERE dimensao = 'sexo'"
+    )
@@ -0,0 +1,36 @@
+"""versao das linhas de atletas
+
+Revision ID: c52d9e8a1f47
+Revises: 8b4e6d2f0a31
+Create Date: 2026-10-17 11:26:05.118342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c52d9e8a1f47'
+down_revision = '8b4e6d2f0a31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # updated_at versiona cada linha e compõe o ETag dos GETs de atletas
+    if op.get_bind().dialect.name == 'sqlite':
+        # Sem batch mode: recriar a tabela descartaria os triggers do índice FTS5
+        op.add_column(
+            'atletas',
+            sa.Column('updated_at', sa.DateTime(), nullable=False, server_default='1970-01-01 00:00:00')
+        )
+        op.execute('UPDATE atletas SET updated_at = created_at')
+        return
+    
+    op.add_column('atletas', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute('UPDATE atletas SET updated_at = created_at')
+    op.alter_column('atletas', 'updated_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_column('atletas', 'updated_at')
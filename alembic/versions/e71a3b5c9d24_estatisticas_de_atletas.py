@@ -0,0 +1,63 @@
+"""estatisticas de atletas
+
+Revision ID: e71a3b5c9d24
+Revises: c52d9e8a1f47
+Create Date: 2026-10-17 15:42:10.504127
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e71a3b5c9d24'
+down_revision = 'c52d9e8a1f47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'atletas_estatisticas',
+        sa.Column('dimensao', sa.String(length=20), nullable=False),
+        sa.Column('chave', sa.String(length=20), nullable=False),
+        sa.Column('contagem', sa.Integer(), nullable=False),
+        sa.Column('soma_peso', sa.Float(), nullable=False),
+        sa.Column('soma_altura', sa.Float(), nullable=False),
+        sa.Column('soma_idade', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('dimensao', 'chave')
+    )
+    op.create_table(
+        'atletas_histograma',
+        sa.Column('medida', sa.String(length=10), nullable=False),
+        sa.Column('bucket', sa.Integer(), nullable=False),
+        sa.Column('contagem', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('medida', 'bucket')
+    )
+    
+    # Resumo inicial com os atletas já cadastrados (mesmas contas de AtletaStatsController.recompute)
+    agregados = 'count(*), coalesce(sum(peso), 0), coalesce(sum(altura), 0), coalesce(sum(idade), 0)'
+    op.execute(
+        'INSERT INTO atletas_estatisticas (dimensao, chave, contagem, soma_peso, soma_altura, soma_idade) '
+        f"SELECT 'total', '', {agregados} FROM atletas "
+        f"UNION ALL SELECT 'categoria', CAST(categoria_id AS VARCHAR(20)), {agregados} FROM atletas GROUP BY categoria_id "
+        f"UNION ALL SELECT 'centro_treinamento', CAST(centro_treinamento_id AS VARCHAR(20)), {agregados} "
+        'FROM atletas GROUP BY centro_treinamento_id '
+        f"UNION ALL SELECT 'sexo', sexo, {agregados} FROM atletas GROUP BY sexo"
+    )
+    
+    if op.get_bind().dialect.name == 'postgresql':
+        bucket = 'CAST(floor({} * {} + 0.5) AS INTEGER)'
+    else:
+        bucket = 'CAST({} * {} + 0.5 AS INTEGER)'
+    for medida, escala in (('idade', 1), ('peso', 1), ('altura', 100)):
+        expressao = bucket.format(medida, escala)
+        op.execute(
+            'INSERT INTO atletas_histograma (medida, bucket, contagem) '
+            f"SELECT '{medida}', {expressao}, count(*) FROM atletas GROUP BY {expressao}"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('atletas_histograma')
+    op.drop_table('atletas_estatisticas')
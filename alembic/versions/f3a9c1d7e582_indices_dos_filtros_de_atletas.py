@@ -0,0 +1,46 @@
+"""indices dos filtros de atletas
+
+Revision ID: f3a9c1d7e582
+Revises: e71a3b5c9d24
+Create Date: 2026-10-17 15:42:10.613207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a9c1d7e582'
+down_revision = 'e71a3b5c9d24'
+branch_labels = None
+depends_on = None
+
+INDICES = [
+    ('ix_atletas_centro_nome_pk_id', ['centro_treinamento_id', 'nome', 'pk_id']),
+    ('ix_atletas_categoria_nome_pk_id', ['categoria_id', 'nome', 'pk_id']),
+    ('ix_atletas_sexo_idade', ['sexo', 'idade']),
+    ('ix_atletas_created_at', ['created_at']),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for nome, colunas in INDICES:
+            op.create_index(nome, 'atletas', colunas, unique=False)
+        return
+    
+    # CONCURRENTLY não bloqueia escritas em atletas, mas não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        for nome, colunas in INDICES:
+            op.create_index(nome, 'atletas', colunas, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for nome, _ in INDICES:
+            op.drop_index(nome, table_name='atletas')
+        return
+    
+    with op.get_context().autocommit_block():
+        for nome, _ in INDICES:
+            op.drop_index(nome, table_name='atletas', postgresql_concurrently=True)
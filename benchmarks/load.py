@@ -0,0 +1,366 @@
+"""Carga HTTP em todas as rotas de atletas, categorias e centros de treinamento.
+
+Cada rota recebe o mesmo número de requisições, disparadas por N clientes concorrentes,
+contra a aplicação em processo (httpx + ASGI) ou um uvicorn de verdade. O relatório traz
+p50/p95/p99 e requisições por segundo; os resultados podem ser salvos como baseline em JSON
+e comparados nas execuções seguintes.
+
+Uso: python -m benchmarks.load [--modo asgi|uvicorn] [--concorrencia 10] [--requisicoes 200]
+                               [--db-url URL] [--salvar] [--limite 0.25]
+
+Sem --db-url (ou BENCH_DB_URL) usa um SQLite temporário. Com uma URL do Postgres, as tabelas
+do banco informado são recriadas: use um banco descartável.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, NamedTuple
+import httpx
+
+BASELINES_DIR = Path(__file__).parent / 'baselines'
+# Prefixos dos routers medidos; toda rota deles precisa de um cenário
+PREFIXOS = ('/atletas', '/categorias', '/centros_treinamento')
+TOTAL_CATEGORIAS = 20
+TOTAL_CENTROS = 40
+ATLETAS_POR_LOTE = 10
+
+
+class Cenario(NamedTuple):
+    metodo: str
+    rota: str
+    # Recebe o índice da requisição e devolve os argumentos do httpx (url, params, json, files)
+    requisicao: Callable[[int], dict]
+    
+    @property
+    def nome(self) -> str:
+        return f'{self.metodo} {self.rota}'
+
+
+class Dados:
+    """Ids existentes no banco populado e geradores de valores únicos para as escritas."""
+    
+    def __init__(self, atletas: list[int], descartaveis: list[int]):
+        self.atletas = atletas
+        self.descartaveis = descartaveis
+        # CPFs novos começam acima dos gerados na carga inicial
+        self._cpfs = itertools.count(10 ** 10)
+        self._nomes = itertools.count(1)
+        self._random = random.Random(42)
+    
+    def atleta_id(self) -> int:
+        return self._random.choice(self.atletas)
+    
+    def nome(self, prefixo: str) -> str:
+        return f'{prefixo} {next(self._nomes)}'
+    
+    def atleta(self) -> dict:
+        n = next(self._cpfs)
+        return {
+            'nome': f'Atleta {n}',
+            'cpf': f'{n:011d}',
+            'idade': 18 + n % 40,
+            'peso': 60.0 + n % 40,
+            'altura': 1.50 + (n % 50) / 100,
+            'sexo': 'MF'[n % 2],
+            'categoria_id': 1 + n % TOTAL_CATEGORIAS,
+            'centro_treinamento_id': 1 + n % TOTAL_CENTROS
+        }
+    
+    def csv(self) -> bytes:
+        linhas = ['nome,cpf,idade,peso,altura,sexo,categoria_id,centro_treinamento_id']
+        for _ in range(ATLETAS_POR_LOTE):
+            linhas.append(','.join(str(valor) for valor in self.atleta().values()))
+        return '\n'.join(linhas).encode()
+
+
+def cenarios(dados: Dados) -> list[Cenario]:
+    """Leituras primeiro; o DELETE fica por último e consome os atletas descartáveis."""
+    descartaveis = iter(dados.descartaveis)
+    return [
+        Cenario('GET', '/atletas/', lambda i: {'url': '/atletas/'}),
+        Cenario('GET', '/atletas/', lambda i: {
+            'url': '/atletas/',
+            'params': {'centro_treinamento_id': 1 + i % TOTAL_CENTROS, 'paginacao': 'cursor', 'contagem': 'nenhuma'}
+        }),
+        Cenario('GET', '/atletas/export', lambda i: {'url': '/atletas/export', 'params': {'categoria_id': 1 + i % TOTAL_CATEGORIAS}}),
+        Cenario('GET', '/atletas/stats', lambda i: {'url': '/atletas/stats'}),
+        Cenario('GET', '/atletas/batch', lambda i: {
+            'url': '/atletas/batch',
+            'params': {'ids': [dados.atleta_id() for _ in range(ATLETAS_POR_LOTE)]}
+        }),
+        Cenario('GET', '/atletas/{id}', lambda i: {'url': f'/atletas/{dados.atleta_id()}'}),
+        Cenario('GET', '/categorias/', lambda i: {'url': '/categorias/'}),
+        Cenario('GET', '/categorias/{id}', lambda i: {'url': f'/categorias/{1 + i % TOTAL_CATEGORIAS}'}),
+        Cenario('GET', '/centros_treinamento/', lambda i: {'url': '/centros_treinamento/'}),
+        Cenario('GET', '/centros_treinamento/{id}', lambda i: {'url': f'/centros_treinamento/{1 + i % TOTAL_CENTROS}'}),
+        Cenario('POST', '/categorias/', lambda i: {'url': '/categorias/', 'json': {'nome': dados.nome('Categoria')}}),
+        Cenario('POST', '/centros_treinamento/', lambda i: {
+            'url': '/centros_treinamento/',
+            'json': {'nome': dados.nome('CT'), 'endereco': 'Rua X, 123', 'proprietario': 'Marcos'}
+        }),
+        Cenario('POST', '/atletas/', lambda i: {'url': '/atletas/', 'json': dados.atleta()}),
+        Cenario('POST', '/atletas/bulk', lambda i: {
+            'url': '/atletas/bulk',
+            'json': [dados.atleta() for _ in range(ATLETAS_POR_LOTE)]
+        }),
+        Cenario('POST', '/atletas/import', lambda i: {
+            'url': '/atletas/import',
+            'files': {'arquivo': ('atletas.csv', dados.csv(), 'text/csv')}
+        }),
+        Cenario('PATCH', '/atletas/{id}', lambda i: {'url': f'/atletas/{dados.atleta_id()}', 'json': {'idade': 18 + i % 40}}),
+        Cenario('POST', '/atletas/stats/recompute', lambda i: {'url': '/atletas/stats/recompute'}),
+        Cenario('DELETE', '/atletas/{id}', lambda i: {'url': f'/atletas/{next(descartaveis)}'}),
+    ]
+
+
+def verificar_cobertura(app, lista: list[Cenario]) -> None:
+    """Falha se algum endpoint dos routers medidos ficou sem cenário."""
+    cobertos = {(cenario.metodo, cenario.rota) for cenario in lista}
+    faltando = sorted(
+        f'{metodo} {route.path}'
+        for route in app.routes
+        if route.path.startswith(PREFIXOS)
+        for metodo in getattr(route, 'methods', ())
+        if metodo != 'HEAD' and (metodo, route.path) not in cobertos
+    )
+    if faltando:
+        raise SystemExit(f'Rotas sem cenário de carga: {", ".join(faltando)}')
+
+
+async def popular(db_url: str, atletas: int, descartaveis: int) -> Dados:
+    """Recria as tabelas e carrega categorias, centros e atletas; devolve os ids criados."""
+    from sqlalchemy import insert, select, text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from workout_api.configs.database import BaseModel
+    from workout_api.models.atleta_model import AtletaModel
+    from workout_api.models.categoria_model import CategoriaModel
+    from workout_api.models.centro_treinamento_model import CentroTreinamentoModel
+    
+    engine = create_async_engine(db_url)
+    agora = datetime.now()
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.drop_all)
+        await conn.run_sync(BaseModel.metadata.create_all)
+        await conn.execute(insert(CategoriaModel), [{'nome': f'Categoria {i}'} for i in range(TOTAL_CATEGORIAS)])
+        await conn.execute(insert(CentroTreinamentoModel), [
+            {'nome': f'CT {i}', 'endereco': f'Rua {i}', 'proprietario': f'Dono {i}'} for i in range(TOTAL_CENTROS)
+        ])
+        await conn.execute(insert(AtletaModel), [
+            {
+                'nome': f'Atleta {i}',
+                'cpf': f'{i:011d}',
+                'idade': 18 + i % 40,
+                'peso': 60.0 + i % 40,
+                'altura': 1.50 + (i % 50) / 100,
+                'sexo': 'MF'[i % 2],
+                'categoria_id': 1 + i % TOTAL_CATEGORIAS,
+                'centro_treinamento_id': 1 + i % TOTAL_CENTROS,
+                'created_at': agora,
+                'updated_at': agora
+            }
+            for i in range(atletas + descartaveis)
+        ])
+        await conn.execute(text('ANALYZE'))
+        ids = (await conn.execute(select(AtletaModel.pk_id).order_by(AtletaModel.pk_id))).scalars().all()
+    await engine.dispose()
+    
+    return Dados(atletas=list(ids[:atletas]), descartaveis=list(ids[atletas:]))
+
+
+def percentil(valores: list[float], p: float) -> float:
+    # Nearest-rank sobre a lista ordenada
+    return valores[max(0, math.ceil(p / 100 * len(valores)) - 1)]
+
+
+async def medir(client: httpx.AsyncClient, cenario: Cenario, requisicoes: int, concorrencia: int, aquecimento: int) -> dict:
+    indices = itertools.count()
+    latencias: list[float] = []
+    erros = 0
+    
+    async def cliente(total: int, registrar: bool) -> None:
+        nonlocal erros
+        while (i := next(indices)) < total:
+            argumentos = cenario.requisicao(i)
+            inicio = time.perf_counter()
+            response = await client.request(cenario.metodo, **argumentos)
+            elapsed = time.perf_counter() - inicio
+            if not registrar:
+                continue
+            latencias.append(elapsed)
+            if response.status_code >= 400:
+                erros += 1
+    
+    await asyncio.gather(*(cliente(aquecimento, False) for _ in range(concorrencia)))
+    indices = itertools.count(aquecimento)
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(aquecimento + requisicoes, True) for _ in range(concorrencia)))
+    duracao = time.perf_counter() - inicio
+    
+    latencias.sort()
+    return {
+        'requisicoes': len(latencias),
+        'erros': erros,
+        'rps': round(len(latencias) / duracao, 1),
+        'p50_ms': round(percentil(latencias, 50) * 1000, 3),
+        'p95_ms': round(percentil(latencias, 95) * 1000, 3),
+        'p99_ms': round(percentil(latencias, 99) * 1000, 3),
+    }
+
+
+def porta_livre() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def iniciar_uvicorn(env: dict, workers: int) -> tuple[subprocess.Popen, str]:
+    porta = porta_livre()
+    processo = subprocess.Popen(
+        [
+            sys.executable, '-m', 'uvicorn', 'workout_api.main:app',
+            '--host', '127.0.0.1', '--port', str(porta), '--workers', str(workers), '--log-level', 'warning', '--no-access-log'
+        ],
+        env={**os.environ, **env}
+    )
+    base_url = f'http://127.0.0.1:{porta}'
+    
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(100):
+            if processo.poll() is not None:
+                raise SystemExit(f'uvicorn encerrou com código {processo.returncode}')
+            try:
+                await client.get('/categorias/')
+                return processo, base_url
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    processo.terminate()
+    raise SystemExit('uvicorn não respondeu em 10s')
+
+
+async def executar(args, db_url: str) -> dict:
+    # As configurações são lidas na importação: DB_URL precisa estar no ambiente antes
+    env = {'DB_URL': db_url, 'DB_REPLICA_URLS': '', 'QUERY_BUDGET_MODE': 'off'}
+    os.environ.update(env)
+    from workout_api.main import app
+    # Consultas lentas sob carga são esperadas; o log de cada uma só polui o relatório
+    logging.getLogger('workout_api').setLevel(logging.ERROR)
+    
+    dados = await popular(db_url, args.atletas, args.aquecimento + args.requisicoes)
+    lista = cenarios(dados)
+    verificar_cobertura(app, lista)
+    limits = httpx.Limits(max_connections=args.concorrencia, max_keepalive_connections=args.concorrencia)
+    resultados = {}
+    
+    if args.modo == 'uvicorn':
+        processo, base_url = await iniciar_uvicorn(env, args.workers)
+        try:
+            async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+                for cenario in lista:
+                    resultados[rotulo(cenario, resultados)] = await medir(client, cenario, args.requisicoes, args.concorrencia, args.aquecimento)
+        finally:
+            processo.terminate()
+            processo.wait()
+    else:
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(app=app, base_url='http://bench', limits=limits, timeout=60) as client:
+                for cenario in lista:
+                    resultados[rotulo(cenario, resultados)] = await medir(client, cenario, args.requisicoes, args.concorrencia, args.aquecimento)
+    
+    return resultados
+
+
+def rotulo(cenario: Cenario, resultados: dict) -> str:
+    # A mesma rota pode ter mais de um cenário (ex.: listagem com e sem filtro)
+    nome = cenario.nome
+    repeticoes = sum(1 for chave in resultados if chave == nome or chave.startswith(f'{nome} #'))
+    return f'{nome} #{repeticoes + 1}' if repeticoes else nome
+
+
+def comparar(atual: dict, baseline: dict, limite: float) -> list[str]:
+    """Regressões acima do limite: p95 maior ou requisições por segundo menores."""
+    regressoes = []
+    for nome, resultado in atual.items():
+        anterior = baseline.get(nome)
+        if anterior is None:
+            continue
+        if resultado['p95_ms'] > anterior['p95_ms'] * (1 + limite):
+            regressoes.append(f'{nome}: p95 {anterior["p95_ms"]:.1f} -> {resultado["p95_ms"]:.1f} ms')
+        if resultado['rps'] < anterior['rps'] * (1 - limite):
+            regressoes.append(f'{nome}: {anterior["rps"]:.1f} -> {resultado["rps"]:.1f} req/s')
+    return regressoes
+
+
+def imprimir(resultados: dict) -> None:
+    print(f'{"rota":42} {"req/s":>9} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"erros":>6}')
+    for nome, r in resultados.items():
+        print(f'{nome:42} {r["rps"]:9.1f} {r["p50_ms"]:9.2f} {r["p95_ms"]:9.2f} {r["p99_ms"]:9.2f} {r["erros"]:6}')
+
+
+async def main(args) -> int:
+    db_url = args.db_url or os.getenv('BENCH_DB_URL')
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = db_url or f'sqlite+aiosqlite:///{tmp}/bench.db'
+        dialeto = db_url.split(':', 1)[0].split('+', 1)[0]
+        resultados = await executar(args, db_url)
+    
+    imprimir(resultados)
+    caminho = Path(args.baseline or BASELINES_DIR / f'{args.modo}-{dialeto}-c{args.concorrencia}.json')
+    status = 0
+    
+    erros = sum(r['erros'] for r in resultados.values())
+    if erros:
+        print(f'\n{erros} requisições com status de erro')
+        status = 1
+    
+    if args.salvar:
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        caminho.write_text(json.dumps({
+            'meta': {
+                'modo': args.modo,
+                'banco': dialeto,
+                'concorrencia': args.concorrencia,
+                'requisicoes': args.requisicoes,
+                'atletas': args.atletas,
+                'python': platform.python_version(),
+                'maquina': platform.node()
+            },
+            'resultados': resultados
+        }, indent=2, ensure_ascii=False))
+        print(f'\nBaseline salva em {caminho}')
+    elif caminho.exists():
+        regressoes = comparar(resultados, json.loads(caminho.read_text())['resultados'], args.limite)
+        print(f'\nComparado com {caminho} (limite {args.limite:.0%})')
+        for regressao in regressoes:
+            print(f'  REGRESSÃO {regressao}')
+        if regressoes:
+            status = 1
+    
+    return status
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modo', choices=['asgi', 'uvicorn'], default='asgi')
+    parser.add_argument('--concorrencia', type=int, default=10)
+    parser.add_argument('--requisicoes', type=int, default=200, help='Requisições medidas por rota')
+    parser.add_argument('--aquecimento', type=int, default=20, help='Requisições descartadas antes da medição')
+    parser.add_argument('--atletas', type=int, default=5000, help='Atletas na carga inicial')
+    parser.add_argument('--workers', type=int, default=1, help='Workers do uvicorn (modo uvicorn)')
+    parser.add_argument('--db-url', help='Banco descartável; padrão BENCH_DB_URL ou SQLite temporário')
+    parser.add_argument('--baseline', help='Arquivo da baseline; padrão benchmarks/baselines/<modo>-<banco>-c<concorrencia>.json')
+    parser.add_argument('--salvar', action='store_true', help='Grava os resultados como nova baseline')
+    parser.add_argument('--limite', type=float, default=0.25, help='Piora tolerada antes de falhar (0.25 = 25%%)')
+    sys.exit(asyncio.run(main(parser.parse_args())))
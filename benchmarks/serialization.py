@@ -0,0 +1,81 @@
+"""Compara a serialização padrão do FastAPI com a FastJSONRoute.
+
+Uso: python -m benchmarks.serialization [--itens 100] [--repeticoes 2000]
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from workout_api.core.serialization import get_adapter
+from workout_api.schemas.atleta_schema import AtletaOut, AtletaListOut
+from workout_api.schemas.categoria_schema import CategoriaOut
+from workout_api.schemas.centro_treinamento_schema import CentroTreinamentoOut
+from workout_api.schemas.pagination_schema import PageOut
+
+
+def build_payloads(itens: int) -> dict:
+    categoria = CategoriaOut.model_construct(pk_id=1, nome='Scale')
+    centro = CentroTreinamentoOut.model_construct(nome='CT King', endereco='Rua X, 123', proprietario='Marcos')
+    atletas = [
+        AtletaOut.model_construct(
+            pk_id=i, nome=f'Atleta {i}', cpf=f'{i:011d}', idade=25, peso=75.5, altura=1.75, sexo='M',
+            categoria_id=1, centro_treinamento_id=1, created_at=datetime(2024, 1, 1, 10, 0, i % 60),
+            categoria=categoria, centro_treinamento=centro
+        )
+        for i in range(itens)
+    ]
+    pagina = PageOut[AtletaListOut].model_construct(
+        items=[
+            AtletaListOut.model_construct(nome=atleta.nome, categoria=categoria, centro_treinamento=centro)
+            for atleta in atletas
+        ],
+        total=itens, page=1, size=itens, pages=1, contagem='exata', next_cursor=None
+    )
+    
+    return {
+        'GET /atletas (PageOut[AtletaListOut])': (PageOut[AtletaListOut], pagina),
+        'lista de AtletaOut': (list[AtletaOut], atletas),
+        'GET /atletas/{id} (AtletaOut)': (AtletaOut, atletas[0]),
+    }
+
+
+async def padrao(field, content) -> bytes:
+    return JSONResponse(await serialize_response(field=field, response_content=content, is_coroutine=True)).body
+
+
+def rapido(adapter, content) -> bytes:
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+async def medir(repeticoes: int, funcao, *args) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        resultado = funcao(*args)
+        if asyncio.iscoroutine(resultado):
+            await resultado
+    return (time.perf_counter() - inicio) / repeticoes
+
+
+async def main(itens: int, repeticoes: int) -> None:
+    for nome, (response_model, content) in build_payloads(itens).items():
+        field = create_response_field(name='Response', type_=response_model, mode='serialization')
+        adapter = get_adapter(response_model)
+        assert await padrao(field, content) == rapido(adapter, content), nome
+        
+        tempo_padrao = await medir(repeticoes, padrao, field, content)
+        tempo_rapido = await medir(repeticoes, rapido, adapter, content)
+        print(
+            f'{nome:40} padrão {tempo_padrao * 1e6:9.1f} µs  '
+            f'rápido {tempo_rapido * 1e6:9.1f} µs  ganho {tempo_padrao / tempo_rapido:5.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--itens', type=int, default=100)
+    parser.add_argument('--repeticoes', type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.itens, args.repeticoes))
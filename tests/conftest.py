@@ -3,7 +3,10 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from workout_api.configs.database import BaseModel, get_session
+from workout_api.configs.database import BaseModel, get_read_session, get_session, get_stream_session
+from workout_api.core.entity_cache import entity_cache
+from workout_api.core.query_budget import QueryBudget
+from workout_api.core.reference_cache import reference_cache
 from workout_api.main import app
 
 # Banco de dados de teste em memória
@@ -16,7 +19,14 @@ def event_loop():
     yield loop
     loop.close()
 
-@pytest.fixture(scope="session")
+@pytest.fixture(autouse=True)
+async def clear_caches():
+    """Fixture para descartar caches em memória entre testes"""
+    reference_cache.invalidate()
+    await entity_cache.clear()
+    yield
+
+@pytest.fixture
 async def engine():
     """Fixture para engine do banco de teste"""
     engine = create_async_engine(TEST_DATABASE_URL, echo=True)
@@ -43,8 +53,18 @@ async def client(db_session):
         return db_session
     
     app.dependency_overrides[get_session] = get_test_session
+    app.dependency_overrides[get_read_session] = get_test_session
+    app.dependency_overrides[get_stream_session] = get_test_session
     
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
     
-    app.dependency_overrides.clear() 
\ No newline at end of file
+    app.dependency_overrides.clear()
+
+@pytest.fixture
+def query_budget():
+    """Fixture para falhar o teste quando um trecho executar mais consultas que o orçamento"""
+    def budget(max_queries: int, label: str = None) -> QueryBudget:
+        return QueryBudget(max_queries, label, mode="raise")
+    
+    return budget 
\ No newline at end of file
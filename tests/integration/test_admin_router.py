@@ -0,0 +1,40 @@
+import json
+import pytest
+from httpx import AsyncClient
+from workout_api.configs.database import slow_queries
+
+class TestAdminRouter:
+    """Testes de integração para rotas administrativas"""
+    
+    @pytest.mark.asyncio
+    async def test_get_pool(self, client: AsyncClient):
+        """Teste: GET /admin/pool deve retornar o dimensionamento e os contadores do pool"""
+        # Act
+        response = await client.get("/admin/pool")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["classe"] == "InstrumentedAsyncPool"
+        assert data["tamanho"] == 5
+        assert data["timeouts"] == 0
+        assert "+Inf" in data["espera_histograma"]
+    
+    @pytest.mark.asyncio
+    async def test_get_slow_queries(self, client: AsyncClient, monkeypatch):
+        """Teste: GET /admin/slow-queries deve listar as consultas lentas com a rota de origem"""
+        # Arrange
+        monkeypatch.setattr(slow_queries, "threshold", 0)
+        monkeypatch.setattr(slow_queries, "entries", type(slow_queries.entries)(maxlen=10))
+        await client.get("/atletas/?cpf=12345678901")
+        
+        # Act
+        response = await client.get("/admin/slow-queries?limit=1")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["rota"] == "GET /atletas/"
+        assert "12345678901" not in json.dumps(data)
+        assert data[0]["duracao_ms"] >= 0 
\ No newline at end of file
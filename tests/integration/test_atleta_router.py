@@ -1,8 +1,16 @@
+import json
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event, select
+from workout_api.configs import database
+from workout_api.configs.database import get_read_session, get_stream_session, read_options
+from workout_api.configs.replicas import ReplicaSession, ReplicaSet
+from workout_api.core.pagination import encode_cursor
+from workout_api.main import app
 from workout_api.models.categoria_model import CategoriaModel
 from workout_api.models.centro_treinamento_model import CentroTreinamentoModel
 from workout_api.models.atleta_model import AtletaModel
+from workout_api.models.atleta_estatistica_model import AtletaEstatisticaModel
 
 class TestAtletaRouter:
     """Testes de integração para rotas de atleta"""
@@ -85,6 +93,28 @@ class TestAtletaRouter:
         data = response.json()
         assert "Já existe um atleta cadastrado com o cpf: 12345678901" in data["detail"]
     
+    @pytest.mark.asyncio
+    async def test_create_atleta_categoria_not_found(self, client: AsyncClient, setup_data):
+        """Teste: POST /atletas deve retornar 400 para categoria inexistente"""
+        # Arrange
+        atleta_data = {
+            "nome": "João Silva",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 75.5,
+            "altura": 1.75,
+            "sexo": "M",
+            "categoria_id": 999,
+            "centro_treinamento_id": setup_data["centro_id"]
+        }
+        
+        # Act
+        response = await client.post("/atletas/", json=atleta_data)
+        
+        # Assert
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Categoria com id 999 não encontrada"
+    
     @pytest.mark.asyncio
     async def test_create_atleta_invalid_data(self, client: AsyncClient, setup_data):
         """Teste: POST /atletas deve falhar com dados inválidos"""
@@ -318,4 +348,759 @@ class TestAtletaRouter:
         
         # Verificar que atleta foi deletado
         get_response = await client.get(f"/atletas/{atleta_id}")
-        assert get_response.status_code == 404 
\ No newline at end of file
+        assert get_response.status_code == 404 
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_cursor_pagination(self, client: AsyncClient, setup_data):
+        """Teste: GET /atletas?paginacao=cursor deve percorrer as páginas pelo next_cursor"""
+        # Arrange - Criar três atletas
+        for nome, cpf in [("Carlos", "11111111111"), ("Ana", "22222222222"), ("Bruno", "33333333333")]:
+            await client.post("/atletas/", json={
+                "nome": nome,
+                "cpf": cpf,
+                "idade": 25,
+                "peso": 75.5,
+                "altura": 1.75,
+                "sexo": "M",
+                "categoria_id": setup_data["categoria_id"],
+                "centro_treinamento_id": setup_data["centro_id"]
+            })
+        
+        # Act
+        first = await client.get("/atletas/?paginacao=cursor&size=2")
+        second = await client.get(f"/atletas/?size=2&cursor={first.json()['next_cursor']}")
+        
+        # Assert
+        assert first.status_code == 200
+        assert [atleta["nome"] for atleta in first.json()["items"]] == ["Ana", "Bruno"]
+        assert first.json()["total"] is None
+        
+        assert second.status_code == 200
+        assert [atleta["nome"] for atleta in second.json()["items"]] == ["Carlos"]
+        assert second.json()["next_cursor"] is None
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_invalid_cursor(self, client: AsyncClient):
+        """Teste: GET /atletas?cursor=X deve retornar 400 para cursor inválido"""
+        # Act
+        response = await client.get("/atletas/?cursor=invalido")
+        
+        # Assert
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Cursor inválido"
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_forged_cursor(self, client: AsyncClient):
+        """Teste: GET /atletas com cursor de tipos errados deve retornar 400, não 500"""
+        # Arrange - Cursor montado à mão com a quantidade certa de valores
+        cursor = encode_cursor({}, "x")
+        
+        # Act
+        response = await client.get(f"/atletas/?paginacao=cursor&cursor={cursor}")
+        
+        # Assert
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Cursor inválido"
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_contagem_nenhuma(self, client: AsyncClient, setup_data):
+        """Teste: GET /atletas?contagem=nenhuma não deve calcular o total"""
+        # Arrange - Criar atleta
+        atleta_data = {
+            "nome": "João Silva",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 75.5,
+            "altura": 1.75,
+            "sexo": "M",
+            "categoria_id": setup_data["categoria_id"],
+            "centro_treinamento_id": setup_data["centro_id"]
+        }
+        
+        await client.post("/atletas/", json=atleta_data)
+        
+        # Act
+        response = await client.get("/atletas/?contagem=nenhuma")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) == 1
+        assert data["total"] is None
+        assert data["pages"] is None
+        assert data["contagem"] == "nenhuma"
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_contagem_estimada(self, client: AsyncClient, setup_data):
+        """Teste: GET /atletas?contagem=estimada deve informar o modo usado no total"""
+        # Arrange - Criar atleta
+        atleta_data = {
+            "nome": "João Silva",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 75.5,
+            "altura": 1.75,
+            "sexo": "M",
+            "categoria_id": setup_data["categoria_id"],
+            "centro_treinamento_id": setup_data["centro_id"]
+        }
+        
+        await client.post("/atletas/", json=atleta_data)
+        
+        # Act
+        response = await client.get("/atletas/?contagem=estimada&nome=Silva")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["contagem"] == "estimada"
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_contagem_estimada_nome_com_dois_pontos(self, client: AsyncClient, setup_data):
+        """Teste: GET /atletas?contagem=estimada deve aceitar nome com ':' no filtro"""
+        # Arrange - Criar atleta
+        atleta_data = {
+            "nome": "Ana :x",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 75.5,
+            "altura": 1.75,
+            "sexo": "F",
+            "categoria_id": setup_data["categoria_id"],
+            "centro_treinamento_id": setup_data["centro_id"]
+        }
+        
+        await client.post("/atletas/", json=atleta_data)
+        
+        # Act
+        response = await client.get("/atletas/", params={"contagem": "estimada", "nome": "Ana :x"})
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0]["nome"] == "Ana :x"
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_single_select(self, client: AsyncClient, setup_data, query_budget):
+        """Teste: GET /atletas deve trazer a página numa única consulta, com as relações vindas do cache"""
+        # Arrange - Criar atleta
+        atleta_data = {
+            "nome": "João Silva",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 75.5,
+            "altura": 1.75,
+            "sexo": "M",
+            "categoria_id": setup_data["categoria_id"],
+            "centro_treinamento_id": setup_data["centro_id"]
+        }
+        
+        await client.post("/atletas/", json=atleta_data)
+        await client.get("/atletas/?contagem=nenhuma")  # carrega o cache de referência
+        
+        # Act
+        with query_budget(1, "GET /atletas?contagem=nenhuma") as budget:
+            response = await client.get("/atletas/?contagem=nenhuma")
+        
+        # Assert
+        assert response.status_code == 200
+        atleta = response.json()["items"][0]
+        assert atleta["categoria"] == {"nome": "Scale", "pk_id": setup_data["categoria_id"]}
+        assert atleta["centro_treinamento"]["nome"] == "CT King"
+        assert budget.count == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_busca_relevancia(self, client: AsyncClient, setup_data):
+        """Teste: GET /atletas?nome=X&ordenar=relevancia deve usar o índice de busca e ordenar por relevância"""
+        # Arrange - O mais relevante (termo repetido em nome curto) é criado por último, para não
+        # coincidir com a ordem de inserção
+        atletas = [
+            ("Ana Paula Mariana de Souza Oliveira", "11111111111"),
+            ("Pedro Costa", "22222222222"),
+            ("Maria Mariano", "33333333333")
+        ]
+        for nome, cpf in atletas:
+            await client.post("/atletas/", json={
+                "nome": nome,
+                "cpf": cpf,
+                "idade": 25,
+                "peso": 75.5,
+                "altura": 1.75,
+                "sexo": "F",
+                "categoria_id": setup_data["categoria_id"],
+                "centro_treinamento_id": setup_data["centro_id"]
+            })
+        
+        # Act
+        response = await client.get("/atletas/?nome=maria&ordenar=relevancia")
+        
+        # Assert
+        assert response.status_code == 200
+        nomes = [atleta["nome"] for atleta in response.json()["items"]]
+        assert nomes == ["Maria Mariano", "Ana Paula Mariana de Souza Oliveira"]
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_busca_aproximada(self, client: AsyncClient, setup_data):
+        """Teste: GET /atletas?busca=aproximada deve tolerar erros de digitação"""
+        # Arrange - Criar atleta
+        atleta_data = {
+            "nome": "Fernanda Lima",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 60.0,
+            "altura": 1.65,
+            "sexo": "F",
+            "categoria_id": setup_data["categoria_id"],
+            "centro_treinamento_id": setup_data["centro_id"]
+        }
+        
+        await client.post("/atletas/", json=atleta_data)
+        
+        # Act
+        exata = await client.get("/atletas/?nome=fernnda")
+        aproximada = await client.get("/atletas/?nome=fernnda&busca=aproximada")
+        
+        # Assert
+        assert exata.json()["items"] == []
+        assert [atleta["nome"] for atleta in aproximada.json()["items"]] == ["Fernanda Lima"]
+    
+    @pytest.mark.asyncio
+    async def test_get_atleta_by_id_not_modified(self, client: AsyncClient, setup_data):
+        """Teste: GET /atletas/{id} deve retornar 304 enquanto o atleta não mudar"""
+        # Arrange - Criar atleta
+        atleta_data = {
+            "nome": "João Silva",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 75.5,
+            "altura": 1.75,
+            "sexo": "M",
+            "categoria_id": setup_data["categoria_id"],
+            "centro_treinamento_id": setup_data["centro_id"]
+        }
+        
+        create_response = await client.post("/atletas/", json=atleta_data)
+        atleta_id = create_response.json()["pk_id"]
+        etag = (await client.get(f"/atletas/{atleta_id}")).headers["etag"]
+        
+        # Act
+        not_modified = await client.get(f"/atletas/{atleta_id}", headers={"If-None-Match": etag})
+        await client.patch(f"/atletas/{atleta_id}", json={"idade": 26})
+        modified = await client.get(f"/atletas/{atleta_id}", headers={"If-None-Match": etag})
+        
+        # Assert
+        assert not_modified.status_code == 304
+        assert modified.status_code == 200
+        assert modified.headers["etag"] != etag
+        assert modified.json()["idade"] == 26
+    
+    @pytest.mark.asyncio
+    async def test_create_atletas_bulk(self, client: AsyncClient, setup_data):
+        """Teste: POST /atletas/bulk deve criar o lote e reportar conflitos por linha"""
+        # Arrange - Um atleta já cadastrado e um lote com CPF existente, repetido e categoria inválida
+        def atleta(nome, cpf, categoria_id=setup_data["categoria_id"]):
+            return {
+                "nome": nome,
+                "cpf": cpf,
+                "idade": 25,
+                "peso": 75.5,
+                "altura": 1.75,
+                "sexo": "M",
+                "categoria_id": categoria_id,
+                "centro_treinamento_id": setup_data["centro_id"]
+            }
+        
+        await client.post("/atletas/", json=atleta("João Silva", "12345678901"))
+        lote = [
+            atleta("Ana", "11111111111"),
+            atleta("João Santos", "12345678901"),
+            atleta("Bruno", "22222222222"),
+            atleta("Ana Repetida", "11111111111"),
+            atleta("Carlos", "33333333333", categoria_id=999)
+        ]
+        
+        # Act
+        response = await client.post("/atletas/bulk", json=lote)
+        
+        # Assert
+        assert response.status_code == 207
+        data = response.json()
+        assert data["criados"] == 2
+        assert data["rejeitados"] == 3
+        assert [resultado["status"] for resultado in data["resultados"]] == [
+            "criado", "conflito", "criado", "conflito", "invalido"
+        ]
+        assert data["resultados"][0]["atleta"]["categoria"]["nome"] == "Scale"
+        assert "Já existe um atleta cadastrado com o cpf: 12345678901" in data["resultados"][1]["detalhe"]
+        assert "Categoria com id 999 não encontrada" in data["resultados"][4]["detalhe"]
+        
+        listagem = await client.get("/atletas/")
+        assert listagem.json()["total"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_create_atletas_bulk_invalid_row(self, client: AsyncClient, setup_data):
+        """Teste: POST /atletas/bulk deve rejeitar só a linha com dados inválidos, sem 422 no lote"""
+        # Arrange - Lote com uma linha de sexo inválido entre linhas válidas
+        def atleta(nome, cpf, sexo="M"):
+            return {
+                "nome": nome,
+                "cpf": cpf,
+                "idade": 25,
+                "peso": 75.5,
+                "altura": 1.75,
+                "sexo": sexo,
+                "categoria_id": setup_data["categoria_id"],
+                "centro_treinamento_id": setup_data["centro_id"]
+            }
+        
+        lote = [
+            atleta("Ana", "11111111111"),
+            atleta("Bruno", "22222222222", sexo="X"),
+            atleta("Carlos", "33333333333")
+        ]
+        
+        # Act
+        response = await client.post("/atletas/bulk", json=lote)
+        
+        # Assert
+        assert response.status_code == 207
+        data = response.json()
+        assert data["criados"] == 2
+        assert data["rejeitados"] == 1
+        assert [resultado["status"] for resultado in data["resultados"]] == ["criado", "invalido", "criado"]
+        assert "Sexo deve ser M ou F" in data["resultados"][1]["detalhe"]
+        
+        listagem = await client.get("/atletas/")
+        assert listagem.json()["total"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_export_atletas(self, client: AsyncClient, setup_data):
+        """Teste: GET /atletas/export deve exportar os atletas filtrados em NDJSON e CSV"""
+        # Arrange - Criar atletas
+        for nome, cpf in [("João Silva", "11111111111"), ("Maria Santos", "22222222222")]:
+            await client.post("/atletas/", json={
+                "nome": nome,
+                "cpf": cpf,
+                "idade": 25,
+                "peso": 75.5,
+                "altura": 1.75,
+                "sexo": "M",
+                "categoria_id": setup_data["categoria_id"],
+                "centro_treinamento_id": setup_data["centro_id"]
+            })
+        
+        # Act
+        ndjson = await client.get("/atletas/export?format=ndjson")
+        csv = await client.get("/atletas/export?format=csv&nome=Maria")
+        
+        # Assert
+        assert ndjson.status_code == 200
+        assert ndjson.headers["content-type"] == "application/x-ndjson"
+        linhas = [json.loads(linha) for linha in ndjson.text.splitlines()]
+        assert [linha["nome"] for linha in linhas] == ["João Silva", "Maria Santos"]
+        assert linhas[0]["categoria"]["nome"] == "Scale"
+        
+        assert csv.status_code == 200
+        assert csv.headers["content-type"].startswith("text/csv")
+        linhas = csv.text.splitlines()
+        assert linhas[0].startswith("pk_id,nome,cpf")
+        assert len(linhas) == 2
+        assert "Maria Santos,22222222222" in linhas[1]
+        assert linhas[1].endswith("Scale,1,CT King")
+    
+    @pytest.mark.asyncio
+    async def test_export_atletas_read_autocommit(self, client: AsyncClient, setup_data, engine, monkeypatch):
+        """Teste: GET /atletas/export deve manter a transação mesmo com DB_READ_AUTOCOMMIT ligado"""
+        # Arrange - Sessões de leitura reais sobre o banco de teste, com leituras em AUTOCOMMIT
+        await client.post("/atletas/", json={
+            "nome": "João Silva",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 75.5,
+            "altura": 1.75,
+            "sexo": "M",
+            "categoria_id": setup_data["categoria_id"],
+            "centro_treinamento_id": setup_data["centro_id"]
+        })
+        monkeypatch.setattr(database, "engine", engine)
+        monkeypatch.setattr(database, "replicas", ReplicaSet([], retry_after=30))
+        monkeypatch.setattr(database, "READ_OPTIONS", read_options("sqlite", autocommit=True))
+        app.dependency_overrides.pop(get_read_session)
+        app.dependency_overrides.pop(get_stream_session)
+        
+        isolamento = {}
+        def registrar_isolamento(conn, cursor, statement, parameters, context, executemany):
+            rota = "export" if "ORDER BY atletas.pk_id" in statement else "listagem"
+            isolamento.setdefault(rota, conn.get_execution_options().get("isolation_level"))
+        
+        # Act
+        event.listen(engine.sync_engine, "before_cursor_execute", registrar_isolamento)
+        try:
+            listagem = await client.get("/atletas/?limit=1")
+            exportado = await client.get("/atletas/export?format=ndjson")
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", registrar_isolamento)
+        
+        # Assert
+        assert listagem.status_code == 200
+        assert exportado.status_code == 200
+        assert [json.loads(linha)["nome"] for linha in exportado.text.splitlines()] == ["João Silva"]
+        assert isolamento["listagem"] == "AUTOCOMMIT"
+        assert isolamento["export"] is None
+    
+    @pytest.mark.asyncio
+    async def test_import_atletas_csv(self, client: AsyncClient, setup_data):
+        """Teste: POST /atletas/import deve importar o CSV e reportar as linhas rejeitadas"""
+        # Arrange - Um atleta já cadastrado e um CSV com linhas válidas e inválidas
+        await client.post("/atletas/", json={
+            "nome": "João Silva",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 75.5,
+            "altura": 1.75,
+            "sexo": "M",
+            "categoria_id": setup_data["categoria_id"],
+            "centro_treinamento_id": setup_data["centro_id"]
+        })
+        categoria_id, centro_id = setup_data["categoria_id"], setup_data["centro_id"]
+        arquivo = "\n".join([
+            "nome,cpf,idade,peso,altura,sexo,categoria_id,centro_treinamento_id",
+            f"Ana,11111111111,30,60.5,1.65,f,{categoria_id},{centro_id}",
+            f"João Santos,12345678901,25,75.5,1.75,M,{categoria_id},{centro_id}",
+            f"Bruno,1234567890a,25,75.5,1.75,M,{categoria_id},{centro_id}",
+            f"Carla,22222222222,25,75.5,1.75,X,{categoria_id},{centro_id}",
+            f"Ana Repetida,11111111111,30,60.5,1.65,F,{categoria_id},{centro_id}",
+            f"Carlos,33333333333,25,75.5,1.75,M,999,{centro_id}",
+            f"Diego,44444444444,40,80,1.80,M,{categoria_id},{centro_id}",
+        ])
+        
+        # Act
+        response = await client.post(
+            "/atletas/import", files={"arquivo": ("atletas.csv", arquivo.encode(), "text/csv")}
+        )
+        
+        # Assert
+        assert response.status_code == 207
+        data = response.json()
+        assert data["importados"] == 2
+        assert data["rejeitados"] == 5
+        assert data["erros_truncados"] is False
+        assert [erro["linha"] for erro in data["erros"]] == [3, 4, 5, 6, 7]
+        assert "Já existe um atleta cadastrado com o cpf: 12345678901" in data["erros"][0]["detalhe"]
+        assert "CPF deve conter apenas números" in data["erros"][1]["detalhe"]
+        assert "Sexo deve ser M ou F" in data["erros"][2]["detalhe"]
+        assert "repetido no arquivo (linha 2)" in data["erros"][3]["detalhe"]
+        assert "Categoria com id 999 não encontrada" in data["erros"][4]["detalhe"]
+        
+        listagem = await client.get("/atletas/?cpf=11111111111")
+        assert listagem.json()["total"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_import_atletas_csv_missing_columns(self, client: AsyncClient):
+        """Teste: POST /atletas/import deve retornar 400 quando faltam colunas no cabeçalho"""
+        # Act
+        response = await client.post(
+            "/atletas/import", files={"arquivo": ("atletas.csv", b"nome,cpf\nAna,11111111111", "text/csv")}
+        )
+        
+        # Assert
+        assert response.status_code == 400
+        assert "idade" in response.json()["detail"]
+    
+    @pytest.mark.asyncio
+    async def test_import_atletas_csv_invalid_utf8_line(self, client: AsyncClient, setup_data):
+        """Teste: POST /atletas/import deve rejeitar a linha que não é UTF-8 e importar as demais"""
+        # Arrange - Linha 3 em latin-1, entre linhas válidas
+        categoria_id, centro_id = setup_data["categoria_id"], setup_data["centro_id"]
+        arquivo = b"\n".join([
+            b"nome,cpf,idade,peso,altura,sexo,categoria_id,centro_treinamento_id",
+            f"Ana,11111111111,30,60.5,1.65,F,{categoria_id},{centro_id}".encode(),
+            f"Jo\u00e3o,22222222222,25,75.5,1.75,M,{categoria_id},{centro_id}".encode("latin-1"),
+            f"Diego,33333333333,40,80,1.80,M,{categoria_id},{centro_id}".encode(),
+        ])
+        
+        # Act
+        response = await client.post(
+            "/atletas/import", files={"arquivo": ("atletas.csv", arquivo, "text/csv")}
+        )
+        
+        # Assert
+        assert response.status_code == 207
+        data = response.json()
+        assert data["importados"] == 2
+        assert data["rejeitados"] == 1
+        assert data["erros"] == [
+            {"linha": 3, "cpf": None, "detalhe": "Linha com bytes que não são UTF-8"}
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_batch(self, client: AsyncClient, setup_data, query_budget):
+        """Teste: GET /atletas/batch deve buscar os ids em uma consulta, na ordem pedida"""
+        # Arrange - Criar atletas
+        ids = []
+        for nome, cpf in [("João Silva", "11111111111"), ("Maria Santos", "22222222222")]:
+            response = await client.post("/atletas/", json={
+                "nome": nome,
+                "cpf": cpf,
+                "idade": 25,
+                "peso": 75.5,
+                "altura": 1.75,
+                "sexo": "M",
+                "categoria_id": setup_data["categoria_id"],
+                "centro_treinamento_id": setup_data["centro_id"]
+            })
+            ids.append(response.json()["pk_id"])
+        
+        # Act
+        with query_budget(1, "GET /atletas/batch") as budget:
+            response = await client.get(f"/atletas/batch?ids={ids[1]}&ids=999&ids={ids[0]}&ids={ids[1]}")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert [atleta["nome"] for atleta in data["atletas"]] == ["Maria Santos", "João Silva"]
+        assert data["atletas"][0]["categoria"]["nome"] == "Scale"
+        assert data["nao_encontrados"] == [999]
+        assert budget.count == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_atleta_by_id_cached(self, client: AsyncClient, setup_data, query_budget):
+        """Teste: GET /atletas/{id} deve vir do cache e refletir o PATCH logo em seguida"""
+        # Arrange
+        create_response = await client.post("/atletas/", json={
+            "nome": "João Silva",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 75.5,
+            "altura": 1.75,
+            "sexo": "M",
+            "categoria_id": setup_data["categoria_id"],
+            "centro_treinamento_id": setup_data["centro_id"]
+        })
+        atleta_id = create_response.json()["pk_id"]
+        first = await client.get(f"/atletas/{atleta_id}")
+        
+        # Act
+        with query_budget(0, "GET /atletas/{id} em cache"):
+            cached = await client.get(f"/atletas/{atleta_id}")
+        await client.patch(f"/atletas/{atleta_id}", json={"nome": "João Santos"})
+        updated = await client.get(f"/atletas/{atleta_id}")
+        
+        # Assert
+        assert cached.json() == first.json()
+        assert cached.headers["etag"] == first.headers["etag"]
+        assert updated.json()["nome"] == "João Santos"
+        assert updated.headers["etag"] != first.headers["etag"]
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_stats(self, client: AsyncClient, setup_data, db_session):
+        """Teste: GET /atletas/stats deve refletir as escritas e coincidir com o recálculo"""
+        # Arrange - Criar, criar em lote, importar, atualizar e remover atletas
+        def atleta(nome, cpf, idade, peso, altura, sexo):
+            return {
+                "nome": nome,
+                "cpf": cpf,
+                "idade": idade,
+                "peso": peso,
+                "altura": altura,
+                "sexo": sexo,
+                "categoria_id": setup_data["categoria_id"],
+                "centro_treinamento_id": setup_data["centro_id"]
+            }
+        
+        response = await client.post("/atletas/", json=atleta("João", "11111111111", 20, 70.0, 1.70, "M"))
+        joao_id = response.json()["pk_id"]
+        response = await client.post("/atletas/bulk", json=[
+            atleta("Maria", "22222222222", 30, 60.4, 1.62, "F"),
+            atleta("Ana", "33333333333", 40, 55.0, 1.58, "F")
+        ])
+        ana_id = response.json()["resultados"][1]["atleta"]["pk_id"]
+        arquivo = (
+            "nome,cpf,idade,peso,altura,sexo,categoria_id,centro_treinamento_id\n"
+            f"Bruno,44444444444,50,90.6,1.85,M,{setup_data['categoria_id']},{setup_data['centro_id']}\n"
+        )
+        await client.post("/atletas/import", files={"arquivo": ("atletas.csv", arquivo.encode(), "text/csv")})
+        await client.patch(f"/atletas/{joao_id}", json={"idade": 25})
+        await client.delete(f"/atletas/{ana_id}")
+        
+        # Act
+        stats = await client.get("/atletas/stats")
+        recompute = await client.post("/atletas/stats/recompute")
+        
+        # Assert
+        assert stats.status_code == 200
+        data = stats.json()
+        assert data["total"] == 3
+        assert data["por_categoria"] == [{"id": setup_data["categoria_id"], "nome": "Scale", "total": 3}]
+        assert data["por_centro_treinamento"] == [{"id": setup_data["centro_id"], "nome": "CT King", "total": 3}]
+        assert data["por_sexo"] == {"F": 1, "M": 2}
+        assert data["idade"] == {"media": 35.0, "p50": 30.0, "p90": 50.0, "p99": 50.0}
+        assert data["peso"]["media"] == 73.67
+        assert data["peso"]["p50"] == 70.0
+        assert data["altura"]["p90"] == 1.85
+        assert recompute.status_code == 200
+        assert recompute.json() == data
+        
+        # Nenhuma linha de total: todas as escritas atualizaram só as linhas das dimensões
+        dimensoes = await db_session.execute(select(AtletaEstatisticaModel.dimensao).distinct())
+        assert set(dimensoes.scalars()) == {"categoria", "centro_treinamento", "sexo"}
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_stats_empty(self, client: AsyncClient):
+        """Teste: GET /atletas/stats sem atletas deve retornar totais zerados"""
+        # Act
+        response = await client.get("/atletas/stats")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 0
+        assert data["por_sexo"] == {}
+        assert data["idade"] == {"media": None, "p50": None, "p90": None, "p99": None}
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_sparse_fields(self, client: AsyncClient, setup_data, query_budget):
+        """Teste: GET /atletas?fields= deve retornar e selecionar apenas os campos pedidos"""
+        # Arrange
+        await client.post("/atletas/", json={
+            "nome": "João Silva",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 75.5,
+            "altura": 1.75,
+            "sexo": "M",
+            "categoria_id": setup_data["categoria_id"],
+            "centro_treinamento_id": setup_data["centro_id"]
+        })
+        await client.get("/atletas/")
+        
+        # Act
+        with query_budget(1, "GET /atletas?fields=nome") as budget:
+            response = await client.get("/atletas/?fields=nome&contagem=nenhuma")
+        completo = await client.get("/atletas/?contagem=nenhuma")
+        categoria = await client.get("/atletas/?fields=categoria,nome")
+        invalido = await client.get("/atletas/?fields=nome,cpf")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["items"] == [{"nome": "João Silva"}]
+        assert response.headers["etag"] != completo.headers["etag"]
+        assert budget.count == 1
+        assert "categoria_id" not in budget.statements[0]
+        assert categoria.json()["items"] == [{"nome": "João Silva", "categoria": {"nome": "Scale", "pk_id": setup_data["categoria_id"]}}]
+        assert invalido.status_code == 400
+        assert "cpf" in invalido.json()["detail"]
+    
+    @pytest.mark.asyncio
+    async def test_get_atleta_by_id_sparse_fields(self, client: AsyncClient, setup_data):
+        """Teste: GET /atletas/{id}?fields= deve retornar os mesmos campos do banco e do cache"""
+        # Arrange
+        create_response = await client.post("/atletas/", json={
+            "nome": "João Silva",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 75.5,
+            "altura": 1.75,
+            "sexo": "M",
+            "categoria_id": setup_data["categoria_id"],
+            "centro_treinamento_id": setup_data["centro_id"]
+        })
+        atleta_id = create_response.json()["pk_id"]
+        
+        # Act
+        do_banco = await client.get(f"/atletas/{atleta_id}?fields=cpf,nome,categoria")
+        await client.get(f"/atletas/{atleta_id}")
+        do_cache = await client.get(f"/atletas/{atleta_id}?fields=cpf,nome,categoria")
+        nao_modificado = await client.get(
+            f"/atletas/{atleta_id}?fields=cpf,nome,categoria",
+            headers={"If-None-Match": do_banco.headers["etag"]}
+        )
+        
+        # Assert
+        assert do_banco.status_code == 200
+        assert do_banco.json() == {"nome": "João Silva", "cpf": "12345678901", "categoria": {"nome": "Scale", "pk_id": setup_data["categoria_id"]}}
+        assert do_cache.json() == do_banco.json()
+        assert do_cache.headers["etag"] == do_banco.headers["etag"]
+        assert nao_modificado.status_code == 304
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_server_side_filters(self, client: AsyncClient, setup_data, db_session):
+        """Teste: GET /atletas deve filtrar por centro, categoria, sexo, faixa de idade e data de cadastro"""
+        # Arrange
+        outro_centro = CentroTreinamentoModel(nome="CT Queen", endereco="Rua Y, 456", proprietario="Ana")
+        db_session.add(outro_centro)
+        await db_session.commit()
+        
+        atletas = [
+            ("Ana Souza", "11111111111", 22, "F", setup_data["centro_id"]),
+            ("Bruno Lima", "22222222222", 31, "M", setup_data["centro_id"]),
+            ("Carla Dias", "33333333333", 40, "F", outro_centro.pk_id),
+        ]
+        for nome, cpf, idade, sexo, centro_id in atletas:
+            await client.post("/atletas/", json={
+                "nome": nome,
+                "cpf": cpf,
+                "idade": idade,
+                "peso": 70.0,
+                "altura": 1.70,
+                "sexo": sexo,
+                "categoria_id": setup_data["categoria_id"],
+                "centro_treinamento_id": centro_id
+            })
+        
+        # Act
+        por_centro = await client.get(f"/atletas/?centro_treinamento_id={outro_centro.pk_id}")
+        por_sexo_idade = await client.get("/atletas/?sexo=F&idade_min=20&idade_max=30")
+        por_categoria = await client.get(f"/atletas/?categoria_id={setup_data['categoria_id']}&paginacao=cursor&size=2")
+        futuro = await client.get("/atletas/?criado_desde=2999-01-01T00:00:00")
+        exportado = await client.get(f"/atletas/export?centro_treinamento_id={setup_data['centro_id']}&sexo=M")
+        faixa_invalida = await client.get("/atletas/?idade_min=40&idade_max=20")
+        
+        # Assert
+        assert [a["nome"] for a in por_centro.json()["items"]] == ["Carla Dias"]
+        assert [a["nome"] for a in por_sexo_idade.json()["items"]] == ["Ana Souza"]
+        assert [a["nome"] for a in por_categoria.json()["items"]] == ["Ana Souza", "Bruno Lima"]
+        assert por_categoria.json()["next_cursor"] is not None
+        assert futuro.json()["items"] == []
+        assert [json.loads(linha)["nome"] for linha in exportado.text.splitlines()] == ["Bruno Lima"]
+        assert faixa_invalida.status_code == 400
+    
+    @pytest.mark.asyncio
+    async def test_get_atleta_by_id_cached_without_connection(self, client: AsyncClient, setup_data, engine):
+        """Teste: GET /atletas/{id} servido do cache não deve abrir conexão na sessão de leitura"""
+        # Arrange
+        create_response = await client.post("/atletas/", json={
+            "nome": "João Silva",
+            "cpf": "12345678901",
+            "idade": 25,
+            "peso": 75.5,
+            "altura": 1.75,
+            "sexo": "M",
+            "categoria_id": setup_data["categoria_id"],
+            "centro_treinamento_id": setup_data["centro_id"]
+        })
+        atleta_id = create_response.json()["pk_id"]
+        
+        async def get_test_read_session():
+            async with ReplicaSession([engine], ReplicaSet([], retry_after=30), autoflush=False) as session:
+                yield session
+        app.dependency_overrides[get_read_session] = get_test_read_session
+        await client.get(f"/atletas/{atleta_id}")
+        
+        conexoes = []
+        def count_connection(conn):
+            conexoes.append(conn)
+        
+        # Act
+        event.listen(engine.sync_engine, "engine_connect", count_connection)
+        try:
+            response = await client.get(f"/atletas/{atleta_id}")
+        finally:
+            event.remove(engine.sync_engine, "engine_connect", count_connection)
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["nome"] == "João Silva"
+        assert conexoes == [] 
\ No newline at end of file
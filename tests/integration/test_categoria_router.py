@@ -104,4 +104,48 @@ class TestCategoriaRouter:
         # Assert
         assert response.status_code == 404
         data = response.json()
-        assert "Categoria com id 999 não encontrada" in data["detail"] 
\ No newline at end of file
+        assert "Categoria com id 999 não encontrada" in data["detail"] 
+    
+    @pytest.mark.asyncio
+    async def test_get_categorias_not_modified(self, client: AsyncClient, query_budget):
+        """Teste: GET /categorias com If-None-Match válido deve retornar 304 sem consultar o banco"""
+        # Arrange
+        await client.post("/categorias/", json={"nome": "Scale"})
+        first = await client.get("/categorias/")
+        etag = first.headers["etag"]
+        
+        # Act
+        with query_budget(0, "GET /categorias com If-None-Match"):
+            response = await client.get("/categorias/", headers={"If-None-Match": etag})
+        
+        # Assert
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+    
+    @pytest.mark.asyncio
+    async def test_get_categorias_etag_changes_on_create(self, client: AsyncClient):
+        """Teste: o ETag de GET /categorias deve mudar após criar uma categoria"""
+        # Arrange
+        await client.post("/categorias/", json={"nome": "Scale"})
+        etag = (await client.get("/categorias/")).headers["etag"]
+        
+        # Act
+        await client.post("/categorias/", json={"nome": "RX"})
+        response = await client.get("/categorias/", headers={"If-None-Match": etag})
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert len(response.json()) == 2
+    
+    @pytest.mark.asyncio
+    async def test_create_categoria_read_your_writes(self, client: AsyncClient):
+        """Teste: sem réplicas configuradas, a escrita não deve marcar o cliente para ler do primário"""
+        # Act
+        post_response = await client.post("/categorias/", json={"nome": "Scale"})
+        
+        # Assert
+        assert post_response.status_code == 201
+        assert "x-read-primary-until" not in post_response.headers
+        assert "set-cookie" not in post_response.headers 
\ No newline at end of file
@@ -0,0 +1,29 @@
+import pytest
+from httpx import AsyncClient
+from workout_api.core.metrics import metrics
+
+class TestMetricsRouter:
+    """Testes de integração para o endpoint de métricas"""
+    
+    @pytest.mark.asyncio
+    async def test_get_metrics(self, client: AsyncClient):
+        """Teste: GET /metrics deve expor latência, status e consultas por template de rota"""
+        # Arrange
+        metrics.clear()
+        await client.post("/categorias/", json={"nome": "Scale"})
+        await client.get("/atletas/999")
+        await client.get("/nao-existe")
+        
+        # Act
+        response = await client.get("/metrics")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        text = response.text
+        assert 'http_requests_total{method="POST",route="/categorias/",status="201"} 1' in text
+        assert 'http_requests_total{method="GET",route="/atletas/{id}",status="404"} 1' in text
+        assert 'http_requests_total{method="GET",route="<unmatched>",status="404"} 1' in text
+        assert 'http_request_db_queries_bucket{method="GET",route="/atletas/{id}",le="0"} 0' in text
+        assert 'http_requests_in_flight{method="GET"} 1' in text
+        assert metrics.queries_total > 0 
\ No newline at end of file
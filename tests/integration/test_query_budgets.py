@@ -0,0 +1,106 @@
+import pytest
+from httpx import AsyncClient
+from workout_api.core.query_budget import QueryBudgetExceeded
+
+class TestQueryBudgets:
+    """Testes de integração do número de consultas por rota"""
+    
+    @pytest.fixture
+    async def atletas(self, client: AsyncClient):
+        """Fixture para cadastrar atletas em categorias e centros diferentes e aquecer os caches"""
+        ids = []
+        for i in range(3):
+            categoria = await client.post("/categorias/", json={"nome": f"Categoria {i}"})
+            centro = await client.post("/centros_treinamento/", json={
+                "nome": f"CT {i}",
+                "endereco": f"Rua {i}",
+                "proprietario": "Marcos"
+            })
+            atleta = await client.post("/atletas/", json={
+                "nome": f"Atleta {i}",
+                "cpf": f"1234567890{i}",
+                "idade": 20 + i,
+                "peso": 70.0,
+                "altura": 1.70,
+                "sexo": "M",
+                "categoria_id": categoria.json()["pk_id"],
+                "centro_treinamento_id": centro.json()["pk_id"]
+            })
+            ids.append(atleta.json()["pk_id"])
+        
+        await client.get("/categorias/")
+        await client.get("/centros_treinamento/")
+        return ids
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_budget(self, client: AsyncClient, atletas, query_budget):
+        """Teste: GET /atletas deve rodar no máximo 2 consultas (total e página), sem N+1 nas relações"""
+        # Act
+        with query_budget(2, "GET /atletas"):
+            response = await client.get("/atletas/")
+        
+        # Assert
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 3
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_cursor_budget(self, client: AsyncClient, atletas, query_budget):
+        """Teste: GET /atletas com cursor e sem contagem deve rodar uma única consulta"""
+        # Act
+        with query_budget(1, "GET /atletas?paginacao=cursor"):
+            response = await client.get("/atletas/?paginacao=cursor&size=2")
+        
+        # Assert
+        assert response.status_code == 200
+    
+    @pytest.mark.asyncio
+    async def test_get_atleta_by_id_budget(self, client: AsyncClient, atletas, query_budget):
+        """Teste: GET /atletas/{id} deve rodar no máximo 1 consulta e nenhuma quando estiver em cache"""
+        # Act
+        with query_budget(1, "GET /atletas/{id}"):
+            response = await client.get(f"/atletas/{atletas[0]}")
+        with query_budget(0, "GET /atletas/{id} em cache"):
+            await client.get(f"/atletas/{atletas[0]}")
+        
+        # Assert
+        assert response.status_code == 200
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_batch_budget(self, client: AsyncClient, atletas, query_budget):
+        """Teste: GET /atletas/batch deve rodar 1 consulta para qualquer quantidade de ids"""
+        # Act
+        with query_budget(1, "GET /atletas/batch"):
+            response = await client.get("/atletas/batch", params={"ids": atletas})
+        
+        # Assert
+        assert len(response.json()["atletas"]) == 3
+    
+    @pytest.mark.asyncio
+    async def test_get_atletas_stats_budget(self, client: AsyncClient, atletas, query_budget):
+        """Teste: GET /atletas/stats deve rodar no máximo 2 consultas"""
+        # Act
+        with query_budget(2, "GET /atletas/stats"):
+            response = await client.get("/atletas/stats")
+        
+        # Assert
+        assert response.status_code == 200
+    
+    @pytest.mark.asyncio
+    async def test_get_referencias_budget(self, client: AsyncClient, atletas, query_budget):
+        """Teste: categorias e centros devem ser servidos do cache de referência, sem consultas"""
+        # Act
+        with query_budget(0, "GET de categorias e centros"):
+            await client.get("/categorias/")
+            await client.get("/centros_treinamento/")
+            response = await client.get("/categorias/1")
+        
+        # Assert
+        assert response.status_code == 200
+    
+    @pytest.mark.asyncio
+    async def test_budget_exceeded(self, client: AsyncClient, atletas, query_budget):
+        """Teste: passar do orçamento deve falhar listando as consultas executadas"""
+        # Act / Assert
+        with pytest.raises(QueryBudgetExceeded, match="GET /atletas: 2 consultas para um orçamento de 1"):
+            with query_budget(1, "GET /atletas"):
+                await client.get("/atletas/")
@@ -0,0 +1,360 @@
+import json
+import os
+import re
+import pytest
+from datetime import datetime
+from httpx import AsyncClient
+from sqlalchemy import event, insert, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from workout_api.configs.database import BaseModel, get_read_session, get_session, get_stream_session
+from workout_api.controllers.atleta_controller import AtletaController
+from workout_api.main import app
+from workout_api.models.atleta_model import AtletaModel
+from workout_api.models.categoria_model import CategoriaModel
+from workout_api.models.centro_treinamento_model import CentroTreinamentoModel
+
+# Postgres descartável para rodar os mesmos testes com o planejador real (ex.: CI com serviço postgres)
+PLAN_TEST_DB_URL = os.getenv("PLAN_TEST_DB_URL")
+
+TOTAL_CATEGORIAS = 20
+TOTAL_CENTROS = 40
+TOTAL_ATLETAS = 5000
+NOMES = ["Ana", "Bruno", "Carla", "Diego", "Eva", "Felipe", "Gabriela", "Heitor", "Isabela", "João"]
+SOBRENOMES = ["Silva", "Souza", "Oliveira", "Santos", "Lima", "Pereira", "Costa", "Rodrigues", "Almeida", "Nascimento"]
+SQLITE_NODE = re.compile(
+    r"^(SCAN|SEARCH) (\w+)(?: USING (?:COVERING )?INDEX (\w+)| USING (INTEGER PRIMARY KEY)| (VIRTUAL TABLE) INDEX)?"
+)
+# Termo presente em um único nome da carga (índice 4321): a busca é seletiva o bastante para usar índice
+NOME_BUSCA = "Oliveira 4321"
+
+class TestAtletaIndexes:
+    """Testes de integração do uso dos índices de atletas pelo planejador"""
+    
+    async def _plano(self, db_session, **filtros) -> str:
+        statement = AtletaController._filtrar(
+            AtletaController._listagem_statement(), dialect='sqlite', **filtros
+        ).order_by(AtletaModel.nome, AtletaModel.pk_id).limit(50)
+        sql = statement.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
+        
+        await db_session.execute(text("ANALYZE"))
+        result = await db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+        return "\n".join(row.detail for row in result)
+    
+    @pytest.mark.asyncio
+    async def test_filtro_centro_usa_indice_composto(self, db_session):
+        """Teste: filtro por centro de treinamento deve usar ix_atletas_centro_nome_pk_id sem ordenar em memória"""
+        # Act
+        plano = await self._plano(db_session, centro_treinamento_id=1)
+        
+        # Assert
+        assert "ix_atletas_centro_nome_pk_id" in plano
+        assert "TEMP B-TREE" not in plano
+    
+    @pytest.mark.asyncio
+    async def test_filtro_categoria_usa_indice_composto(self, db_session):
+        """Teste: filtro por categoria deve usar ix_atletas_categoria_nome_pk_id sem ordenar em memória"""
+        # Act
+        plano = await self._plano(db_session, categoria_id=1)
+        
+        # Assert
+        assert "ix_atletas_categoria_nome_pk_id" in plano
+        assert "TEMP B-TREE" not in plano
+    
+    @pytest.mark.asyncio
+    async def test_filtro_sexo_idade_usa_indice(self, db_session):
+        """Teste: filtro por sexo e faixa de idade deve usar ix_atletas_sexo_idade"""
+        # Act
+        plano = await self._plano(db_session, sexo='F', idade_min=20, idade_max=30)
+        
+        # Assert
+        assert "ix_atletas_sexo_idade" in plano
+    
+    @pytest.mark.asyncio
+    async def test_filtro_data_cadastro_usa_indice(self, db_session):
+        """Teste: filtro por data de cadastro deve usar ix_atletas_created_at"""
+        # Act
+        plano = await self._plano(db_session, criado_desde=datetime(2024, 1, 1), criado_ate=datetime(2024, 12, 31))
+        
+        # Assert
+        assert "ix_atletas_created_at" in plano
+
+
+class Plan:
+    """Plano normalizado: nós com tipo (seq, index ou sort), tabela, índice e linhas estimadas."""
+    
+    def __init__(self, nodes: list[dict]):
+        self.nodes = nodes
+    
+    @classmethod
+    def from_sqlite(cls, rows) -> "Plan":
+        nodes = []
+        for row in rows:
+            match = SQLITE_NODE.match(row.detail)
+            if match:
+                kind, tabela, indice, primaria, virtual = match.groups()
+                # Tabela virtual (FTS5) é o próprio índice de busca
+                indice = indice or primaria or (tabela if virtual else None)
+                tipo = "seq" if kind == "SCAN" and not indice else "index"
+                nodes.append({"tipo": tipo, "tabela": tabela, "indice": indice, "linhas": None})
+            elif "TEMP B-TREE" in row.detail:
+                nodes.append({"tipo": "sort", "tabela": None, "indice": None, "linhas": None})
+        return cls(nodes)
+    
+    @classmethod
+    def from_postgres(cls, plan: dict) -> "Plan":
+        nodes = []
+        pendentes = [plan]
+        while pendentes:
+            node = pendentes.pop(0)
+            tipo = node["Node Type"]
+            if tipo == "Seq Scan":
+                tipo = "seq"
+            elif "Index" in tipo:
+                tipo = "index"
+            elif "Sort" in tipo:
+                tipo = "sort"
+            nodes.append({
+                "tipo": tipo,
+                "tabela": node.get("Relation Name"),
+                "indice": node.get("Index Name"),
+                "linhas": node.get("Plan Rows")
+            })
+            pendentes.extend(node.get("Plans", []))
+        return cls(nodes)
+    
+    @property
+    def seq_scans(self) -> set:
+        return {node["tabela"] for node in self.nodes if node["tipo"] == "seq"}
+    
+    @property
+    def indexes(self) -> set:
+        return {node["indice"] for node in self.nodes if node["indice"]}
+    
+    @property
+    def sorts(self) -> bool:
+        return any(node["tipo"] == "sort" for node in self.nodes)
+    
+    def table_rows(self, tabela: str):
+        """Linhas estimadas na leitura da tabela (só no Postgres)."""
+        return next((node["linhas"] for node in self.nodes if node["tabela"] == tabela), None)
+    
+    @property
+    def estimated_rows(self):
+        # Só o Postgres estima linhas; no SQLite fica None
+        return self.nodes[0]["linhas"] if self.nodes else None
+
+
+@pytest.fixture(scope="module", params=["sqlite", "postgresql"])
+async def plan_engine(request):
+    """Fixture para banco com volume realista (20 categorias, 40 centros, 5000 atletas) e estatísticas coletadas"""
+    if request.param == "postgresql" and not PLAN_TEST_DB_URL:
+        pytest.skip("PLAN_TEST_DB_URL não configurado")
+    engine = create_async_engine(PLAN_TEST_DB_URL if request.param == "postgresql" else "sqlite+aiosqlite:///:memory:")
+    
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.drop_all)
+        await conn.run_sync(BaseModel.metadata.create_all)
+        await conn.execute(insert(CategoriaModel), [{"nome": f"Categoria {i}"} for i in range(TOTAL_CATEGORIAS)])
+        await conn.execute(insert(CentroTreinamentoModel), [
+            {"nome": f"CT {i}", "endereco": f"Rua {i}", "proprietario": f"Dono {i}"} for i in range(TOTAL_CENTROS)
+        ])
+        await conn.execute(insert(AtletaModel), [
+            {
+                "nome": f"{NOMES[i % len(NOMES)]} {SOBRENOMES[i // len(NOMES) % len(SOBRENOMES)]} {i}",
+                "cpf": f"{i:011d}",
+                "idade": 18 + i % 40,
+                "peso": 60.0 + i % 40,
+                "altura": 1.50 + (i % 50) / 100,
+                "sexo": "MF"[i % 2],
+                "categoria_id": 1 + i % TOTAL_CATEGORIAS,
+                "centro_treinamento_id": 1 + i % TOTAL_CENTROS,
+                "created_at": datetime(2024, 1, 1 + i % 28),
+                "updated_at": datetime(2024, 1, 1 + i % 28)
+            }
+            for i in range(TOTAL_ATLETAS)
+        ])
+        await conn.execute(text("ANALYZE"))
+    
+    yield engine
+    
+    if request.param == "postgresql":
+        async with engine.begin() as conn:
+            await conn.run_sync(BaseModel.metadata.drop_all)
+    await engine.dispose()
+
+
+class TestControllerPlans:
+    """Testes de regressão dos planos das consultas que os controllers executam"""
+    
+    @pytest.fixture
+    async def plan_client(self, plan_engine):
+        """Fixture para cliente HTTP com as rotas apontando para o banco populado"""
+        async def get_plan_session():
+            async with AsyncSession(plan_engine, expire_on_commit=False) as session:
+                yield session
+        
+        app.dependency_overrides[get_session] = get_plan_session
+        app.dependency_overrides[get_read_session] = get_plan_session
+        app.dependency_overrides[get_stream_session] = get_plan_session
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            yield ac
+        app.dependency_overrides.clear()
+    
+    async def _planos(self, engine, client: AsyncClient, url: str, tabela: str = "atletas") -> list[Plan]:
+        """Executa a rota, captura os comandos que leem a tabela e devolve o plano de cada um"""
+        comandos = []
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if re.search(rf"\bFROM {tabela}\b", statement) and not statement.startswith("EXPLAIN"):
+                comandos.append((statement, parameters))
+        
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            response = await client.get(url)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", capture)
+        assert response.status_code == 200, response.text
+        assert comandos, f"{url} não consultou {tabela}"
+        
+        planos = []
+        async with engine.connect() as conn:
+            for statement, parameters in comandos:
+                if engine.dialect.name == "postgresql":
+                    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                    plano = result.scalar_one()
+                    plano = json.loads(plano) if isinstance(plano, str) else plano
+                    planos.append(Plan.from_postgres(plano[0]["Plan"]))
+                else:
+                    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                    planos.append(Plan.from_sqlite(result))
+        return planos
+    
+    @pytest.mark.asyncio
+    async def test_listagem_cursor(self, plan_engine, plan_client):
+        """Teste: páginas por cursor devem percorrer ix_atletas_nome_pk_id sem ordenar nem varrer atletas"""
+        # Arrange
+        primeira = await plan_client.get("/atletas/?paginacao=cursor&contagem=nenhuma&size=20")
+        cursor = primeira.json()["next_cursor"]
+        
+        # Act
+        planos = await self._planos(plan_engine, plan_client, f"/atletas/?paginacao=cursor&contagem=nenhuma&size=20&cursor={cursor}")
+        
+        # Assert
+        assert len(planos) == 1
+        assert "ix_atletas_nome_pk_id" in planos[0].indexes
+        assert "atletas" not in planos[0].seq_scans
+        assert not planos[0].sorts
+        if planos[0].estimated_rows is not None:
+            assert planos[0].estimated_rows <= 21
+    
+    @pytest.mark.asyncio
+    async def test_listagem_offset_com_contagem(self, plan_engine, plan_client):
+        """Teste: listagem padrão (offset + COUNT) deve contar pelas estatísticas certas e paginar sem ordenar"""
+        # Act
+        planos = await self._planos(plan_engine, plan_client, "/atletas/?page=3&size=20")
+        
+        # Assert - COUNT primeiro, depois a página
+        assert len(planos) == 2
+        contagem, pagina = planos
+        assert not contagem.sorts
+        assert not pagina.sorts
+        if plan_engine.dialect.name == "sqlite":
+            # COUNT atendido por um índice coberto, sem ler as linhas da tabela
+            assert "atletas" not in contagem.seq_scans
+        if contagem.table_rows("atletas") is not None:
+            # Estatísticas do ANALYZE em dia: é delas que sai contagem=estimada
+            assert abs(contagem.table_rows("atletas") - TOTAL_ATLETAS) <= TOTAL_ATLETAS * 0.1
+        if pagina.estimated_rows is not None:
+            assert pagina.estimated_rows <= 20
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("busca", ["contem", "aproximada"])
+    async def test_busca_por_nome(self, plan_engine, plan_client, busca):
+        """Teste: busca por nome deve usar o índice de trigramas (pg_trgm ou FTS5), sem varrer atletas"""
+        # Act
+        planos = await self._planos(plan_engine, plan_client, f"/atletas/?nome={NOME_BUSCA}&busca={busca}")
+        
+        # Assert - COUNT e página
+        indice = "ix_atletas_nome_trgm" if plan_engine.dialect.name == "postgresql" else "atletas_fts"
+        assert len(planos) == 2
+        for plano in planos:
+            assert indice in plano.indexes
+            assert "atletas" not in plano.seq_scans
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("filtro,indice", [
+        ("centro_treinamento_id=7", "ix_atletas_centro_nome_pk_id"),
+        ("categoria_id=3", "ix_atletas_categoria_nome_pk_id"),
+    ])
+    async def test_listagem_filtrada(self, plan_engine, plan_client, filtro, indice):
+        """Teste: listagem filtrada por centro ou categoria deve usar o índice composto do filtro"""
+        # Act
+        planos = await self._planos(plan_engine, plan_client, f"/atletas/?{filtro}&paginacao=cursor&contagem=nenhuma")
+        
+        # Assert
+        assert indice in planos[0].indexes
+        assert "atletas" not in planos[0].seq_scans
+        assert not planos[0].sorts
+    
+    @pytest.mark.asyncio
+    async def test_listagem_cpf(self, plan_engine, plan_client):
+        """Teste: total e página filtrados por CPF devem buscar pelo índice único, sem varrer atletas"""
+        # Act
+        planos = await self._planos(plan_engine, plan_client, "/atletas/?cpf=00000001234")
+        
+        # Assert
+        assert len(planos) == 2
+        for plano in planos:
+            assert "atletas" not in plano.seq_scans
+            assert plano.indexes
+            if plano.estimated_rows is not None:
+                assert plano.estimated_rows <= 1
+    
+    @pytest.mark.asyncio
+    async def test_get_by_id(self, plan_engine, plan_client):
+        """Teste: GET /atletas/{id} deve buscar pela chave primária estimando uma linha"""
+        # Act
+        planos = await self._planos(plan_engine, plan_client, "/atletas/1234")
+        
+        # Assert
+        assert len(planos) == 1
+        assert "atletas" not in planos[0].seq_scans
+        assert planos[0].indexes & {"INTEGER PRIMARY KEY", "atletas_pkey"}
+        if planos[0].estimated_rows is not None:
+            assert planos[0].estimated_rows <= 1
+    
+    @pytest.mark.asyncio
+    async def test_get_batch(self, plan_engine, plan_client):
+        """Teste: GET /atletas/batch deve buscar todos os ids pela chave primária em uma consulta"""
+        # Act
+        planos = await self._planos(plan_engine, plan_client, "/atletas/batch?ids=10&ids=2000&ids=4999")
+        
+        # Assert
+        assert len(planos) == 1
+        assert "atletas" not in planos[0].seq_scans
+        assert planos[0].indexes & {"INTEGER PRIMARY KEY", "atletas_pkey"}
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("rota,tabela,modelo", [
+        ("/categorias", "categorias", CategoriaModel),
+        ("/centros_treinamento", "centros_treinamento", CentroTreinamentoModel),
+    ])
+    async def test_lookup_referencia(self, plan_engine, plan_client, rota, tabela, modelo):
+        """Teste: id ausente do cache de referência deve ser buscado pela chave primária"""
+        # Arrange
+        await plan_client.get(f"{rota}/1")
+        valores = {"nome": "Nova"} if modelo is CategoriaModel else {"nome": "Novo CT", "endereco": "Rua", "proprietario": "Dono"}
+        async with plan_engine.begin() as conn:
+            pk_id = (await conn.execute(insert(modelo).values(**valores).returning(modelo.pk_id))).scalar_one()
+        
+        # Act
+        try:
+            planos = await self._planos(plan_engine, plan_client, f"{rota}/{pk_id}", tabela=tabela)
+        finally:
+            async with plan_engine.begin() as conn:
+                await conn.execute(modelo.__table__.delete().where(modelo.pk_id == pk_id))
+        
+        # Assert
+        assert len(planos) == 1
+        assert planos[0].indexes & {"INTEGER PRIMARY KEY", f"{tabela}_pkey"}
+        assert tabela not in planos[0].seq_scans 
\ No newline at end of file
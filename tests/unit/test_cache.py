@@ -0,0 +1,288 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from fakeredis import FakeAsyncRedis, FakeServer
+from workout_api.core.cache_backends import MemoryCacheBackend, RedisBroadcast, RedisCacheBackend
+from workout_api.core.entity_cache import EntityCache
+from workout_api.core.reference_cache import ReferenceTable, reference_cache
+from workout_api.models.categoria_model import CategoriaModel
+from workout_api.schemas.categoria_schema import CategoriaOut
+
+class TestReferenceTable:
+    """Testes para o cache de dados de referência"""
+    
+    @pytest.mark.asyncio
+    async def test_load_and_version(self, db_session):
+        """Teste: ReferenceTable deve carregar a tabela e versionar cada carga"""
+        # Arrange
+        db_session.add(CategoriaModel(nome="Scale"))
+        await db_session.commit()
+        cache = ReferenceTable(CategoriaModel, CategoriaOut)
+        
+        # Act
+        categorias = await cache.get_all(db_session)
+        
+        # Assert
+        assert [categoria.nome for categoria in categorias] == ["Scale"]
+        assert cache.loaded
+        assert cache.version == 1
+    
+    @pytest.mark.asyncio
+    async def test_invalidate(self, db_session):
+        """Teste: invalidate deve descartar a cópia e a próxima leitura recarregar"""
+        # Arrange
+        cache = ReferenceTable(CategoriaModel, CategoriaOut)
+        await cache.get_all(db_session)
+        db_session.add(CategoriaModel(nome="RX"))
+        await db_session.commit()
+        
+        # Act
+        cache.invalidate()
+        categorias = await cache.get_all(db_session)
+        
+        # Assert
+        assert [categoria.nome for categoria in categorias] == ["RX"]
+        assert cache.version == 3
+    
+    @pytest.mark.asyncio
+    async def test_get_miss_fetches_row(self, db_session):
+        """Teste: get deve buscar no banco uma linha criada depois da carga"""
+        # Arrange
+        cache = ReferenceTable(CategoriaModel, CategoriaOut)
+        await cache.get_all(db_session)
+        categoria = CategoriaModel(nome="Scale")
+        db_session.add(categoria)
+        await db_session.commit()
+        
+        # Act
+        result = await cache.get(db_session, categoria.pk_id)
+        missing = await cache.get(db_session, 999)
+        
+        # Assert
+        assert result.nome == "Scale"
+        assert missing is None
+    
+    @pytest.mark.asyncio
+    async def test_get_miss_changes_etag(self, db_session):
+        """Teste: linha buscada num miss entra na listagem e muda o ETag da tabela"""
+        # Arrange
+        cache = ReferenceTable(CategoriaModel, CategoriaOut)
+        etag = await cache.get_etag(db_session)
+        categoria = CategoriaModel(nome="Scale")
+        db_session.add(categoria)
+        await db_session.commit()
+        
+        # Act
+        await cache.get(db_session, categoria.pk_id)
+        
+        # Assert
+        assert await cache.get_etag(db_session) != etag
+        assert [item.nome for item in await cache.get_all(db_session)] == ["Scale"]
+
+class TestMemoryCacheBackend:
+    """Testes para o LRU em memória"""
+    
+    @pytest.mark.asyncio
+    async def test_ttl_expires(self):
+        """Teste: entradas expiradas devem virar cache miss"""
+        # Arrange
+        cache = MemoryCacheBackend(ttl=60, max_bytes=1024)
+        with patch("workout_api.core.cache_backends.time.monotonic", return_value=100.0):
+            await cache.set("atletas:1", b"valor")
+        
+        # Act
+        with patch("workout_api.core.cache_backends.time.monotonic", return_value=159.0):
+            hit = await cache.get("atletas:1")
+        with patch("workout_api.core.cache_backends.time.monotonic", return_value=161.0):
+            miss = await cache.get("atletas:1")
+        
+        # Assert
+        assert hit == b"valor"
+        assert miss is None
+        assert cache.size == 0
+    
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_by_size(self):
+        """Teste: ao passar do limite em bytes, a entrada menos usada deve ser descartada"""
+        # Arrange
+        cache = MemoryCacheBackend(ttl=60, max_bytes=10)
+        await cache.set("a", b"1234")
+        await cache.set("b", b"1234")
+        await cache.get("a")
+        
+        # Act
+        await cache.set("c", b"1234")
+        
+        # Assert
+        assert await cache.get("b") is None
+        assert await cache.get("a") == b"1234"
+        assert await cache.get("c") == b"1234"
+        assert cache.size == 8
+
+class TestRedisCacheBackend:
+    """Testes para o cache compartilhado no Redis"""
+    
+    @pytest.mark.asyncio
+    async def test_set_get_delete(self):
+        """Teste: RedisCacheBackend deve gravar com TTL, ler e remover chaves"""
+        # Arrange
+        client = FakeAsyncRedis(server=FakeServer())
+        cache = RedisCacheBackend(client, ttl=60)
+        
+        # Act
+        await cache.set("atletas:1", b"valor")
+        hit = await cache.get("atletas:1")
+        ttl = await client.ttl("workout:atletas:1")
+        await cache.delete("atletas:1")
+        
+        # Assert
+        assert hit == b"valor"
+        assert 0 < ttl <= 60
+        assert await cache.get("atletas:1") is None
+    
+    @pytest.mark.asyncio
+    async def test_redis_down_is_cache_miss(self):
+        """Teste: RedisCacheBackend fora do ar não deve propagar erro em nenhuma operação"""
+        # Arrange
+        server = FakeServer()
+        server.connected = False
+        cache = RedisCacheBackend(FakeAsyncRedis(server=server), ttl=60)
+        
+        # Act
+        await cache.set("atletas:1", b"valor")
+        await cache.delete("atletas:1")
+        await cache.clear()
+        
+        # Assert
+        assert await cache.get("atletas:1") is None
+
+class TestEntityCache:
+    """Testes para o cache de entidades com invalidação entre workers"""
+    
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        """Teste: EntityCache deve devolver o ETag e a entidade gravados"""
+        # Arrange
+        cache = EntityCache(MemoryCacheBackend(ttl=60, max_bytes=1024))
+        
+        # Act
+        await cache.set("categorias", 1, CategoriaOut(pk_id=1, nome="Scale"), '"abc"')
+        etag, categoria = await cache.get("categorias", 1, CategoriaOut)
+        
+        # Assert
+        assert etag == '"abc"'
+        assert categoria == CategoriaOut(pk_id=1, nome="Scale")
+    
+    @pytest.mark.asyncio
+    async def test_set_skipped_after_concurrent_invalidation(self):
+        """Teste: set com geração lida antes de uma invalidação não deve gravar o valor velho"""
+        # Arrange - Leitor captura a geração; uma escrita concorrente invalida a chave
+        cache = EntityCache(MemoryCacheBackend(ttl=60, max_bytes=1024))
+        generation = cache.generation("atletas", 1)
+        await cache.invalidate("atletas", 1)
+        
+        # Act
+        await cache.set("atletas", 1, CategoriaOut(pk_id=1, nome="Velho"), '"old"', generation)
+        
+        # Assert
+        assert await cache.get("atletas", 1, CategoriaOut) is None
+        await cache.set("atletas", 1, CategoriaOut(pk_id=1, nome="Novo"), '"new"', cache.generation("atletas", 1))
+        assert await cache.get("atletas", 1, CategoriaOut) == ('"new"', CategoriaOut(pk_id=1, nome="Novo"))
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_reference_table(self, db_session):
+        """Teste: invalidar o namespace de uma tabela de referência deve descartar sua cópia"""
+        # Arrange
+        cache = EntityCache(MemoryCacheBackend(ttl=60, max_bytes=1024))
+        await reference_cache.categorias.load(db_session)
+        
+        # Act
+        await cache.invalidate("categorias")
+        
+        # Assert
+        assert not reference_cache.categorias.loaded
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_invalidates_other_workers(self):
+        """Teste: invalidate deve remover a chave do LRU local dos outros workers"""
+        # Arrange - Dois workers com LRU próprio e o mesmo servidor Redis
+        server = FakeServer()
+        workers = [
+            EntityCache(MemoryCacheBackend(ttl=60, max_bytes=1024), RedisBroadcast(FakeAsyncRedis(server=server)))
+            for _ in range(2)
+        ]
+        for worker in workers:
+            await worker.start()
+            await worker.set("categorias", 1, CategoriaOut(pk_id=1, nome="Scale"), '"abc"')
+        
+        # Act
+        await workers[0].invalidate("categorias", 1)
+        for _ in range(100):
+            if await workers[1].get("categorias", 1, CategoriaOut) is None:
+                break
+            await asyncio.sleep(0.01)
+        
+        # Assert
+        try:
+            assert await workers[0].get("categorias", 1, CategoriaOut) is None
+            assert await workers[1].get("categorias", 1, CategoriaOut) is None
+        finally:
+            for worker in workers:
+                await worker.stop()
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_starts_with_redis_down(self):
+        """Teste: Redis fora do ar na inicialização não deve falhar; ao voltar, o LRU local é descartado"""
+        # Arrange
+        server = FakeServer()
+        server.connected = False
+        worker = EntityCache(MemoryCacheBackend(ttl=60, max_bytes=1024), RedisBroadcast(FakeAsyncRedis(server=server)))
+        
+        with patch("workout_api.core.cache_backends.RECONNECT_MIN_DELAY", 0.01):
+            # Act
+            await worker.start()
+            await worker.set("categorias", 1, CategoriaOut(pk_id=1, nome="Scale"), '"abc"')
+            server.connected = True
+            for _ in range(100):
+                if await worker.get("categorias", 1, CategoriaOut) is None:
+                    break
+                await asyncio.sleep(0.01)
+            
+            # Assert
+            try:
+                assert await worker.get("categorias", 1, CategoriaOut) is None
+            finally:
+                await worker.stop()
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_resubscribes_after_connection_loss(self):
+        """Teste: queda do Redis durante a escuta deve reassinar o canal e descartar o LRU local"""
+        # Arrange
+        server = FakeServer()
+        workers = [
+            EntityCache(MemoryCacheBackend(ttl=60, max_bytes=1024), RedisBroadcast(FakeAsyncRedis(server=server)))
+            for _ in range(2)
+        ]
+        
+        with patch("workout_api.core.cache_backends.RECONNECT_MIN_DELAY", 0.01):
+            for worker in workers:
+                await worker.start()
+            
+            # Act - Redis cai e volta; o listener precisa voltar a receber invalidações
+            server.connected = False
+            await asyncio.sleep(0.05)
+            server.connected = True
+            await asyncio.sleep(0.1)
+            await workers[1].set("categorias", 1, CategoriaOut(pk_id=1, nome="Scale"), '"abc"')
+            await workers[0].invalidate("categorias", 1)
+            for _ in range(100):
+                if await workers[1].get("categorias", 1, CategoriaOut) is None:
+                    break
+                await asyncio.sleep(0.01)
+            
+            # Assert
+            try:
+                assert await workers[1].get("categorias", 1, CategoriaOut) is None
+            finally:
+                for worker in workers:
+                    await worker.stop()
@@ -1,12 +1,14 @@
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError
 from workout_api.controllers.atleta_controller import AtletaController
+from workout_api.controllers.atleta_stats_controller import AtletaStatsController
 from workout_api.controllers.categoria_controller import CategoriaController
 from workout_api.controllers.centro_treinamento_controller import CentroTreinamentoController
+from workout_api.core.reference_cache import reference_cache
 from workout_api.schemas.atleta_schema import AtletaIn, AtletaUpdate
-from workout_api.schemas.categoria_schema import CategoriaIn
+from workout_api.schemas.categoria_schema import CategoriaIn, CategoriaOut
 from workout_api.schemas.centro_treinamento_schema import CentroTreinamentoIn
 from tests.factories import AtletaFactory, CategoriaFactory, CentroTreinamentoFactory
 
@@ -15,9 +17,17 @@ class TestAtletaController:
     
     @pytest.mark.asyncio
     async def test_create_atleta_success(self):
-        """Teste: Criar atleta com sucesso"""
+        """Teste: Criar atleta com um único INSERT ... RETURNING"""
         # Arrange
         mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.one.return_value = MagicMock(
+            _mapping={"pk_id": 1, "nome": "João Silva", "cpf": "12345678901"},
+            categoria_id=1,
+            centro_treinamento_id=1
+        )
+        mock_session.execute.return_value = mock_result
+        categoria = CategoriaOut(pk_id=1, nome="Scale")
         atleta_in = AtletaIn(
             nome="João Silva",
             cpf="12345678901",
@@ -30,20 +40,28 @@ class TestAtletaController:
         )
         
         # Act
-        result = await AtletaController.create(mock_session, atleta_in)
+        with patch.object(reference_cache.categorias, "get", AsyncMock(return_value=categoria)), \
+             patch.object(reference_cache.centros_treinamento, "get", AsyncMock(return_value=object())), \
+             patch.object(AtletaStatsController, "registrar", AsyncMock()) as registrar:
+            result = await AtletaController.create(mock_session, atleta_in)
         
         # Assert
-        mock_session.add.assert_called_once()
+        mock_session.execute.assert_called_once()
+        registrar.assert_called_once()
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once()
-        assert result is not None
+        mock_session.add.assert_not_called()
+        mock_session.refresh.assert_not_called()
+        assert result.pk_id == 1
+        assert result.categoria == categoria
     
     @pytest.mark.asyncio
     async def test_create_atleta_integrity_error(self):
         """Teste: Erro de integridade ao criar atleta com CPF duplicado"""
         # Arrange
         mock_session = AsyncMock()
-        mock_session.commit.side_effect = IntegrityError("", "", "")
+        mock_session.execute.side_effect = IntegrityError(
+            "INSERT", {}, Exception("UNIQUE constraint failed: atletas.cpf")
+        )
         
         atleta_in = AtletaIn(
             nome="João Silva",
@@ -57,28 +75,65 @@ class TestAtletaController:
         )
         
         # Act & Assert
-        with pytest.raises(HTTPException) as exc_info:
+        with patch.object(reference_cache.categorias, "get", AsyncMock(return_value=object())), \
+             patch.object(reference_cache.centros_treinamento, "get", AsyncMock(return_value=object())), \
+             pytest.raises(HTTPException) as exc_info:
             await AtletaController.create(mock_session, atleta_in)
         
         assert exc_info.value.status_code == 303
         assert "Já existe um atleta cadastrado com o cpf: 12345678901" in exc_info.value.detail
         mock_session.rollback.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_create_atleta_categoria_not_found(self):
+        """Teste: Categoria inexistente é rejeitada antes de qualquer INSERT"""
+        # Arrange
+        mock_session = AsyncMock()
+        atleta_in = AtletaIn(
+            nome="João Silva",
+            cpf="12345678901",
+            idade=25,
+            peso=75.5,
+            altura=1.75,
+            sexo="M",
+            categoria_id=999,
+            centro_treinamento_id=1
+        )
+        
+        # Act & Assert
+        with patch.object(reference_cache.categorias, "get", AsyncMock(return_value=None)), \
+             pytest.raises(HTTPException) as exc_info:
+            await AtletaController.create(mock_session, atleta_in)
+        
+        assert exc_info.value.status_code == 400
+        assert "Categoria com id 999 não encontrada" in exc_info.value.detail
+        mock_session.execute.assert_not_called()
+        mock_session.commit.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_get_by_id_success(self):
-        """Teste: Buscar atleta por ID com sucesso"""
+        """Teste: Buscar atleta por ID com sucesso, com relações vindas do cache"""
         # Arrange
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
+        mock_result = MagicMock()
         mock_atleta = AtletaFactory.build()
-        mock_result.scalar_one_or_none.return_value = mock_atleta
+        mock_row = MagicMock(
+            _mapping={"pk_id": mock_atleta.pk_id, "nome": mock_atleta.nome, "cpf": mock_atleta.cpf},
+            categoria_id=1,
+            centro_treinamento_id=1
+        )
+        mock_result.one_or_none.return_value = mock_row
         mock_session.execute.return_value = mock_result
+        categoria = CategoriaOut(pk_id=1, nome="Scale")
         
         # Act
-        result = await AtletaController.get_by_id(mock_session, 1)
+        with patch.object(reference_cache.categorias, "get", AsyncMock(return_value=categoria)), \
+             patch.object(reference_cache.centros_treinamento, "get", AsyncMock(return_value=None)):
+            result = await AtletaController.get_by_id(mock_session, 1)
         
         # Assert
-        assert result == mock_atleta
+        assert result.nome == mock_atleta.nome
+        assert result.categoria == categoria
         mock_session.execute.assert_called_once()
     
     @pytest.mark.asyncio
@@ -86,8 +141,8 @@ class TestAtletaController:
         """Teste: Erro ao buscar atleta inexistente"""
         # Arrange
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.scalar_one_or_none.return_value = None
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = None
         mock_session.execute.return_value = mock_result
         
         # Act & Assert
@@ -99,41 +154,89 @@ class TestAtletaController:
     
     @pytest.mark.asyncio
     async def test_update_atleta_success(self):
-        """Teste: Atualizar atleta com sucesso"""
+        """Teste: Atualizar atleta com um único UPDATE ... RETURNING"""
         # Arrange
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_atleta = AtletaFactory.build()
-        mock_result.scalar_one_or_none.return_value = mock_atleta
+        mock_result = MagicMock()
+        mock_row = MagicMock(
+            _mapping={"pk_id": 1, "nome": "João Santos", "idade": 26},
+            categoria_id=1,
+            centro_treinamento_id=1
+        )
+        mock_result.one_or_none.return_value = mock_row
         mock_session.execute.return_value = mock_result
+        mock_session.get_bind = MagicMock()
+        mock_session.get_bind.return_value.dialect.name = "postgresql"
+        categoria = CategoriaOut(pk_id=1, nome="Scale")
         
         atleta_update = AtletaUpdate(nome="João Santos", idade=26)
         
         # Act
-        result = await AtletaController.update(mock_session, 1, atleta_update)
+        with patch.object(reference_cache.categorias, "get", AsyncMock(return_value=categoria)), \
+             patch.object(reference_cache.centros_treinamento, "get", AsyncMock(return_value=None)), \
+             patch.object(AtletaStatsController, "registrar", AsyncMock()):
+            result = await AtletaController.update(mock_session, 1, atleta_update)
         
         # Assert
-        assert mock_atleta.nome == "João Santos"
-        assert mock_atleta.idade == 26
+        assert result.nome == "João Santos"
+        assert result.idade == 26
+        assert result.categoria == categoria
+        mock_session.execute.assert_called_once()
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once()
+        mock_session.refresh.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_update_atleta_not_found(self):
+        """Teste: Erro ao atualizar atleta inexistente"""
+        # Arrange
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+        
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await AtletaController.update(mock_session, 999, AtletaUpdate(nome="João Santos"))
+        
+        assert exc_info.value.status_code == 404
+        mock_session.commit.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_delete_atleta_success(self):
-        """Teste: Deletar atleta com sucesso"""
+        """Teste: Deletar atleta com um único DELETE ... RETURNING"""
         # Arrange
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_atleta = AtletaFactory.build()
-        mock_result.scalar_one_or_none.return_value = mock_atleta
+        mock_result = MagicMock()
+        mock_row = MagicMock(_mapping={"pk_id": 1})
+        mock_result.one_or_none.return_value = mock_row
         mock_session.execute.return_value = mock_result
         
         # Act
-        await AtletaController.delete(mock_session, 1)
+        with patch.object(AtletaStatsController, "registrar", AsyncMock()) as registrar:
+            await AtletaController.delete(mock_session, 1)
         
         # Assert
-        mock_session.delete.assert_called_once_with(mock_atleta)
+        mock_session.execute.assert_called_once()
+        registrar.assert_called_once_with(mock_session, removidos=[mock_row._mapping])
+        mock_session.delete.assert_not_called()
         mock_session.commit.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_delete_atleta_not_found(self):
+        """Teste: Erro ao deletar atleta inexistente"""
+        # Arrange
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+        
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await AtletaController.delete(mock_session, 999)
+        
+        assert exc_info.value.status_code == 404
+        assert "Atleta com id 999 não encontrado" in exc_info.value.detail
+        mock_session.commit.assert_not_called()
 
 class TestCategoriaController:
     """Testes para CategoriaController"""
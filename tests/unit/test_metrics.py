@@ -0,0 +1,61 @@
+import pytest
+from workout_api.core.metrics import Histogram, Metrics, RequestStats, current_request
+
+class TestMetrics:
+    """Testes para o registro de métricas"""
+    
+    def test_histogram_buckets(self):
+        """Teste: Histogram deve contar o valor no primeiro bucket com limite maior ou igual"""
+        # Arrange
+        histogram = Histogram((0.1, 1.0))
+        
+        # Act
+        for value in (0.1, 0.5, 2.0):
+            histogram.observe(value)
+        
+        # Assert
+        assert histogram.counts == [1, 1, 1]
+        assert histogram.count == 3
+        assert histogram.sum == pytest.approx(2.6)
+    
+    def test_render_prometheus_text(self):
+        """Teste: render deve produzir contadores e histogramas cumulativos no formato do Prometheus"""
+        # Arrange
+        registry = Metrics()
+        stats = RequestStats()
+        stats.queries = 2
+        stats.db_time = 0.003
+        
+        # Act
+        registry.observe_request("GET", "/atletas/{id}", 200, 0.02, stats)
+        registry.observe_request("GET", "/atletas/{id}", 404, 0.004, RequestStats())
+        text = registry.render()
+        
+        # Assert
+        assert 'http_requests_total{method="GET",route="/atletas/{id}",status="200"} 1' in text
+        assert 'http_requests_total{method="GET",route="/atletas/{id}",status="404"} 1' in text
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/atletas/{id}",le="0.005"} 1' in text
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/atletas/{id}",le="0.025"} 2' in text
+        assert 'http_request_duration_seconds_count{method="GET",route="/atletas/{id}"} 2' in text
+        assert 'http_request_db_queries_bucket{method="GET",route="/atletas/{id}",le="2"} 2' in text
+        assert "# TYPE http_request_duration_seconds histogram" in text
+    
+    def test_observe_query_current_request(self):
+        """Teste: observe_query deve somar na requisição em andamento e no total do processo"""
+        # Arrange
+        registry = Metrics()
+        stats = RequestStats()
+        token = current_request.set(stats)
+        
+        # Act
+        try:
+            registry.observe_query(0.01)
+            registry.observe_query(0.02)
+        finally:
+            current_request.reset(token)
+        registry.observe_query(0.5)
+        
+        # Assert
+        assert stats.queries == 2
+        assert stats.db_time == pytest.approx(0.03)
+        assert registry.queries_total == 3
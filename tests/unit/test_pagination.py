@@ -0,0 +1,78 @@
+import pytest
+from unittest.mock import patch
+from fastapi import HTTPException
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.future import select
+from workout_api.controllers.atleta_controller import AtletaController
+from workout_api.core.counting import CountCache, _explain_statement
+from workout_api.core.pagination import decode_cursor, encode_cursor
+from workout_api.models.atleta_model import AtletaModel
+
+class TestCursor:
+    """Testes para o cursor da paginação por keyset"""
+    
+    def test_cursor_round_trip(self):
+        """Teste: decode_cursor deve recuperar os valores codificados"""
+        cursor = encode_cursor("João Silva", 42)
+        
+        assert decode_cursor(cursor, types=(str, int)) == ("João Silva", 42)
+    
+    def test_cursor_invalid(self):
+        """Teste: decode_cursor deve rejeitar cursor malformado"""
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor("nao-e-um-cursor", types=(str, int))
+        
+        assert exc_info.value.status_code == 400
+    
+    @pytest.mark.parametrize("values", [({}, "x"), ("João", "42"), ("João", True), (None, 42), ("João", 4.2)])
+    def test_cursor_wrong_types(self, values):
+        """Teste: decode_cursor deve rejeitar valores que não batem com os tipos da chave"""
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(encode_cursor(*values), types=(str, int))
+        
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Cursor inválido"
+
+class TestCountCache:
+    """Testes para o cache de totais com TTL"""
+    
+    def test_count_cache_hit(self):
+        """Teste: CountCache deve devolver o total dentro do TTL"""
+        cache = CountCache(ttl=60)
+        cache.set("atletas", 10)
+        
+        assert cache.get("atletas") == 10
+    
+    def test_count_cache_expired(self):
+        """Teste: CountCache deve descartar o total após o TTL"""
+        cache = CountCache(ttl=60)
+        
+        with patch("workout_api.core.counting.time.monotonic", return_value=0):
+            cache.set("atletas", 10)
+        with patch("workout_api.core.counting.time.monotonic", return_value=61):
+            assert cache.get("atletas") is None
+    
+    def test_count_cache_evicts_least_recently_used(self):
+        """Teste: CountCache deve descartar a chave menos usada ao passar de max_entries"""
+        cache = CountCache(ttl=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+class TestPlannerEstimate:
+    """Testes para o EXPLAIN usado na contagem estimada"""
+    
+    def test_explain_keeps_filter_values_as_binds(self):
+        """Teste: valores do filtro (inclusive com ':') devem seguir como parâmetros, fora do SQL"""
+        statement = AtletaController._filtrar(select(AtletaModel.pk_id), dialect="postgresql", nome="Ana :x")
+        
+        sql, params = _explain_statement(statement, asyncpg_dialect())
+        
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "Ana" not in sql
+        assert params == ("Ana :x",)
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from workout_api.configs.database import Settings
+from workout_api.configs.pool import InstrumentedAsyncPool, engine_options, pool_snapshot
+
+class TestInstrumentedAsyncPool:
+    """Testes para o pool de conexões instrumentado"""
+    
+    @pytest.fixture
+    async def pool_engine(self, tmp_path):
+        """Fixture para engine com pool de uma conexão, um overflow e timeout curto"""
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedAsyncPool,
+            pool_size=1,
+            max_overflow=1,
+            pool_timeout=0.05
+        )
+        yield engine
+        await engine.dispose()
+    
+    @pytest.mark.asyncio
+    async def test_checkout_overflow_and_timeout(self, pool_engine):
+        """Teste: o pool deve contar checkouts, overflows, timeouts e o pico de conexões em uso"""
+        # Arrange
+        primeira = await pool_engine.connect()
+        segunda = await pool_engine.connect()
+        
+        # Act
+        with pytest.raises(exc.TimeoutError):
+            await pool_engine.connect()
+        em_uso = pool_snapshot(pool_engine.pool)
+        await primeira.close()
+        await segunda.close()
+        snapshot = pool_snapshot(pool_engine.pool)
+        
+        # Assert
+        assert em_uso["em_uso"] == 2
+        assert em_uso["overflow"] == 1
+        assert snapshot["em_uso"] == 0
+        assert snapshot["checkouts"] == 2
+        assert snapshot["overflows"] == 1
+        assert snapshot["timeouts"] == 1
+        assert snapshot["pico_em_uso"] == 2
+        assert sum(snapshot["espera_histograma"].values()) == 2
+    
+    @pytest.mark.asyncio
+    async def test_stats_survive_dispose(self, pool_engine):
+        """Teste: os contadores devem continuar acumulando depois de engine.dispose()"""
+        # Arrange
+        async with pool_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        
+        # Act
+        await pool_engine.dispose()
+        async with pool_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        
+        # Assert
+        assert pool_snapshot(pool_engine.pool)["checkouts"] == 2
+    
+    def test_engine_options(self):
+        """Teste: engine_options deve dimensionar o pool no Postgres e manter o pool padrão no SQLite"""
+        # Arrange
+        postgres = Settings(DB_URL="postgresql+asyncpg://u:p@localhost/db", DB_POOL_SIZE=20, DB_MAX_OVERFLOW=5)
+        sqlite = Settings(DB_URL="sqlite+aiosqlite:///:memory:")
+        
+        # Act
+        options = engine_options(postgres)
+        sqlite_options = engine_options(sqlite)
+        
+        # Assert
+        assert options["poolclass"] is InstrumentedAsyncPool
+        assert options["pool_size"] == 20
+        assert options["max_overflow"] == 5
+        assert options["echo"] is False
+        assert "poolclass" not in sqlite_options
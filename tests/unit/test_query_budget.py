@@ -0,0 +1,46 @@
+import logging
+import pytest
+from sqlalchemy import text
+from workout_api.core.query_budget import QueryBudget, QueryBudgetExceeded
+
+class TestQueryBudget:
+    """Testes para o orçamento de consultas"""
+    
+    @pytest.mark.asyncio
+    async def test_nested_budgets(self, db_session):
+        """Teste: blocos aninhados devem contar cada um as suas consultas"""
+        # Act
+        with QueryBudget(3, mode="raise") as externo:
+            await db_session.execute(text("SELECT 1"))
+            with QueryBudget(1, mode="raise") as interno:
+                await db_session.execute(text("SELECT 2"))
+        
+        # Assert
+        assert externo.count == 2
+        assert interno.count == 1
+        assert "SELECT 2" in interno.statements[0]
+    
+    @pytest.mark.asyncio
+    async def test_decorator_raise(self, db_session):
+        """Teste: rota decorada deve falhar ao passar do orçamento no modo raise"""
+        # Arrange
+        @QueryBudget(1, mode="raise")
+        async def rota():
+            await db_session.execute(text("SELECT 1"))
+            await db_session.execute(text("SELECT 2"))
+        
+        # Act / Assert
+        with pytest.raises(QueryBudgetExceeded, match="rota: 2 consultas para um orçamento de 1"):
+            await rota()
+    
+    @pytest.mark.asyncio
+    async def test_warn_mode(self, db_session, caplog):
+        """Teste: no modo warn o excesso deve ser registrado no log sem interromper a requisição"""
+        # Act
+        with caplog.at_level(logging.WARNING, logger="workout_api.core.query_budget"):
+            with QueryBudget(0, "listagem", mode="warn"):
+                await db_session.execute(text("SELECT 1"))
+        
+        # Assert
+        assert "listagem: 1 consultas para um orçamento de 0" in caplog.text
+        assert "SELECT 1" in caplog.text
@@ -0,0 +1,184 @@
+import time
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.requests import Request
+from workout_api.configs.database import READ_PRIMARY_COOKIE, _read_primary, read_options
+from workout_api.configs.replicas import ReplicaSession, ReplicaSet
+from workout_api.core.read_your_writes import ReadYourWritesMiddleware
+
+def make_request(headers: dict) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()]
+    })
+
+class TestReplicaRouting:
+    """Testes para o roteamento de leituras entre réplicas e primário"""
+    
+    @pytest.fixture
+    async def engines(self, tmp_path):
+        """Fixture para primário e réplicas SQLite identificados pelo conteúdo, mais uma réplica inacessível"""
+        engines = {}
+        for nome in ("primario", "replica_a", "replica_b"):
+            engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / nome}.db")
+            async with engine.begin() as conn:
+                await conn.execute(text("CREATE TABLE origem (nome TEXT)"))
+                await conn.execute(text(f"INSERT INTO origem VALUES ('{nome}')"))
+            engines[nome] = engine
+        engines["fora"] = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'inexistente' / 'fora.db'}")
+        
+        yield engines
+        for engine in engines.values():
+            await engine.dispose()
+    
+    async def _origem(self, engines: list, replicas: ReplicaSet, **execution_options) -> str:
+        async with ReplicaSession(engines, replicas) as session:
+            result = await session.execute(text("SELECT nome FROM origem"), execution_options=execution_options)
+            return result.scalar_one()
+    
+    @pytest.mark.asyncio
+    async def test_round_robin(self, engines):
+        """Teste: leituras devem alternar entre as réplicas disponíveis"""
+        # Arrange
+        replicas = ReplicaSet([engines["replica_a"], engines["replica_b"]], retry_after=30)
+        
+        # Act
+        origens = [await self._origem([*replicas.candidates(), engines["primario"]], replicas) for _ in range(4)]
+        
+        # Assert
+        assert origens == ["replica_a", "replica_b", "replica_a", "replica_b"]
+    
+    @pytest.mark.asyncio
+    async def test_fallback_to_primary(self, engines):
+        """Teste: réplica inacessível deve cair no primário e sair de rotação"""
+        # Arrange
+        replicas = ReplicaSet([engines["fora"]], retry_after=30)
+        
+        # Act
+        origem = await self._origem([*replicas.candidates(), engines["primario"]], replicas)
+        
+        # Assert
+        assert origem == "primario"
+        assert replicas.candidates() == []
+    
+    @pytest.mark.asyncio
+    async def test_read_primary_option(self, engines):
+        """Teste: execution_options read_primary deve ler do primário mesmo com réplica disponível"""
+        # Arrange
+        replicas = ReplicaSet([engines["replica_a"]], retry_after=30)
+        
+        # Act
+        origem = await self._origem([*replicas.candidates(), engines["primario"]], replicas, read_primary=True)
+        
+        # Assert
+        assert origem == "primario"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("replicas_configuradas", [[], ["fora"]])
+    async def test_read_primary_reuses_primary_connection(self, engines, replicas_configuradas):
+        """Teste: read_primary em sessão que já está no primário não deve abrir outra conexão"""
+        # Arrange - Sem réplicas ou com a única réplica fora do ar
+        replicas = ReplicaSet([engines[nome] for nome in replicas_configuradas], retry_after=30)
+        checkouts = []
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            checkouts.append(connection_record)
+        event.listen(engines["primario"].sync_engine, "checkout", on_checkout)
+        
+        # Act
+        try:
+            async with ReplicaSession([*replicas.candidates(), engines["primario"]], replicas) as session:
+                await session.execute(text("SELECT nome FROM origem"))
+                result = await session.execute(text("SELECT nome FROM origem"), execution_options={"read_primary": True})
+                origem = result.scalar_one()
+        finally:
+            event.remove(engines["primario"].sync_engine, "checkout", on_checkout)
+        
+        # Assert
+        assert origem == "primario"
+        assert len(checkouts) == 1
+    
+    @pytest.mark.asyncio
+    async def test_no_connection_until_query(self, engines):
+        """Teste: a sessão não deve abrir conexão antes da primeira consulta"""
+        # Arrange
+        replicas = ReplicaSet([engines["replica_a"]], retry_after=30)
+        conexoes = []
+        for engine in (engines["replica_a"], engines["primario"]):
+            event.listen(engine.sync_engine, "engine_connect", conexoes.append)
+        
+        # Act
+        async with ReplicaSession([*replicas.candidates(), engines["primario"]], replicas) as session:
+            dialect = session.get_bind().dialect.name
+        
+        # Assert
+        assert dialect == "sqlite"
+        assert conexoes == []
+    
+    def test_read_primary_window(self):
+        """Teste: cookie ou cabeçalho com janela futura deve mandar a leitura ao primário"""
+        # Arrange
+        dentro = f"{time.time() + 1:.3f}"
+        
+        # Assert
+        assert _read_primary(make_request({"Cookie": f"{READ_PRIMARY_COOKIE}={dentro}"}))
+        assert _read_primary(make_request({"X-Read-Primary-Until": dentro}))
+        assert not _read_primary(make_request({"Cookie": f"{READ_PRIMARY_COOKIE}=1"}))
+        assert not _read_primary(make_request({"X-Read-Primary-Until": "9999999999"}))
+        assert not _read_primary(make_request({"X-Read-Primary-Until": "inf"}))
+        assert not _read_primary(make_request({"X-Read-Primary-Until": "abc"}))
+        assert not _read_primary(make_request({}))
+    
+    @pytest.mark.asyncio
+    async def test_read_your_writes_middleware(self):
+        """Teste: escrita bem-sucedida deve marcar o cliente até o fim da janela; leituras e erros não"""
+        # Arrange
+        async def endpoint(scope, receive, send):
+            status = 422 if scope["path"] == "/invalido" else 201
+            await send({"type": "http.response.start", "status": status, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+        
+        middleware = ReadYourWritesMiddleware(
+            endpoint, window=5, cookie=READ_PRIMARY_COOKIE, header="x-read-primary-until"
+        )
+        
+        # Act
+        async with AsyncClient(app=middleware, base_url="http://test") as client:
+            post_response = await client.post("/")
+            get_response = await client.get("/")
+            invalido = await client.post("/invalido")
+        
+        # Assert
+        until = post_response.headers["x-read-primary-until"]
+        assert f"{READ_PRIMARY_COOKIE}={until}" in post_response.headers["set-cookie"]
+        assert _read_primary(make_request({"X-Read-Primary-Until": until}))
+        assert "x-read-primary-until" not in get_response.headers
+        assert "x-read-primary-until" not in invalido.headers
+    
+    @pytest.mark.asyncio
+    async def test_connection_options_autocommit(self, engines):
+        """Teste: connection_options deve valer para a conexão da sessão (AUTOCOMMIT dispensa o ROLLBACK)"""
+        # Arrange
+        replicas = ReplicaSet([engines["replica_a"]], retry_after=30)
+        
+        # Act
+        async with ReplicaSession(
+            [*replicas.candidates(), engines["primario"]], replicas,
+            connection_options={"isolation_level": "AUTOCOMMIT"}
+        ) as session:
+            await session.execute(text("INSERT INTO origem VALUES ('autocommit')"))
+        async with engines["replica_a"].connect() as conn:
+            total = (await conn.execute(text("SELECT count(*) FROM origem"))).scalar_one()
+        
+        # Assert
+        assert total == 2
+    
+    def test_read_options(self):
+        """Teste: leituras devem usar transação somente leitura no Postgres ou AUTOCOMMIT quando configurado"""
+        # Assert
+        assert read_options("postgresql") == {"postgresql_readonly": True, "postgresql_deferrable": True}
+        assert read_options("sqlite") == {}
+        assert read_options("postgresql", autocommit=True) == {"isolation_level": "AUTOCOMMIT"} 
\ No newline at end of file
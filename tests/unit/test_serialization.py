@@ -0,0 +1,96 @@
+import pytest
+from datetime import datetime
+from fastapi import APIRouter, Depends, FastAPI, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+from workout_api.core.serialization import FastJSONRoute, ORJSONResponse, default_response_class
+from workout_api.models.categoria_model import CategoriaModel
+from workout_api.schemas.atleta_schema import AtletaOut, AtletaListOut
+from workout_api.schemas.categoria_schema import CategoriaOut
+from workout_api.schemas.centro_treinamento_schema import CentroTreinamentoOut
+from workout_api.schemas.pagination_schema import PageOut
+
+CATEGORIA = CategoriaOut.model_construct(pk_id=1, nome="Scale")
+CENTRO = CentroTreinamentoOut.model_construct(nome="CT King", endereco="Rua X, 123", proprietario="Marcos")
+ATLETA = AtletaOut.model_construct(
+    pk_id=1,
+    nome="João Silva",
+    cpf="12345678901",
+    idade=25,
+    peso=75.5,
+    altura=1.0,
+    sexo="M",
+    categoria_id=1,
+    centro_treinamento_id=1,
+    created_at=datetime(2024, 1, 2, 3, 4, 5, 678901),
+    categoria=CATEGORIA,
+    centro_treinamento=CENTRO
+)
+
+def set_etag(response: Response):
+    response.headers["ETag"] = '"v1"'
+
+def build_app(route_class) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+    
+    @router.get("/atleta", response_model=AtletaOut, dependencies=[Depends(set_etag)])
+    async def atleta():
+        return ATLETA
+    
+    @router.get("/pagina", response_model=PageOut[AtletaListOut])
+    async def pagina():
+        item = AtletaListOut.model_construct(nome="Ñandú", categoria=CATEGORIA, centro_treinamento=CENTRO)
+        return PageOut[AtletaListOut].model_construct(
+            items=[item], total=1, page=1, size=50, pages=1, contagem="exata", next_cursor=None
+        )
+    
+    @router.post("/categoria", response_model=CategoriaOut, status_code=201)
+    async def categoria():
+        return CategoriaModel(pk_id=2, nome="RX")
+    
+    @router.delete("/categoria", status_code=204)
+    async def delete_categoria():
+        return None
+    
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+class TestFastJSONRoute:
+    """Testes para a serialização rápida das respostas"""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,path", [("get", "/atleta"), ("get", "/pagina"), ("post", "/categoria")])
+    async def test_fast_json_output_identical(self, method, path):
+        """Teste: FastJSONRoute deve produzir o mesmo corpo, status e cabeçalhos da rota padrão"""
+        # Arrange
+        async with AsyncClient(app=build_app(FastJSONRoute), base_url="http://test") as fast, \
+                   AsyncClient(app=build_app(APIRoute), base_url="http://test") as default:
+            # Act
+            fast_response = await getattr(fast, method)(path)
+            default_response = await getattr(default, method)(path)
+        
+        # Assert
+        assert fast_response.status_code == default_response.status_code
+        assert fast_response.content == default_response.content
+        assert fast_response.headers == default_response.headers
+
+    
+    def test_fast_json_route_wraps_endpoint(self):
+        """Teste: apenas rotas com response_model passam pela serialização rápida"""
+        # Arrange
+        app = build_app(FastJSONRoute)
+        
+        # Act
+        routes = {(route.path, tuple(route.methods)): route for route in app.routes if isinstance(route, APIRoute)}
+        
+        # Assert
+        assert getattr(routes[("/atleta", ("GET",))].dependant.call, "__fast_json__", False)
+        assert not getattr(routes[("/categoria", ("DELETE",))].dependant.call, "__fast_json__", False)
+
+    
+    def test_default_response_class_follows_fast_json(self):
+        """Teste: com FAST_JSON desligado a classe de resposta padrão deve ser a JSONResponse"""
+        assert default_response_class(False) is JSONResponse
+        assert default_response_class(True) is (ORJSONResponse or JSONResponse)
\ No newline at end of file
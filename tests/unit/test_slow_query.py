@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import text
+from workout_api.configs.slow_query import CPF_REDACTED, SlowQueryLog, redact
+from workout_api.configs.statement_timing import subscribe, unsubscribe
+from workout_api.core.request_context import current_scope
+
+class TestSlowQueryLog:
+    """Testes para o registro de consultas lentas"""
+    
+    def test_redact(self):
+        """Teste: redact deve mascarar CPFs com ou sem pontuação e serializar outros tipos"""
+        # Act
+        redacted = redact({"cpf": "12345678901", "outro": ["123.456.789-01", 7, None], "nome": "João"})
+        
+        # Assert
+        assert redacted == {"cpf": CPF_REDACTED, "outro": [CPF_REDACTED, 7, None], "nome": "João"}
+        assert redact(("a", 1.5)) == ["a", 1.5]
+    
+    @pytest.mark.asyncio
+    async def test_records_slow_statements(self, engine):
+        """Teste: comandos acima do limite devem ir para o ring buffer com rota e parâmetros mascarados"""
+        # Arrange
+        log = SlowQueryLog(threshold_ms=0, size=2)
+        subscribe(log.observe)
+        token = current_scope.set({"type": "http", "method": "GET", "path": "/atletas/"})
+        
+        # Act
+        try:
+            async with engine.connect() as conn:
+                for i in range(3):
+                    await conn.execute(text("SELECT :cpf, :i"), {"cpf": "12345678901", "i": i})
+        finally:
+            current_scope.reset(token)
+            unsubscribe(log.observe)
+        entries = log.entries_newest_first()
+        
+        # Assert
+        assert len(entries) == 2
+        assert entries[0]["parametros"] == [CPF_REDACTED, 2]
+        assert entries[0]["rota"] == "GET /atletas/"
+        assert entries[0]["plano"] is None
+        assert entries[0]["id"] > entries[1]["id"]
+    
+    @pytest.mark.asyncio
+    async def test_ignores_fast_statements(self, engine):
+        """Teste: comandos abaixo do limite não devem ser registrados"""
+        # Arrange
+        log = SlowQueryLog(threshold_ms=60_000, size=10)
+        subscribe(log.observe)
+        
+        # Act
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        finally:
+            unsubscribe(log.observe)
+        
+        # Assert
+        assert log.entries_newest_first() == []
@@ -0,0 +1,106 @@
+import time
+from bisect import bisect_left
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Limites superiores (em segundos) dos buckets do histograma de espera no checkout
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class PoolStats:
+    """Contadores acumulados do pool desde a inicialização do processo."""
+    
+    def __init__(self):
+        self.checkouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS) + 1)
+        self.overflow_events = 0
+        self.timeouts = 0
+        self.in_use_peak = 0
+    
+    def record_checkout(self, wait: float, in_use: int) -> None:
+        self.checkouts += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        self.wait_buckets[bisect_left(WAIT_BUCKETS, wait)] += 1
+        self.in_use_peak = max(self.in_use_peak, in_use)
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool que mede o tempo de checkout, overflows e timeouts."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+    
+    def connect(self):
+        inicio = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        
+        self.stats.record_checkout(time.perf_counter() - inicio, self.checkedout())
+        return connection
+    
+    def _inc_overflow(self) -> bool:
+        # _overflow parte de -pool_size: acima de zero a conexão é criada além do pool_size
+        criada = super()._inc_overflow()
+        if criada and self._overflow > 0:
+            self.stats.overflow_events += 1
+        return criada
+    
+    def recreate(self) -> 'InstrumentedAsyncPool':
+        # engine.dispose() recria o pool; os contadores continuam acumulando
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+def engine_options(settings, url: str = None) -> dict:
+    options = dict(echo=settings.DB_ECHO, pool_pre_ping=settings.DB_POOL_PRE_PING)
+    if make_url(url or settings.DB_URL).get_backend_name() == 'sqlite':
+        # SQLite usa os pools próprios do dialeto (StaticPool/NullPool), sem dimensionamento
+        return options
+    
+    options.update(
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE
+    )
+    return options
+
+
+def pool_snapshot(pool: Pool) -> dict:
+    snapshot = {'classe': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        snapshot.update(
+            tamanho=pool.size(),
+            em_uso=pool.checkedout(),
+            ociosas=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout()
+        )
+    
+    stats = getattr(pool, 'stats', None)
+    if stats is not None:
+        snapshot.update(
+            checkouts=stats.checkouts,
+            espera_total=round(stats.wait_total, 6),
+            espera_media=round(stats.wait_total / stats.checkouts, 6) if stats.checkouts else 0.0,
+            espera_maxima=round(stats.wait_max, 6),
+            espera_histograma={
+                **{f'{limite:g}': total for limite, total in zip(WAIT_BUCKETS, stats.wait_buckets)},
+                '+Inf': stats.wait_buckets[-1]
+            },
+            overflows=stats.overflow_events,
+            timeouts=stats.timeouts,
+            pico_em_uso=stats.in_use_peak
+        )
+    return snapshot
@@ -0,0 +1,118 @@
+import itertools
+import logging
+import time
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaSet:
+    """Réplicas de leitura em round-robin; a que falha fica fora por retry_after segundos."""
+    
+    def __init__(self, engines: list[AsyncEngine], retry_after: float):
+        self.engines = engines
+        self.retry_after = retry_after
+        self._down_until = {id(engine): 0.0 for engine in engines}
+        self._next = itertools.count()
+        for engine in engines:
+            event.listen(engine.sync_engine, 'handle_error', self._on_error(engine))
+    
+    def candidates(self) -> list[AsyncEngine]:
+        if not self.engines:
+            return []
+        
+        agora = time.monotonic()
+        inicio = next(self._next) % len(self.engines)
+        ordem = self.engines[inicio:] + self.engines[:inicio]
+        return [engine for engine in ordem if self._down_until[id(engine)] <= agora]
+    
+    def mark_down(self, engine: AsyncEngine) -> None:
+        logger.warning('Réplica %s indisponível; leituras vão para o primário por %ss', engine.url, self.retry_after)
+        self._down_until[id(engine)] = time.monotonic() + self.retry_after
+    
+    def _on_error(self, engine: AsyncEngine):
+        # Conexão perdida no meio de uma consulta também tira a réplica de rotação
+        def handle_error(context):
+            if context.is_disconnect:
+                self.mark_down(engine)
+        return handle_error
+
+
+class ReplicaSession(AsyncSession):
+    """Sessão de leitura que só conecta na primeira consulta, tentando as réplicas em ordem.
+    
+    Se nenhuma réplica aceitar a conexão, a sessão usa o primário (último da lista).
+    connection_options (ex.: transação somente leitura) valem para toda conexão da sessão.
+    """
+    
+    def __init__(self, engines: list[AsyncEngine], replicas: ReplicaSet, connection_options: dict = None, **kw):
+        super().__init__(bind=engines[0], **kw)
+        self._engines = engines
+        self._replicas = replicas
+        self._connection_options = connection_options or {}
+        self._connection: Optional[AsyncConnection] = None
+        self._primary = engines[-1].sync_engine.execution_options(**self._connection_options)
+    
+    async def _connect(self) -> None:
+        if self._connection is not None:
+            return
+        
+        *replicas, primario = self._engines
+        for engine in replicas:
+            try:
+                self._connection = await engine.connect()
+                break
+            except (DBAPIError, OSError):
+                self._replicas.mark_down(engine)
+        else:
+            self._connection = await primario.connect()
+        
+        if self._connection_options:
+            await self._connection.execution_options(**self._connection_options)
+        self.sync_session.bind = self._connection.sync_connection
+    
+    def _on_primary(self) -> bool:
+        if len(self._engines) == 1:
+            return True
+        return self._connection is not None and self._connection.sync_engine is self._engines[-1].sync_engine
+    
+    async def execute(self, statement, params=None, *, execution_options=None, bind_arguments=None, **kw):
+        execution_options = execution_options or {}
+        if execution_options.get('read_primary') and not self._on_primary():
+            # Leituras que alimentam caches vão ao primário, sem depender da réplica;
+            # a sessão já no primário reaproveita a própria conexão
+            bind_arguments = {**(bind_arguments or {}), 'bind': self._primary}
+        else:
+            await self._connect()
+        return await super().execute(
+            statement, params, execution_options=execution_options, bind_arguments=bind_arguments, **kw
+        )
+    
+    async def scalar(self, *args, **kw):
+        await self._connect()
+        return await super().scalar(*args, **kw)
+    
+    async def scalars(self, *args, **kw):
+        await self._connect()
+        return await super().scalars(*args, **kw)
+    
+    async def get(self, *args, **kw):
+        await self._connect()
+        return await super().get(*args, **kw)
+    
+    async def stream(self, *args, **kw):
+        await self._connect()
+        return await super().stream(*args, **kw)
+    
+    async def connection(self, *args, **kw):
+        await self._connect()
+        return await super().connection(*args, **kw)
+    
+    async def close(self) -> None:
+        await super().close()
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
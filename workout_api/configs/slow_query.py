@@ -0,0 +1,94 @@
+import asyncio
+import itertools
+import logging
+import re
+from collections import deque
+from datetime import datetime, timezone
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from workout_api.core.request_context import current_route
+
+logger = logging.getLogger(__name__)
+
+CPF_PATTERN = re.compile(r'\b\d{3}\.?\d{3}\.?\d{3}-?\d{2}\b')
+CPF_REDACTED = '***CPF***'
+# Em executemany só as primeiras linhas de parâmetros são guardadas
+MAX_PARAMETER_ROWS = 10
+# EXPLAINs em andamento ao mesmo tempo; acima disso o plano da consulta é descartado
+MAX_PENDING_EXPLAINS = 2
+
+
+def redact(value):
+    """Troca CPFs por um marcador e converte os parâmetros para tipos serializáveis em JSON."""
+    if isinstance(value, str):
+        return CPF_PATTERN.sub(CPF_REDACTED, value)
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    return redact(str(value))
+
+
+class SlowQueryLog:
+    """Ring buffer das consultas acima do limite, com o EXPLAIN capturado em segundo plano no Postgres."""
+    
+    def __init__(self, threshold_ms: float, size: int, explain: bool = True):
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self.entries: deque = deque(maxlen=size)
+        self._ids = itertools.count(1)
+        self._pending: set[asyncio.Task] = set()
+    
+    def entries_newest_first(self, limit: int = None) -> list[dict]:
+        entries = list(reversed(self.entries))
+        return entries[:limit] if limit else entries
+    
+    def clear(self) -> None:
+        self.entries.clear()
+    
+    def observe(self, conn, statement: str, parameters, executemany: bool, elapsed: float) -> None:
+        # Assinado em statement_timing: recebe a duração de cada comando já medida
+        if elapsed < self.threshold or statement.lstrip().upper().startswith('EXPLAIN'):
+            return
+        
+        if executemany:
+            parameters = list(parameters)[:MAX_PARAMETER_ROWS]
+        entry = {
+            'id': next(self._ids),
+            'sql': redact(statement),
+            'parametros': redact(parameters),
+            'duracao_ms': round(elapsed * 1000, 3),
+            'rota': current_route(),
+            'ocorrido_em': datetime.now(timezone.utc),
+            'plano': None
+        }
+        self.entries.append(entry)
+        logger.warning('Consulta lenta (%.1f ms) em %s: %s', entry['duracao_ms'], entry['rota'], entry['sql'])
+        
+        if self.explain and conn.dialect.name == 'postgresql' and not executemany:
+            self._schedule_explain(conn.engine, entry, statement, parameters)
+    
+    def _schedule_explain(self, engine: Engine, entry: dict, statement: str, parameters) -> None:
+        if not statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+            return
+        if len(self._pending) >= MAX_PENDING_EXPLAINS:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        
+        # Fora do caminho da requisição: roda em outra conexão, depois que a resposta segue
+        task = loop.create_task(self._explain(AsyncEngine(engine), entry, statement, parameters))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+    
+    async def _explain(self, engine: AsyncEngine, entry: dict, statement: str, parameters) -> None:
+        try:
+            async with engine.connect() as conn:
+                result = await conn.exec_driver_sql(f'EXPLAIN (ANALYZE off) {statement}', parameters)
+                entry['plano'] = [row[0] for row in result]
+        except Exception:
+            logger.warning('Falha ao capturar o EXPLAIN da consulta lenta %s', entry['id'], exc_info=True)
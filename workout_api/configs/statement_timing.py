@@ -0,0 +1,42 @@
+import time
+from typing import Any, Callable
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+# (conexão, sql, parâmetros, executemany, duração em segundos)
+StatementListener = Callable[[Connection, str, Any, bool, float], None]
+
+_listeners: list[StatementListener] = []
+
+
+def subscribe(listener: StatementListener) -> StatementListener:
+    """Registra um observador chamado ao fim de cada comando SQL, em qualquer engine.
+    
+    Métricas, orçamentos de consultas e o log de consultas lentas compartilham esta
+    única cronometragem em vez de cada um manter a sua. Pode ser usado como decorator.
+    """
+    _listeners.append(listener)
+    return listener
+
+
+def unsubscribe(listener: StatementListener) -> None:
+    _listeners.remove(listener)
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('statement_start', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['statement_start'].pop()
+    for listener in _listeners:
+        listener(conn, statement, parameters, executemany, elapsed)
+
+
+@event.listens_for(Engine, 'handle_error')
+def _handle_error(context):
+    # Comando que falhou não passa pelo after_cursor_execute
+    if context.connection is not None and context.connection.info.get('statement_start'):
+        context.connection.info['statement_start'].pop()
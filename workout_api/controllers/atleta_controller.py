@@ -1,103 +1,625 @@
 from datetime import datetime
-from uuid import uuid4
+from typing import AsyncIterator, BinaryIO, Optional
 from fastapi import HTTPException
-from fastapi_pagination.ext.sqlalchemy import paginate
-from fastapi_pagination import Page
+from fastapi_pagination.ext.sqlalchemy import paginate_query
+from fastapi_pagination import resolve_params
+from pydantic import ValidationError
+from sqlalchemy import column, delete, insert, literal, table, text, tuple_, update
 from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from workout_api.controllers.atleta_stats_controller import AtletaStatsController
+from workout_api.core.bulk import any_of, copy_records, insert_ignoring_conflicts, iter_csv_batches
+from workout_api.core.constraints import violated_constraint
+from workout_api.core.counting import estimated_count, exact_count
+from workout_api.core.entity_cache import entity_cache
+from workout_api.core.etag import ConditionalRequest, make_etag
+from workout_api.core.fieldsets import parse_fields, partial_model
+from workout_api.core.pagination import decode_cursor, encode_cursor
+from workout_api.core.search import nome_filter, nome_rank
+from workout_api.core.reference_cache import reference_cache
 from workout_api.models.atleta_model import AtletaModel
-from workout_api.schemas.atleta_schema import AtletaIn, AtletaOut, AtletaUpdate, AtletaListOut
+from workout_api.schemas.atleta_schema import (
+    AtletaIn, AtletaOut, AtletaUpdate, AtletaListOut, AtletaBulkOut, AtletaBulkResultOut, AtletaBatchOut,
+    AtletaImportOut, AtletaImportErroOut
+)
+from workout_api.schemas.pagination_schema import PageOut
+
+# Constraints de atletas pelo nome no PostgreSQL e pela coluna na mensagem do SQLite
+CPF_CONSTRAINTS = {'atletas_cpf_key', 'atletas.cpf'}
+FK_CONSTRAINTS = {
+    'atletas_categoria_id_fkey': 'Categoria informada não existe',
+    'atletas_centro_treinamento_id_fkey': 'Centro de treinamento informado não existe'
+}
+
+IMPORT_COLUMNS = (
+    'nome', 'cpf', 'idade', 'peso', 'altura', 'sexo', 'categoria_id', 'centro_treinamento_id'
+)
+IMPORT_MAX_ERROS = 1000
+BATCH_MAX_IDS = 500
+
+# Tabela temporária de staging do COPY; esvaziada a cada commit de lote
+ATLETAS_IMPORT_DDL = (
+    "CREATE TEMP TABLE IF NOT EXISTS atletas_import ("
+    "nome varchar(50), cpf varchar(11), idade integer, peso double precision, "
+    "altura double precision, sexo varchar(1), categoria_id integer, centro_treinamento_id integer"
+    ") ON COMMIT DELETE ROWS"
+)
+atletas_import = table('atletas_import', *(column(name) for name in IMPORT_COLUMNS))
 
 class AtletaController:
     
     @staticmethod
     async def create(db_session: AsyncSession, atleta_in: AtletaIn) -> AtletaOut:
-        atleta_out = AtletaModel(created_at=datetime.utcnow(), **atleta_in.model_dump())
-        db_session.add(atleta_out)
+        erro = await AtletaController._validar_relacoes(db_session, atleta_in)
+        if erro:
+            raise HTTPException(status_code=400, detail=erro)
+        
+        # INSERT ... RETURNING: o atleta criado volta na mesma ida ao banco
+        created_at = datetime.utcnow()
+        statement = (
+            insert(AtletaModel.__table__)
+            .values(created_at=created_at, updated_at=created_at, **atleta_in.model_dump())
+            .returning(*AtletaModel.__table__.c)
+        )
         
         try:
+            result = await db_session.execute(statement)
+            row = result.one()
+            await AtletaStatsController.registrar(db_session, adicionados=[row._mapping])
             await db_session.commit()
-            await db_session.refresh(atleta_out)
-        except IntegrityError:
+        except IntegrityError as exc:
             await db_session.rollback()
-            raise HTTPException(
-                status_code=303, 
-                detail=f'Já existe um atleta cadastrado com o cpf: {atleta_in.cpf}'
+            constraint = violated_constraint(exc)
+            if constraint in CPF_CONSTRAINTS:
+                raise HTTPException(
+                    status_code=303, 
+                    detail=f'Já existe um atleta cadastrado com o cpf: {atleta_in.cpf}'
+                )
+            if constraint in FK_CONSTRAINTS:
+                raise HTTPException(status_code=400, detail=FK_CONSTRAINTS[constraint])
+            raise
+        
+        return await AtletaController._atleta_out(db_session, row)
+    
+    @staticmethod
+    async def _validar_relacoes(db_session: AsyncSession, atleta_in: AtletaIn) -> Optional[str]:
+        # Chaves estrangeiras conferidas no cache de referência, antes de ir ao banco
+        if not await reference_cache.categorias.get(db_session, atleta_in.categoria_id):
+            return f'Categoria com id {atleta_in.categoria_id} não encontrada'
+        if not await reference_cache.centros_treinamento.get(db_session, atleta_in.centro_treinamento_id):
+            return f'Centro de treinamento com id {atleta_in.centro_treinamento_id} não encontrado'
+        
+        return None
+    
+    @staticmethod
+    def _detalhe_validacao(exc: ValidationError) -> str:
+        return '; '.join(f"{'.'.join(map(str, erro['loc']))}: {erro['msg']}" for erro in exc.errors())
+    
+    @staticmethod
+    async def create_bulk(db_session: AsyncSession, atletas_in: list[dict]) -> AtletaBulkOut:
+        resultados: list[Optional[AtletaBulkResultOut]] = [None] * len(atletas_in)
+        validados: dict[int, AtletaIn] = {}
+        candidatos: dict[str, int] = {}
+        
+        for indice, valores in enumerate(atletas_in):
+            # Cada linha é validada isoladamente: uma linha inválida não derruba o lote com 422
+            try:
+                atleta_in = AtletaIn.model_validate(valores)
+            except ValidationError as exc:
+                resultados[indice] = AtletaBulkResultOut(
+                    indice=indice, status='invalido', detalhe=AtletaController._detalhe_validacao(exc)
+                )
+                continue
+            
+            if atleta_in.cpf in candidatos:
+                resultados[indice] = AtletaBulkResultOut(
+                    indice=indice,
+                    status='conflito',
+                    detalhe=f'CPF {atleta_in.cpf} repetido no lote (linha {candidatos[atleta_in.cpf]})'
+                )
+                continue
+            
+            erro = await AtletaController._validar_relacoes(db_session, atleta_in)
+            if erro:
+                resultados[indice] = AtletaBulkResultOut(indice=indice, status='invalido', detalhe=erro)
+                continue
+            
+            validados[indice] = atleta_in
+            candidatos[atleta_in.cpf] = indice
+        
+        inseridos = {}
+        if candidatos:
+            # Um único INSERT ... ON CONFLICT DO NOTHING RETURNING para todo o lote
+            created_at = datetime.utcnow()
+            statement = insert_ignoring_conflicts(
+                db_session.get_bind().dialect.name, AtletaModel.__table__, 'cpf'
+            ).returning(*AtletaModel.__table__.c)
+            result = await db_session.execute(
+                statement,
+                [
+                    dict(created_at=created_at, updated_at=created_at, **validados[indice].model_dump())
+                    for indice in candidatos.values()
+                ]
             )
+            inseridos = {row.cpf: row for row in result}
+            await AtletaStatsController.registrar(db_session, adicionados=[row._mapping for row in inseridos.values()])
+            await db_session.commit()
         
-        return atleta_out
+        for cpf, indice in candidatos.items():
+            row = inseridos.get(cpf)
+            if row is None:
+                resultados[indice] = AtletaBulkResultOut(
+                    indice=indice,
+                    status='conflito',
+                    detalhe=f'Já existe um atleta cadastrado com o cpf: {cpf}'
+                )
+            else:
+                resultados[indice] = AtletaBulkResultOut.model_construct(
+                    indice=indice,
+                    status='criado',
+                    detalhe=None,
+                    atleta=await AtletaController._atleta_out(db_session, row)
+                )
+        
+        return AtletaBulkOut(
+            criados=len(inseridos),
+            rejeitados=len(atletas_in) - len(inseridos),
+            resultados=resultados
+        )
     
     @staticmethod
-    async def get_all(
-        db_session: AsyncSession,
+    async def import_csv(db_session: AsyncSession, arquivo: BinaryIO, batch_size: int = 1000) -> AtletaImportOut:
+        dialect = db_session.get_bind().dialect.name
+        importados = rejeitados = 0
+        erros: list[AtletaImportErroOut] = []
+        
+        def rejeitar(linha: int, cpf: Optional[str], detalhe: str) -> None:
+            nonlocal rejeitados
+            rejeitados += 1
+            if len(erros) < IMPORT_MAX_ERROS:
+                erros.append(AtletaImportErroOut(linha=linha, cpf=cpf, detalhe=detalhe))
+        
+        for lote in iter_csv_batches(arquivo, IMPORT_COLUMNS, batch_size):
+            validos: dict[str, tuple[int, AtletaIn]] = {}
+            
+            for linha, valores in lote:
+                if valores is None:
+                    rejeitar(linha, None, 'Linha com bytes que não são UTF-8')
+                    continue
+                
+                try:
+                    atleta_in = AtletaIn.model_validate(valores)
+                except ValidationError as exc:
+                    rejeitar(linha, valores['cpf'] or None, AtletaController._detalhe_validacao(exc))
+                    continue
+                
+                if atleta_in.cpf in validos:
+                    rejeitar(linha, atleta_in.cpf, f'CPF {atleta_in.cpf} repetido no arquivo (linha {validos[atleta_in.cpf][0]})')
+                    continue
+                
+                erro = await AtletaController._validar_relacoes(db_session, atleta_in)
+                if erro:
+                    rejeitar(linha, atleta_in.cpf, erro)
+                    continue
+                
+                validos[atleta_in.cpf] = (linha, atleta_in)
+            
+            if not validos:
+                continue
+            
+            atletas_in = [atleta_in for _, atleta_in in validos.values()]
+            if dialect == 'postgresql':
+                inseridos = await AtletaController._import_copy(db_session, atletas_in)
+            else:
+                inseridos = await AtletaController._import_executemany(db_session, dialect, atletas_in)
+            await AtletaStatsController.registrar(db_session, adicionados=inseridos.values())
+            # Um commit por lote: importações grandes não seguram uma transação longa
+            await db_session.commit()
+            
+            importados += len(inseridos)
+            for cpf, (linha, _) in validos.items():
+                if cpf not in inseridos:
+                    rejeitar(linha, cpf, f'Já existe um atleta cadastrado com o cpf: {cpf}')
+        
+        return AtletaImportOut(
+            importados=importados,
+            rejeitados=rejeitados,
+            erros=sorted(erros, key=lambda erro: erro.linha),
+            erros_truncados=rejeitados > len(erros)
+        )
+    
+    @staticmethod
+    async def _import_copy(db_session: AsyncSession, atletas_in: list[AtletaIn]) -> dict:
+        # COPY para o staging e merge com INSERT ... SELECT ... ON CONFLICT DO NOTHING
+        await db_session.execute(text(ATLETAS_IMPORT_DDL))
+        await copy_records(
+            db_session,
+            'atletas_import',
+            IMPORT_COLUMNS,
+            [tuple(getattr(atleta_in, name) for name in IMPORT_COLUMNS) for atleta_in in atletas_in]
+        )
+        
+        created_at = datetime.utcnow()
+        statement = insert_ignoring_conflicts('postgresql', AtletaModel.__table__, 'cpf').from_select(
+            [*IMPORT_COLUMNS, 'created_at', 'updated_at'],
+            select(
+                *atletas_import.c,
+                literal(created_at).label('created_at'),
+                literal(created_at).label('updated_at')
+            )
+        ).returning(*AtletaModel.__table__.c)
+        result = await db_session.execute(statement)
+        
+        return {row.cpf: row._mapping for row in result}
+    
+    @staticmethod
+    async def _import_executemany(db_session: AsyncSession, dialect: str, atletas_in: list[AtletaIn]) -> dict:
+        created_at = datetime.utcnow()
+        statement = insert_ignoring_conflicts(dialect, AtletaModel.__table__, 'cpf').returning(*AtletaModel.__table__.c)
+        result = await db_session.execute(
+            statement,
+            [dict(created_at=created_at, updated_at=created_at, **atleta_in.model_dump()) for atleta_in in atletas_in]
+        )
+        
+        return {row.cpf: row._mapping for row in result}
+    
+    @staticmethod
+    def _filtrar(
+        statement,
+        dialect: str,
         nome: str = None,
-        cpf: str = None
-    ) -> Page[AtletaListOut]:
-        statement = select(AtletaModel)
+        cpf: str = None,
+        busca: str = 'contem',
+        categoria_id: int = None,
+        centro_treinamento_id: int = None,
+        sexo: str = None,
+        idade_min: int = None,
+        idade_max: int = None,
+        criado_desde: datetime = None,
+        criado_ate: datetime = None
+    ):
+        if idade_min is not None and idade_max is not None and idade_min > idade_max:
+            raise HTTPException(status_code=400, detail='idade_min deve ser menor ou igual a idade_max')
+        if criado_desde and criado_ate and criado_desde > criado_ate:
+            raise HTTPException(status_code=400, detail='criado_desde deve ser anterior a criado_ate')
         
         if nome:
-            statement = statement.filter(AtletaModel.nome.ilike(f'%{nome}%'))
+            statement = statement.filter(nome_filter(dialect, nome, aproximada=busca == 'aproximada'))
         if cpf:
             statement = statement.filter(AtletaModel.cpf == cpf)
+        # Cobertos pelos índices ix_atletas_centro_nome_pk_id, ix_atletas_categoria_nome_pk_id,
+        # ix_atletas_sexo_idade e ix_atletas_created_at
+        if centro_treinamento_id is not None:
+            statement = statement.filter(AtletaModel.centro_treinamento_id == centro_treinamento_id)
+        if categoria_id is not None:
+            statement = statement.filter(AtletaModel.categoria_id == categoria_id)
+        if sexo:
+            statement = statement.filter(AtletaModel.sexo == sexo)
+        if idade_min is not None:
+            statement = statement.filter(AtletaModel.idade >= idade_min)
+        if idade_max is not None:
+            statement = statement.filter(AtletaModel.idade <= idade_max)
+        if criado_desde:
+            statement = statement.filter(AtletaModel.created_at >= criado_desde)
+        if criado_ate:
+            statement = statement.filter(AtletaModel.created_at <= criado_ate)
+        
+        return statement
+    
+    @staticmethod
+    def _listagem_statement(campos: Optional[frozenset[str]] = None):
+        # Apenas as colunas de AtletaListOut; categoria e centro vêm do cache de referência.
+        # pk_id e nome formam a chave do cursor e updated_at compõe o ETag
+        columns = [AtletaModel.pk_id, AtletaModel.nome, AtletaModel.updated_at]
+        if campos is None or 'categoria' in campos:
+            columns.append(AtletaModel.categoria_id)
+        if campos is None or 'centro_treinamento' in campos:
+            columns.append(AtletaModel.centro_treinamento_id)
         
-        # Paginação com fastapi-pagination
-        result = await paginate(db_session, statement)
-        
-        # Customizar os items retornados para incluir apenas nome, centro_treinamento, categoria
-        custom_items = [
-            AtletaListOut(
-                nome=atleta.nome,
-                centro_treinamento=atleta.centro_treinamento,
-                categoria=atleta.categoria
-            ) 
-            for atleta in result.items
-        ]
-        
-        # Retorna página com items customizados
-        return Page.create(
-            items=custom_items,
-            total=result.total,
-            params=result.__params__
+        return select(*columns)
+    
+    @staticmethod
+    async def _listagem_out(db_session: AsyncSession, row, campos: Optional[frozenset[str]] = None) -> AtletaListOut:
+        if campos is None:
+            return AtletaListOut.model_construct(
+                nome=row.nome,
+                categoria=await reference_cache.categorias.get(db_session, row.categoria_id),
+                centro_treinamento=await reference_cache.centros_treinamento.get(db_session, row.centro_treinamento_id)
+            )
+        
+        return partial_model(AtletaListOut, campos).model_construct(
+            **await AtletaController._campos_out(db_session, row._mapping, campos)
+        )
+    
+    @staticmethod
+    async def _campos_out(db_session: AsyncSession, values, campos: frozenset[str]) -> dict:
+        # Relações só são resolvidas quando pedidas
+        out = {}
+        for campo in campos:
+            if campo == 'categoria':
+                out[campo] = await reference_cache.categorias.get(db_session, values['categoria_id'])
+            elif campo == 'centro_treinamento':
+                out[campo] = await reference_cache.centros_treinamento.get(db_session, values['centro_treinamento_id'])
+            else:
+                out[campo] = values[campo]
+        return out
+    
+    @staticmethod
+    def _listagem_etag(rows, *page) -> str:
+        # Versão da página: linhas (pk_id, updated_at) + metadados; categoria e centro não mudam após criados
+        return make_etag(AtletaModel.__tablename__, page, [(row.pk_id, row.updated_at) for row in rows])
+    
+    @staticmethod
+    async def _atleta_out(db_session: AsyncSession, row) -> AtletaOut:
+        return AtletaOut.model_construct(
+            **row._mapping,
+            categoria=await reference_cache.categorias.get(db_session, row.categoria_id),
+            centro_treinamento=await reference_cache.centros_treinamento.get(db_session, row.centro_treinamento_id)
         )
     
     @staticmethod
-    async def get_by_id(db_session: AsyncSession, id: int) -> AtletaOut:
-        statement = select(AtletaModel).filter(AtletaModel.pk_id == id)
+    async def get_all(
+        db_session: AsyncSession,
+        nome: str = None,
+        cpf: str = None,
+        paginacao: str = 'offset',
+        cursor: str = None,
+        contagem: str = None,
+        busca: str = 'contem',
+        ordenar: str = None,
+        fields: str = None,
+        condicional: ConditionalRequest = None,
+        **filtros
+    ) -> PageOut[AtletaListOut]:
+        campos = parse_fields(fields, AtletaListOut)
+        dialect = db_session.get_bind().dialect.name
+        filtros.update(dialect=dialect, nome=nome, cpf=cpf, busca=busca)
+        statement = AtletaController._filtrar(AtletaController._listagem_statement(campos), **filtros)
+        count_statement = AtletaController._filtrar(select(AtletaModel.pk_id), **filtros)
+        
+        if paginacao == 'cursor' or cursor:
+            if ordenar == 'relevancia':
+                raise HTTPException(
+                    status_code=400,
+                    detail='Ordenação por relevância não é suportada na paginação por cursor'
+                )
+            return await AtletaController._get_page_cursor(
+                db_session, statement, count_statement, cursor,
+                contagem=contagem or 'nenhuma',
+                campos=campos,
+                condicional=condicional
+            )
+        
+        if ordenar == 'relevancia' and nome:
+            statement = statement.order_by(nome_rank(dialect, nome, aproximada=busca == 'aproximada'), AtletaModel.pk_id)
+        elif ordenar:
+            statement = statement.order_by(AtletaModel.nome, AtletaModel.pk_id)
+        
+        contagem = contagem or 'exata'
+        params = resolve_params()
+        total = await AtletaController._contar(db_session, count_statement, contagem)
+        
+        result = await db_session.execute(paginate_query(statement, params))
+        rows = result.all()
+        
+        if condicional:
+            condicional.check(AtletaController._listagem_etag(
+                rows, total, contagem, params.page, params.size, sorted(campos or ())
+            ))
+        
+        item_model = partial_model(AtletaListOut, campos) if campos else AtletaListOut
+        return PageOut[item_model].create(
+            items=[await AtletaController._listagem_out(db_session, row, campos) for row in rows],
+            params=params,
+            total=total,
+            contagem=contagem
+        )
+    
+    @staticmethod
+    async def _contar(db_session: AsyncSession, statement, contagem: str) -> Optional[int]:
+        if contagem == 'exata':
+            return await exact_count(db_session, statement)
+        if contagem == 'estimada':
+            return await estimated_count(db_session, statement)
+        
+        return None
+    
+    @staticmethod
+    async def _get_page_cursor(
+        db_session: AsyncSession,
+        statement,
+        count_statement,
+        cursor: str = None,
+        contagem: str = 'nenhuma',
+        campos: Optional[frozenset[str]] = None,
+        condicional: ConditionalRequest = None
+    ) -> PageOut[AtletaListOut]:
+        # Paginação por keyset em (nome, pk_id): o custo de qualquer página é o mesmo da primeira
+        size = resolve_params().size
+        total = await AtletaController._contar(db_session, count_statement, contagem)
+        statement = statement.order_by(AtletaModel.nome, AtletaModel.pk_id).limit(size + 1)
+        
+        if cursor:
+            nome, pk_id = decode_cursor(cursor, types=(str, int))
+            statement = statement.filter(tuple_(AtletaModel.nome, AtletaModel.pk_id) > tuple_(nome, pk_id))
+        
         result = await db_session.execute(statement)
-        atleta = result.scalar_one_or_none()
+        rows = result.all()
         
-        if not atleta:
-            raise HTTPException(status_code=404, detail=f'Atleta com id {id} não encontrado')
+        next_cursor = None
+        if len(rows) > size:
+            rows = rows[:size]
+            next_cursor = encode_cursor(rows[-1].nome, rows[-1].pk_id)
+        
+        if condicional:
+            condicional.check(AtletaController._listagem_etag(
+                rows, total, contagem, next_cursor, size, sorted(campos or ())
+            ))
+        
+        item_model = partial_model(AtletaListOut, campos) if campos else AtletaListOut
+        return PageOut[item_model](
+            items=[await AtletaController._listagem_out(db_session, row, campos) for row in rows],
+            total=total,
+            page=None,
+            size=size,
+            next_cursor=next_cursor,
+            contagem=contagem
+        )
+    
+    @staticmethod
+    async def export(
+        db_session: AsyncSession,
+        nome: str = None,
+        cpf: str = None,
+        busca: str = 'contem',
+        partition_size: int = 500,
+        **filtros
+    ) -> AsyncIterator[list[AtletaOut]]:
+        dialect = db_session.get_bind().dialect.name
+        statement = AtletaController._filtrar(
+            select(*AtletaModel.__table__.c), dialect=dialect, nome=nome, cpf=cpf, busca=busca, **filtros
+        ).order_by(AtletaModel.pk_id)
+        
+        # Cursor do lado do servidor: só uma partição de linhas fica em memória por vez
+        result = await db_session.stream(statement.execution_options(yield_per=partition_size))
+        async for rows in result.partitions():
+            yield [await AtletaController._atleta_out(db_session, row) for row in rows]
+    
+    @staticmethod
+    async def get_by_id(
+        db_session: AsyncSession, id: int, fields: str = None, condicional: ConditionalRequest = None
+    ) -> AtletaOut:
+        campos = parse_fields(fields, AtletaOut)
+        cached = await entity_cache.get(AtletaModel.__tablename__, id, AtletaOut)
+        values = None
+        if cached:
+            etag, atleta_out = cached
+            if campos:
+                values = {campo: getattr(atleta_out, campo) for campo in campos}
+        else:
+            # Lida antes da consulta: uma invalidação concorrente impede gravar o valor velho
+            generation = entity_cache.generation(AtletaModel.__tablename__, id)
+            statement = select(*AtletaController._atleta_columns(campos)).filter(AtletaModel.pk_id == id)
+            # O atleta completo vai para o cache: lê do primário para não guardar o atraso de uma réplica
+            result = await db_session.execute(statement, execution_options={'read_primary': not campos})
+            row = result.one_or_none()
+            
+            if not row:
+                raise HTTPException(status_code=404, detail=f'Atleta com id {id} não encontrado')
+            
+            etag = make_etag(AtletaModel.__tablename__, row.pk_id, row.updated_at)
+            if campos:
+                # Leitura parcial não alimenta o cache, que guarda o atleta completo
+                values = await AtletaController._campos_out(db_session, row._mapping, campos)
+            else:
+                atleta_out = await AtletaController._atleta_out(db_session, row)
+                await entity_cache.set(AtletaModel.__tablename__, id, atleta_out, etag, generation)
+        
+        if campos:
+            etag = make_etag(etag, sorted(campos))
+        
+        if condicional:
+            condicional.check(etag)
+        
+        if campos:
+            return partial_model(AtletaOut, campos).model_construct(**values)
+        
+        return atleta_out
+    
+    @staticmethod
+    def _atleta_columns(campos: Optional[frozenset[str]] = None) -> list:
+        if campos is None:
+            return list(AtletaModel.__table__.c)
+        
+        # pk_id e updated_at compõem o ETag; as relações precisam apenas da chave estrangeira
+        nomes = {'pk_id', 'updated_at'} | (campos & set(AtletaModel.__table__.c.keys()))
+        if 'categoria' in campos:
+            nomes.add('categoria_id')
+        if 'centro_treinamento' in campos:
+            nomes.add('centro_treinamento_id')
+        
+        return [column for column in AtletaModel.__table__.c if column.key in nomes]
+    
+    @staticmethod
+    async def get_batch(
+        db_session: AsyncSession, ids: list[int], condicional: ConditionalRequest = None
+    ) -> AtletaBatchOut:
+        ids = list(dict.fromkeys(ids))
+        if len(ids) > BATCH_MAX_IDS:
+            raise HTTPException(status_code=400, detail=f'Informe no máximo {BATCH_MAX_IDS} ids')
+        
+        dialect = db_session.get_bind().dialect.name
+        statement = select(*AtletaModel.__table__.c).filter(any_of(dialect, AtletaModel.pk_id, ids))
+        result = await db_session.execute(statement)
+        rows = {row.pk_id: row for row in result}
         
-        return atleta
+        if condicional:
+            condicional.check(make_etag(
+                AtletaModel.__tablename__, ids, [(id, rows[id].updated_at) for id in ids if id in rows]
+            ))
+        
+        return AtletaBatchOut.model_construct(
+            atletas=[await AtletaController._atleta_out(db_session, rows[id]) for id in ids if id in rows],
+            nao_encontrados=[id for id in ids if id not in rows]
+        )
     
     @staticmethod
     async def update(db_session: AsyncSession, id: int, atleta_update: AtletaUpdate) -> AtletaOut:
-        statement = select(AtletaModel).filter(AtletaModel.pk_id == id)
+        # UPDATE ... RETURNING: a linha atualizada volta na mesma ida ao banco
+        values = atleta_update.model_dump(exclude_unset=True)
+        statement = (
+            update(AtletaModel.__table__)
+            .where(AtletaModel.pk_id == id)
+            .values(updated_at=datetime.utcnow(), **values)
+            .returning(*AtletaModel.__table__.c)
+        )
+        
+        # A idade anterior corrige as estatísticas; no PostgreSQL vem do próprio UPDATE ... FROM
+        idade_anterior = None
+        if 'idade' in values:
+            if db_session.get_bind().dialect.name == 'postgresql':
+                anterior = (
+                    select(AtletaModel.pk_id, AtletaModel.idade)
+                    .filter(AtletaModel.pk_id == id)
+                    .with_for_update()
+                    .subquery('anterior')
+                )
+                statement = (
+                    statement.where(AtletaModel.pk_id == anterior.c.pk_id)
+                    .returning(anterior.c.idade.label('idade_anterior'))
+                )
+            else:
+                idade_anterior = await db_session.scalar(select(AtletaModel.idade).filter(AtletaModel.pk_id == id))
+        
         result = await db_session.execute(statement)
-        atleta = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if not atleta:
+        if not row:
+            await db_session.rollback()
             raise HTTPException(status_code=404, detail=f'Atleta com id {id} não encontrado')
         
-        atleta_data = atleta_update.model_dump(exclude_unset=True)
-        for key, value in atleta_data.items():
-            setattr(atleta, key, value)
+        idade_anterior = row._mapping.get('idade_anterior', idade_anterior)
+        if idade_anterior is not None and idade_anterior != row.idade:
+            await AtletaStatsController.registrar(
+                db_session, adicionados=[row._mapping], removidos=[{**row._mapping, 'idade': idade_anterior}]
+            )
         
         await db_session.commit()
-        await db_session.refresh(atleta)
+        await entity_cache.invalidate(AtletaModel.__tablename__, id)
         
-        return atleta
+        return await AtletaController._atleta_out(db_session, row)
     
     @staticmethod
     async def delete(db_session: AsyncSession, id: int) -> None:
-        statement = select(AtletaModel).filter(AtletaModel.pk_id == id)
+        statement = delete(AtletaModel.__table__).where(AtletaModel.pk_id == id).returning(*AtletaModel.__table__.c)
         result = await db_session.execute(statement)
-        atleta = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if not atleta:
+        if row is None:
+            await db_session.rollback()
             raise HTTPException(status_code=404, detail=f'Atleta com id {id} não encontrado')
         
-        await db_session.delete(atleta)
-        await db_session.commit() 
\ No newline at end of file
+        await AtletaStatsController.registrar(db_session, removidos=[row._mapping])
+        await db_session.commit()
+        await entity_cache.invalidate(AtletaModel.__tablename__, id) 
\ No newline at end of file
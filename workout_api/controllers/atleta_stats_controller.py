@@ -0,0 +1,185 @@
+import math
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import accumulate
+from typing import Iterable, Mapping
+from sqlalchemy import Integer, String, cast, delete, func, insert, literal, text, union_all
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from workout_api.core.bulk import upsert_adding
+from workout_api.core.reference_cache import reference_cache
+from workout_api.models.atleta_model import AtletaModel
+from workout_api.models.atleta_estatistica_model import AtletaEstatisticaModel, AtletaHistogramaModel
+from workout_api.schemas.atleta_schema import AtletaContagemOut, AtletaMedidaOut, AtletaStatsOut
+
+# Escala do bucket de cada medida do histograma: idade em anos, peso em kg, altura em cm
+HISTOGRAMAS = {'idade': 1, 'peso': 1, 'altura': 100}
+PERCENTIS = (50, 90, 99)
+SOMAS = {'idade': 'soma_idade', 'peso': 'soma_peso', 'altura': 'soma_altura'}
+
+def _bucket(valor: float, escala: int) -> int:
+    # Bucket mais próximo; a mesma conta é feita em SQL no recálculo
+    return math.floor(valor * escala + 0.5)
+
+def _bucket_sql(dialect: str, column, escala: int):
+    valor = column * escala + 0.5
+    if dialect == 'postgresql':
+        return cast(func.floor(valor), Integer)
+    # Valores positivos: CAST trunca, o mesmo que floor
+    return cast(valor, Integer)
+
+def _dimensoes(atleta: Mapping) -> list[tuple[str, str]]:
+    # Sem linha de total: toda escrita atualizaria a mesma linha. O total sai da soma por sexo
+    return [
+        ('categoria', str(atleta['categoria_id'])),
+        ('centro_treinamento', str(atleta['centro_treinamento_id'])),
+        ('sexo', atleta['sexo'])
+    ]
+
+class AtletaStatsController:
+
+    @staticmethod
+    async def registrar(
+        db_session: AsyncSession, adicionados: Iterable[Mapping] = (), removidos: Iterable[Mapping] = ()
+    ) -> None:
+        # Aplica na mesma transação da escrita o efeito das linhas adicionadas e removidas
+        resumo = defaultdict(lambda: [0, 0.0, 0.0, 0])
+        histograma = defaultdict(int)
+        
+        for sinal, atletas in ((1, adicionados), (-1, removidos)):
+            for atleta in atletas:
+                for dimensao in _dimensoes(atleta):
+                    delta = resumo[dimensao]
+                    delta[0] += sinal
+                    delta[1] += sinal * atleta['peso']
+                    delta[2] += sinal * atleta['altura']
+                    delta[3] += sinal * atleta['idade']
+                for medida, escala in HISTOGRAMAS.items():
+                    histograma[(medida, _bucket(atleta[medida], escala))] += sinal
+        
+        dialect = db_session.get_bind().dialect.name
+        # Ordem fixa das chaves: transações concorrentes travam as linhas na mesma ordem
+        resumo_params = [
+            dict(dimensao=dimensao, chave=chave, contagem=delta[0], soma_peso=delta[1], soma_altura=delta[2], soma_idade=delta[3])
+            for (dimensao, chave), delta in sorted(resumo.items()) if any(delta)
+        ]
+        if resumo_params:
+            await db_session.execute(
+                upsert_adding(
+                    dialect,
+                    AtletaEstatisticaModel.__table__,
+                    ('dimensao', 'chave'),
+                    ('contagem', 'soma_peso', 'soma_altura', 'soma_idade')
+                ),
+                resumo_params
+            )
+        
+        histograma_params = [
+            dict(medida=medida, bucket=bucket, contagem=contagem)
+            for (medida, bucket), contagem in sorted(histograma.items()) if contagem
+        ]
+        if histograma_params:
+            await db_session.execute(
+                upsert_adding(dialect, AtletaHistogramaModel.__table__, ('medida', 'bucket'), ('contagem',)),
+                histograma_params
+            )
+    
+    @staticmethod
+    async def get(db_session: AsyncSession) -> AtletaStatsOut:
+        result = await db_session.execute(
+            select(*AtletaEstatisticaModel.__table__.c).filter(AtletaEstatisticaModel.contagem > 0)
+        )
+        resumo = defaultdict(dict)
+        for row in result:
+            resumo[row.dimensao][row.chave] = row
+        
+        result = await db_session.execute(
+            select(*AtletaHistogramaModel.__table__.c)
+            .filter(AtletaHistogramaModel.contagem > 0)
+            .order_by(AtletaHistogramaModel.medida, AtletaHistogramaModel.bucket)
+        )
+        histogramas = defaultdict(list)
+        for row in result:
+            histogramas[row.medida].append((row.bucket, row.contagem))
+        
+        # Todo atleta tem um sexo: a soma das linhas por sexo é o total
+        total = sum(row.contagem for row in resumo['sexo'].values())
+        
+        def soma(coluna: str) -> float:
+            return sum(getattr(row, coluna) for row in resumo['sexo'].values())
+        
+        async def contagens(dimensao: str, table) -> list[AtletaContagemOut]:
+            contagens = []
+            for chave, row in sorted(resumo[dimensao].items(), key=lambda item: int(item[0])):
+                item = await table.get(db_session, int(chave))
+                contagens.append(AtletaContagemOut(id=int(chave), nome=item.nome if item else None, total=row.contagem))
+            return contagens
+        
+        def medida(nome: str) -> AtletaMedidaOut:
+            if not total:
+                return AtletaMedidaOut()
+            
+            buckets = histogramas[nome]
+            acumulados = list(accumulate(contagem for _, contagem in buckets))
+            percentis = {}
+            for percentil in PERCENTIS:
+                indice = bisect_left(acumulados, math.ceil(percentil / 100 * total))
+                if buckets:
+                    percentis[f'p{percentil}'] = buckets[min(indice, len(buckets) - 1)][0] / HISTOGRAMAS[nome]
+            
+            return AtletaMedidaOut(media=round(soma(SOMAS[nome]) / total, 2), **percentis)
+        
+        return AtletaStatsOut(
+            total=total,
+            por_categoria=await contagens('categoria', reference_cache.categorias),
+            por_centro_treinamento=await contagens('centro_treinamento', reference_cache.centros_treinamento),
+            por_sexo={chave: row.contagem for chave, row in sorted(resumo['sexo'].items())},
+            idade=medida('idade'),
+            peso=medida('peso'),
+            altura=medida('altura')
+        )
+    
+    @staticmethod
+    async def recompute(db_session: AsyncSession) -> AtletaStatsOut:
+        dialect = db_session.get_bind().dialect.name
+        atletas = AtletaModel.__table__
+        
+        if dialect == 'postgresql':
+            # Bloqueia escritas em atletas até o commit, para nenhuma delas se perder no recálculo
+            await db_session.execute(text('LOCK TABLE atletas IN SHARE MODE'))
+        
+        await db_session.execute(delete(AtletaEstatisticaModel.__table__))
+        await db_session.execute(delete(AtletaHistogramaModel.__table__))
+        
+        agregados = (
+            func.count(),
+            func.coalesce(func.sum(atletas.c.peso), 0),
+            func.coalesce(func.sum(atletas.c.altura), 0),
+            func.coalesce(func.sum(atletas.c.idade), 0)
+        )
+        dimensoes = [
+            select(literal(dimensao), cast(atletas.c[column], String), *agregados).group_by(atletas.c[column])
+            for dimensao, column in (
+                ('categoria', 'categoria_id'),
+                ('centro_treinamento', 'centro_treinamento_id'),
+                ('sexo', 'sexo')
+            )
+        ]
+        await db_session.execute(
+            insert(AtletaEstatisticaModel.__table__).from_select(
+                ['dimensao', 'chave', 'contagem', 'soma_peso', 'soma_altura', 'soma_idade'],
+                union_all(*dimensoes)
+            )
+        )
+        
+        buckets = []
+        for nome, escala in HISTOGRAMAS.items():
+            bucket = _bucket_sql(dialect, atletas.c[nome], escala)
+            buckets.append(select(literal(nome), bucket, func.count()).group_by(bucket))
+        await db_session.execute(
+            insert(AtletaHistogramaModel.__table__).from_select(['medida', 'bucket', 'contagem'], union_all(*buckets))
+        )
+        
+        await db_session.commit()
+        
+        return await AtletaStatsController.get(db_session)
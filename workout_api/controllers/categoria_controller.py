@@ -1,7 +1,9 @@
 from fastapi import HTTPException
-from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from workout_api.core.entity_cache import entity_cache
+from workout_api.core.etag import ConditionalRequest, make_etag
+from workout_api.core.reference_cache import reference_cache
 from workout_api.models.categoria_model import CategoriaModel
 from workout_api.schemas.categoria_schema import CategoriaIn, CategoriaOut
 
@@ -22,21 +24,28 @@ class CategoriaController:
                 detail=f'Já existe uma categoria cadastrada com o nome: {categoria_in.nome}'
             )
         
+        # Invalida o cache de referência neste e nos demais workers
+        await entity_cache.invalidate(CategoriaModel.__tablename__)
+        
         return categoria_out
     
     @staticmethod
-    async def get_all(db_session: AsyncSession) -> list[CategoriaOut]:
-        statement = select(CategoriaModel)
-        result = await db_session.execute(statement)
-        return result.scalars().all()
+    async def get_all(db_session: AsyncSession, condicional: ConditionalRequest = None) -> list[CategoriaOut]:
+        if condicional:
+            etag = await reference_cache.categorias.get_etag(db_session)
+            if etag:
+                condicional.check(etag)
+        
+        return await reference_cache.categorias.get_all(db_session)
     
     @staticmethod
-    async def get_by_id(db_session: AsyncSession, id: int) -> CategoriaOut:
-        statement = select(CategoriaModel).filter(CategoriaModel.pk_id == id)
-        result = await db_session.execute(statement)
-        categoria = result.scalar_one_or_none()
+    async def get_by_id(db_session: AsyncSession, id: int, condicional: ConditionalRequest = None) -> CategoriaOut:
+        categoria = await reference_cache.categorias.get(db_session, id)
         
         if not categoria:
             raise HTTPException(status_code=404, detail=f'Categoria com id {id} não encontrada')
         
+        if condicional:
+            condicional.check(make_etag(CategoriaModel.__tablename__, categoria.model_dump()))
+        
         return categoria 
\ No newline at end of file
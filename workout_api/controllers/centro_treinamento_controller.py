@@ -1,7 +1,9 @@
 from fastapi import HTTPException
-from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from workout_api.core.entity_cache import entity_cache
+from workout_api.core.etag import ConditionalRequest, make_etag
+from workout_api.core.reference_cache import reference_cache
 from workout_api.models.centro_treinamento_model import CentroTreinamentoModel
 from workout_api.schemas.centro_treinamento_schema import CentroTreinamentoIn, CentroTreinamentoOut
 
@@ -22,21 +24,28 @@ class CentroTreinamentoController:
                 detail=f'Já existe um centro de treinamento cadastrado com o nome: {centro_in.nome}'
             )
         
+        # Invalida o cache de referência neste e nos demais workers
+        await entity_cache.invalidate(CentroTreinamentoModel.__tablename__)
+        
         return centro_out
     
     @staticmethod
-    async def get_all(db_session: AsyncSession) -> list[CentroTreinamentoOut]:
-        statement = select(CentroTreinamentoModel)
-        result = await db_session.execute(statement)
-        return result.scalars().all()
+    async def get_all(db_session: AsyncSession, condicional: ConditionalRequest = None) -> list[CentroTreinamentoOut]:
+        if condicional:
+            etag = await reference_cache.centros_treinamento.get_etag(db_session)
+            if etag:
+                condicional.check(etag)
+        
+        return await reference_cache.centros_treinamento.get_all(db_session)
     
     @staticmethod
-    async def get_by_id(db_session: AsyncSession, id: int) -> CentroTreinamentoOut:
-        statement = select(CentroTreinamentoModel).filter(CentroTreinamentoModel.pk_id == id)
-        result = await db_session.execute(statement)
-        centro = result.scalar_one_or_none()
+    async def get_by_id(db_session: AsyncSession, id: int, condicional: ConditionalRequest = None) -> CentroTreinamentoOut:
+        centro = await reference_cache.centros_treinamento.get(db_session, id)
         
         if not centro:
             raise HTTPException(status_code=404, detail=f'Centro de treinamento com id {id} não encontrado')
         
+        if condicional:
+            condicional.check(make_etag(CentroTreinamentoModel.__tablename__, centro.model_dump()))
+        
         return centro 
\ No newline at end of file
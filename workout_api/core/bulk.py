@@ -0,0 +1,84 @@
+import codecs
+import csv
+import re
+from typing import BinaryIO, Iterator, Optional, Sequence
+from fastapi import HTTPException
+from sqlalchemy import Integer, any_, literal
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Surrogates produzidos pelo errors='surrogateescape' para bytes que não são UTF-8
+UNDECODABLE = re.compile('[\udc80-\udcff]')
+
+
+def insert_ignoring_conflicts(dialect: str, table, *index_elements):
+    # INSERT ... ON CONFLICT DO NOTHING: linhas em conflito são puladas sem abortar o lote
+    if dialect == 'postgresql':
+        return postgresql.insert(table).on_conflict_do_nothing(index_elements=index_elements)
+    if dialect == 'sqlite':
+        return sqlite.insert(table).on_conflict_do_nothing(index_elements=index_elements)
+    
+    raise NotImplementedError(f'INSERT com ON CONFLICT não suportado no dialeto {dialect}')
+
+
+def upsert_adding(dialect: str, table, index_elements: Sequence[str], columns: Sequence[str]):
+    # INSERT ... ON CONFLICT DO UPDATE somando os valores enviados aos já gravados
+    if dialect == 'postgresql':
+        statement = postgresql.insert(table)
+    elif dialect == 'sqlite':
+        statement = sqlite.insert(table)
+    else:
+        raise NotImplementedError(f'INSERT com ON CONFLICT não suportado no dialeto {dialect}')
+    
+    return statement.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={column: table.c[column] + statement.excluded[column] for column in columns}
+    )
+
+
+def any_of(dialect: str, column, values: list[int]):
+    # = ANY(:ids) envia a lista como um único array: o SQL não muda com a quantidade de ids
+    if dialect == 'postgresql':
+        return column == any_(literal(values, postgresql.ARRAY(Integer)))
+    
+    return column.in_(values)
+
+
+def iter_csv_batches(
+    arquivo: BinaryIO, columns: Sequence[str], batch_size: int
+) -> Iterator[list[tuple[int, Optional[dict]]]]:
+    # Lê o arquivo linha a linha: só um lote de linhas fica em memória por vez.
+    # surrogateescape: bytes que não são UTF-8 não interrompem a leitura; a linha chega como
+    # (linha, None) para ser rejeitada no relatório sem perder os lotes seguintes
+    reader = csv.DictReader(codecs.getreader('utf-8-sig')(arquivo, errors='surrogateescape'))
+    
+    faltando = [column for column in columns if column not in (reader.fieldnames or [])]
+    if faltando:
+        raise HTTPException(
+            status_code=400,
+            detail=f'Cabeçalho do CSV sem as colunas: {", ".join(faltando)}'
+        )
+    
+    lote = []
+    for row in reader:
+        values = {column: row[column] for column in columns}
+        if any(value and UNDECODABLE.search(value) for value in values.values()):
+            values = None
+        lote.append((reader.line_num, values))
+        if len(lote) == batch_size:
+            yield lote
+            lote = []
+    
+    if lote:
+        yield lote
+
+
+async def copy_records(
+    db_session: AsyncSession, table_name: str, columns: Sequence[str], records: list[tuple]
+) -> None:
+    # COPY ... FROM STDIN pelo protocolo binário do asyncpg, na conexão da sessão
+    connection = await db_session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table_name, records=records, columns=list(columns)
+    )
@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Espera entre tentativas de reassinar o canal de invalidação (dobra a cada falha)
+RECONNECT_MIN_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+
+
+class MemoryCacheBackend:
+    """LRU em memória do processo, com TTL por entrada e limite total em bytes."""
+    
+    local = True
+    
+    def __init__(self, ttl: int, max_bytes: int):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self.size += len(value)
+        
+        # Descarta as entradas menos usadas até caber no limite
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+    
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._remove(key)
+    
+    async def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+    
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+
+class RedisCacheBackend:
+    """Cache compartilhado entre workers em um servidor Redis; falhas viram cache miss."""
+    
+    local = False
+    
+    def __init__(self, client, ttl: int, prefix: str = 'workout:'):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.client.get(self.prefix + key)
+        except (redis.RedisError, OSError):
+            logger.warning('Falha ao ler do cache Redis', exc_info=True)
+            return None
+    
+    async def set(self, key: str, value: bytes) -> None:
+        try:
+            await self.client.set(self.prefix + key, value, ex=self.ttl)
+        except (redis.RedisError, OSError):
+            logger.warning('Falha ao gravar no cache Redis', exc_info=True)
+    
+    async def delete(self, *keys: str) -> None:
+        try:
+            await self.client.delete(*(self.prefix + key for key in keys))
+        except (redis.RedisError, OSError):
+            logger.warning('Falha ao remover do cache Redis', exc_info=True)
+    
+    async def clear(self) -> None:
+        try:
+            async for key in self.client.scan_iter(match=self.prefix + '*'):
+                await self.client.delete(key)
+        except (redis.RedisError, OSError):
+            logger.warning('Falha ao limpar o cache Redis', exc_info=True)
+
+
+class RedisBroadcast:
+    """Canal pub/sub do Redis usado para avisar todos os workers de uma invalidação."""
+    
+    def __init__(self, client, channel: str = 'workout:invalidate'):
+        self.client = client
+        self.channel = channel
+        self._task: Optional[asyncio.Task] = None
+    
+    async def publish(self, message: str) -> None:
+        try:
+            await self.client.publish(self.channel, message)
+        except (redis.RedisError, OSError):
+            logger.warning('Falha ao publicar invalidação no Redis', exc_info=True)
+    
+    async def start(
+        self,
+        handler: Callable[[str], Awaitable[None]],
+        on_reconnect: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> None:
+        # Redis fora do ar na inicialização não impede a aplicação de subir; a tarefa tenta de novo
+        pubsub = await self._subscribe()
+        self._task = asyncio.create_task(self._listen(pubsub, handler, on_reconnect))
+    
+    async def _subscribe(self):
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self.channel)
+            return pubsub
+        except (redis.RedisError, OSError):
+            logger.warning('Falha ao assinar o canal de invalidação do Redis', exc_info=True)
+            await self._close(pubsub)
+            return None
+    
+    @staticmethod
+    async def _close(pubsub) -> None:
+        try:
+            await pubsub.aclose()
+        except (redis.RedisError, OSError):
+            pass
+    
+    async def _listen(
+        self,
+        pubsub,
+        handler: Callable[[str], Awaitable[None]],
+        on_reconnect: Optional[Callable[[], Awaitable[None]]]
+    ) -> None:
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            if pubsub is None:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+                pubsub = await self._subscribe()
+                if pubsub is None:
+                    continue
+                
+                logger.warning('Canal de invalidação do Redis reassinado')
+                delay = RECONNECT_MIN_DELAY
+                # Invalidações publicadas enquanto o canal esteve fora foram perdidas
+                if on_reconnect is not None:
+                    await on_reconnect()
+            
+            try:
+                async for message in pubsub.listen():
+                    if message['type'] != 'message':
+                        continue
+                    try:
+                        await handler(message['data'].decode())
+                    except Exception:
+                        logger.exception('Falha ao aplicar invalidação recebida do Redis')
+            except (redis.RedisError, OSError):
+                logger.warning('Conexão com o canal de invalidação do Redis perdida; reconectando', exc_info=True)
+            finally:
+                await self._close(pubsub)
+            pubsub = None
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def redis_client(url: str):
+    if redis is None:
+        raise RuntimeError('REDIS_URL configurado, mas o pacote redis não está instalado')
+    return redis.from_url(url)
@@ -0,0 +1,15 @@
+import re
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+
+_SQLITE_UNIQUE = re.compile(r'UNIQUE constraint failed: (\S+)')
+
+
+def violated_constraint(exc: IntegrityError) -> Optional[str]:
+    # O asyncpg informa o nome da constraint; o SQLite só cita tabela.coluna na mensagem
+    constraint_name = getattr(getattr(exc.orig, '__cause__', None), 'constraint_name', None)
+    if constraint_name:
+        return constraint_name
+    
+    match = _SQLITE_UNIQUE.search(str(exc.orig))
+    return match.group(1) if match else None
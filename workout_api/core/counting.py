@@ -0,0 +1,86 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Optional
+from fastapi_pagination.ext.sqlalchemy import count_query
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncSession
+from workout_api.configs.database import settings
+
+
+class CountCache:
+    """Totais exatos reaproveitados por consulta até expirar o TTL.
+    
+    As chaves vêm dos filtros da query string; acima de max_entries sai a menos usada.
+    """
+    
+    def __init__(self, ttl: int, max_entries: int = 1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, int]] = OrderedDict()
+    
+    def get(self, key: str) -> Optional[int]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+    
+    def set(self, key: str, total: int) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, total)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+count_cache = CountCache(ttl=settings.COUNT_CACHE_TTL, max_entries=settings.COUNT_CACHE_MAX_ENTRIES)
+
+
+def _cache_key(statement) -> str:
+    compiled = statement.compile()
+    return f'{compiled}|{sorted(compiled.params.items())}'
+
+
+async def exact_count(db_session: AsyncSession, statement) -> int:
+    return await db_session.scalar(count_query(statement))
+
+
+def _explain_statement(statement, dialect: Dialect) -> tuple[str, object]:
+    """SQL do EXPLAIN e parâmetros no formato do driver; os valores dos filtros seguem como binds."""
+    compiled = statement.compile(dialect=dialect, compile_kwargs={'render_postcompile': True})
+    params = compiled.construct_params()
+    if compiled.positiontup:
+        params = tuple(params[name] for name in compiled.positiontup)
+    return f'EXPLAIN (FORMAT JSON) {compiled.string}', params
+
+
+async def _planner_estimate(db_session: AsyncSession, statement) -> Optional[int]:
+    # Estimativa do planejador do Postgres (pg_class.reltuples + estatísticas das colunas)
+    sql, params = _explain_statement(statement, db_session.get_bind().dialect)
+    connection = await db_session.connection()
+    result = await connection.exec_driver_sql(sql, params)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    
+    rows = plan[0]['Plan'].get('Plan Rows')
+    return int(rows) if rows is not None else None
+
+
+async def estimated_count(db_session: AsyncSession, statement) -> int:
+    if db_session.get_bind().dialect.name == 'postgresql':
+        estimate = await _planner_estimate(db_session, statement)
+        if estimate is not None:
+            return estimate
+    
+    key = _cache_key(statement)
+    total = count_cache.get(key)
+    if total is None:
+        total = await exact_count(db_session, statement)
+        count_cache.set(key, total)
+    
+    return total
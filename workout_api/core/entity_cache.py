@@ -0,0 +1,127 @@
+import logging
+from typing import Optional, Union
+from uuid import uuid4
+from pydantic import BaseModel
+from workout_api.configs.database import settings
+from workout_api.core.cache_backends import MemoryCacheBackend, RedisBroadcast, RedisCacheBackend, redis_client
+from workout_api.core.reference_cache import reference_cache
+from workout_api.core.serialization import get_adapter
+
+logger = logging.getLogger(__name__)
+
+# Contadores de geração por faixa de chaves: memória fixa; colisões só fazem um set ser descartado
+GENERATION_SLOTS = 4096
+
+
+class EntityCache:
+    """Cache de entidades por id com invalidação propagada a todos os workers.
+    
+    Cada entrada guarda o ETag e o JSON da entidade; invalidate() remove a chave e publica
+    a invalidação no canal de broadcast, que também descarta o cache de referência.
+    
+    Quem carrega do banco lê generation() antes da consulta e a repassa ao set(): se houve
+    invalidação no meio, o valor lido já pode estar velho e não é gravado.
+    """
+    
+    def __init__(self, backend, broadcast: Optional[RedisBroadcast] = None):
+        self.backend = backend
+        self.broadcast = broadcast
+        self.origin = uuid4().hex
+        self._epoch = 0
+        self._namespace_generations: dict[str, int] = {}
+        self._generations = [0] * GENERATION_SLOTS
+    
+    @staticmethod
+    def _key(namespace: str, id: Union[int, str]) -> str:
+        return f'{namespace}:{id}'
+    
+    @staticmethod
+    def _slot(key: str) -> int:
+        return hash(key) % GENERATION_SLOTS
+    
+    def generation(self, namespace: str, id: int) -> tuple[int, int, int]:
+        return (
+            self._epoch,
+            self._namespace_generations.get(namespace, 0),
+            self._generations[self._slot(self._key(namespace, id))]
+        )
+    
+    async def get(self, namespace: str, id: int, schema) -> Optional[tuple[str, BaseModel]]:
+        value = await self.backend.get(self._key(namespace, id))
+        if value is None:
+            return None
+        
+        etag, _, body = value.partition(b' ')
+        return etag.decode(), get_adapter(schema).validate_json(body)
+    
+    async def set(
+        self, namespace: str, id: int, item: BaseModel, etag: str, generation: Optional[tuple] = None
+    ) -> None:
+        if generation is not None and generation != self.generation(namespace, id):
+            return
+        
+        # ETag entre aspas, sem espaços: o primeiro espaço separa o ETag do JSON
+        body = get_adapter(type(item)).dump_json(item)
+        await self.backend.set(self._key(namespace, id), etag.encode() + b' ' + body)
+    
+    async def invalidate(self, namespace: str, id: Optional[int] = None) -> None:
+        message = self._key(namespace, '' if id is None else id)
+        await self._apply(message, shared=True)
+        if self.broadcast is not None:
+            await self.broadcast.publish(f'{self.origin} {message}')
+    
+    async def _apply(self, message: str, shared: bool = False) -> None:
+        namespace, _, id = message.partition(':')
+        if id:
+            self._generations[self._slot(message)] += 1
+        else:
+            self._namespace_generations[namespace] = self._namespace_generations.get(namespace, 0) + 1
+        
+        # Um backend compartilhado já foi limpo por quem escreveu; só caches locais precisam
+        if id and (shared or self.backend.local):
+            await self.backend.delete(self._key(namespace, id))
+        
+        for table in (reference_cache.categorias, reference_cache.centros_treinamento):
+            if table.model.__tablename__ == namespace:
+                table.invalidate()
+    
+    async def _on_message(self, message: str) -> None:
+        origin, _, message = message.partition(' ')
+        if origin != self.origin:
+            await self._apply(message)
+    
+    async def _on_reconnect(self) -> None:
+        # Sem saber o que foi invalidado no intervalo, descarta tudo o que é local ao processo
+        self._epoch += 1
+        if self.backend.local:
+            await self.backend.clear()
+        reference_cache.invalidate()
+    
+    async def start(self) -> None:
+        if self.broadcast is not None:
+            await self.broadcast.start(self._on_message, self._on_reconnect)
+    
+    async def stop(self) -> None:
+        if self.broadcast is not None:
+            await self.broadcast.stop()
+    
+    async def clear(self) -> None:
+        self._epoch += 1
+        await self.backend.clear()
+
+
+def build_entity_cache() -> EntityCache:
+    client = redis_client(settings.REDIS_URL) if settings.REDIS_URL else None
+    
+    if settings.CACHE_BACKEND == 'redis':
+        if client is None:
+            raise RuntimeError('CACHE_BACKEND=redis exige REDIS_URL')
+        backend = RedisCacheBackend(client, ttl=settings.CACHE_TTL)
+    else:
+        backend = MemoryCacheBackend(ttl=settings.CACHE_TTL, max_bytes=settings.CACHE_MAX_BYTES)
+    
+    # Com REDIS_URL, mesmo o LRU em memória recebe as invalidações dos outros workers
+    return EntityCache(backend, RedisBroadcast(client) if client is not None else None)
+
+
+entity_cache = build_entity_cache()
@@ -0,0 +1,31 @@
+import hashlib
+from typing import Optional
+from fastapi import Header, HTTPException, Response
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    
+    # If-None-Match usa comparação fraca: W/"x" e "x" são equivalentes
+    candidates = [candidate.strip().removeprefix('W/') for candidate in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates
+
+
+class ConditionalRequest:
+    """Dependência de GET condicional: responde 304 quando o ETag do cliente ainda é válido."""
+    
+    def __init__(self, response: Response, if_none_match: Optional[str] = Header(None)):
+        self.response = response
+        self.if_none_match = if_none_match
+    
+    def check(self, etag: str) -> None:
+        if etag_matches(self.if_none_match, etag):
+            raise HTTPException(status_code=304, headers={'ETag': etag})
+        
+        self.response.headers['ETag'] = etag
@@ -0,0 +1,37 @@
+import csv
+import io
+from typing import AsyncIterator
+from workout_api.schemas.atleta_schema import AtletaOut
+
+CSV_COLUMNS = [
+    'pk_id', 'nome', 'cpf', 'idade', 'peso', 'altura', 'sexo', 'created_at',
+    'categoria_id', 'categoria', 'centro_treinamento_id', 'centro_treinamento'
+]
+
+
+async def to_ndjson(partitions: AsyncIterator[list[AtletaOut]]) -> AsyncIterator[bytes]:
+    async for atletas in partitions:
+        yield b''.join(atleta.model_dump_json().encode() + b'\n' for atleta in atletas)
+
+
+async def to_csv(partitions: AsyncIterator[list[AtletaOut]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    
+    async for atletas in partitions:
+        for atleta in atletas:
+            writer.writerow([
+                atleta.pk_id, atleta.nome, atleta.cpf, atleta.idade, atleta.peso, atleta.altura,
+                atleta.sexo, atleta.created_at.isoformat(),
+                atleta.categoria_id, atleta.categoria.nome,
+                atleta.centro_treinamento_id, atleta.centro_treinamento.nome
+            ])
+        
+        # Um bloco por partição: a memória fica limitada ao tamanho da partição
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    
+    if buffer.tell():
+        yield buffer.getvalue().encode()
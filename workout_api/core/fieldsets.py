@@ -0,0 +1,45 @@
+from functools import lru_cache
+from typing import Optional
+from fastapi import HTTPException, Response
+from pydantic import BaseModel, create_model
+from workout_api.core.serialization import get_adapter
+
+
+def parse_fields(fields: Optional[str], schema: type[BaseModel]) -> Optional[frozenset[str]]:
+    # fields=nome,categoria: só campos de primeiro nível do schema
+    if fields is None:
+        return None
+    
+    campos = frozenset(campo.strip() for campo in fields.split(',') if campo.strip())
+    invalidos = sorted(campos - schema.model_fields.keys())
+    if not campos or invalidos:
+        raise HTTPException(
+            status_code=400,
+            detail=f'Campos inválidos: {", ".join(invalidos) or fields!r}. '
+                   f'Permitidos: {", ".join(schema.model_fields)}'
+        )
+    
+    return campos
+
+
+@lru_cache(maxsize=None)
+def partial_model(schema: type[BaseModel], campos: frozenset[str]) -> type[BaseModel]:
+    # Um model por combinação de campos, na ordem do schema original
+    return create_model(
+        f'{schema.__name__}Parcial',
+        **{
+            nome: (field.annotation, field)
+            for nome, field in schema.model_fields.items() if nome in campos
+        }
+    )
+
+
+def sparse_json_response(content: BaseModel, response: Response) -> Response:
+    # O response_model da rota tem todos os campos; a resposta parcial é serializada pelo próprio model
+    sparse = Response(
+        content=get_adapter(type(content)).dump_json(content),
+        status_code=response.status_code or 200,
+        media_type='application/json'
+    )
+    sparse.headers.raw.extend(response.headers.raw)
+    return sparse
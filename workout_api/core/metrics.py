@@ -0,0 +1,176 @@
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Optional
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from workout_api.configs.statement_timing import subscribe
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+DB_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+UNMATCHED_ROUTE = '<unmatched>'
+
+
+class Histogram:
+    """Histograma cumulativo no formato do Prometheus (buckets com limite superior inclusivo)."""
+    
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+    
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class RequestStats:
+    """Consultas e tempo de banco acumulados durante uma requisição."""
+    
+    __slots__ = ('queries', 'db_time')
+    
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+
+
+# Estatísticas da requisição em andamento; os eventos do engine somam nela
+current_request: ContextVar[Optional[RequestStats]] = ContextVar('current_request', default=None)
+
+
+class Metrics:
+    """Registro em memória das métricas do processo, exposto em texto do Prometheus."""
+    
+    def __init__(self):
+        self.requests: dict[tuple[str, str, str], int] = {}
+        self.latency: dict[tuple[str, str], Histogram] = {}
+        self.db_queries: dict[tuple[str, str], Histogram] = {}
+        self.db_time: dict[tuple[str, str], Histogram] = {}
+        self.in_flight: dict[str, int] = {}
+        self.queries_total = 0
+        self.query_seconds_total = 0.0
+    
+    def observe_request(self, method: str, route: str, status: int, elapsed: float, stats: RequestStats) -> None:
+        key = (method, route)
+        status_key = (method, route, str(status))
+        self.requests[status_key] = self.requests.get(status_key, 0) + 1
+        
+        if key not in self.latency:
+            self.latency[key] = Histogram(LATENCY_BUCKETS)
+            self.db_queries[key] = Histogram(QUERY_COUNT_BUCKETS)
+            self.db_time[key] = Histogram(DB_TIME_BUCKETS)
+        self.latency[key].observe(elapsed)
+        self.db_queries[key].observe(stats.queries)
+        self.db_time[key].observe(stats.db_time)
+    
+    def observe_query(self, elapsed: float) -> None:
+        self.queries_total += 1
+        self.query_seconds_total += elapsed
+        stats = current_request.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_time += elapsed
+    
+    def clear(self) -> None:
+        self.__init__()
+    
+    def render(self) -> str:
+        lines = []
+        
+        _header(lines, 'http_requests_total', 'counter', 'Requisições HTTP por método, rota e status.')
+        for (method, route, status), total in sorted(self.requests.items()):
+            lines.append(f'http_requests_total{_labels(method=method, route=route, status=status)} {total}')
+        
+        _header(lines, 'http_requests_in_flight', 'gauge', 'Requisições HTTP em andamento por método.')
+        for method, total in sorted(self.in_flight.items()):
+            lines.append(f'http_requests_in_flight{_labels(method=method)} {total}')
+        
+        for name, help_text, histograms in (
+            ('http_request_duration_seconds', 'Latência das requisições HTTP.', self.latency),
+            ('http_request_db_queries', 'Consultas ao banco por requisição.', self.db_queries),
+            ('http_request_db_duration_seconds', 'Tempo de banco acumulado por requisição.', self.db_time),
+        ):
+            _header(lines, name, 'histogram', help_text)
+            for (method, route), histogram in sorted(histograms.items()):
+                _histogram(lines, name, histogram, method=method, route=route)
+        
+        _header(lines, 'db_queries_total', 'counter', 'Consultas executadas em todos os engines.')
+        lines.append(f'db_queries_total {self.queries_total}')
+        _header(lines, 'db_query_duration_seconds_total', 'counter', 'Tempo total das consultas, em segundos.')
+        lines.append(f'db_query_duration_seconds_total {self.query_seconds_total:.6f}')
+        
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels: str) -> str:
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _header(lines: list, name: str, kind: str, help_text: str) -> None:
+    lines.append(f'# HELP {name} {help_text}')
+    lines.append(f'# TYPE {name} {kind}')
+
+
+def _histogram(lines: list, name: str, histogram: Histogram, **labels: str) -> None:
+    acumulado = 0
+    for limite, total in zip(histogram.buckets, histogram.counts):
+        acumulado += total
+        lines.append(f'{name}_bucket{_labels(**labels, le=f"{limite:g}")} {acumulado}')
+    lines.append(f'{name}_bucket{_labels(**labels, le="+Inf")} {histogram.count}')
+    lines.append(f'{name}_sum{_labels(**labels)} {histogram.sum:.6f}')
+    lines.append(f'{name}_count{_labels(**labels)} {histogram.count}')
+
+
+metrics = Metrics()
+
+
+@subscribe
+def _observe_statement(conn, statement, parameters, executemany, elapsed):
+    metrics.observe_query(elapsed)
+
+
+class MetricsMiddleware:
+    """Mede latência, status, consultas ao banco e requisições em andamento por rota."""
+    
+    def __init__(self, app: ASGIApp, registry: Metrics = metrics):
+        self.app = app
+        self.registry = registry
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope['method']
+        in_flight = self.registry.in_flight
+        in_flight[method] = in_flight.get(method, 0) + 1
+        stats = RequestStats()
+        token = current_request.set(stats)
+        status_code = 500
+        inicio = time.perf_counter()
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - inicio
+            current_request.reset(token)
+            in_flight[method] -= 1
+            # Template da rota (ex.: /atletas/{id}), nunca o caminho cru, para não explodir a cardinalidade
+            route = scope.get('route')
+            route_path = getattr(route, 'path', None) or UNMATCHED_ROUTE
+            self.registry.observe_request(method, route_path, status_code, elapsed, stats)
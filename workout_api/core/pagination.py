@@ -0,0 +1,27 @@
+import base64
+import binascii
+import json
+from fastapi import HTTPException
+
+
+def encode_cursor(*values) -> str:
+    payload = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, types: tuple[type, ...]) -> tuple:
+    """Valores do cursor, conferidos contra o tipo de cada coluna da chave de ordenação."""
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail='Cursor inválido')
+    
+    if not isinstance(values, list) or len(values) != len(types):
+        raise HTTPException(status_code=400, detail='Cursor inválido')
+    
+    # bool é subclasse de int, mas não é um valor válido para nenhuma chave
+    if any(isinstance(value, bool) or not isinstance(value, tipo) for value, tipo in zip(values, types)):
+        raise HTTPException(status_code=400, detail='Cursor inválido')
+    
+    return tuple(values)
@@ -0,0 +1,69 @@
+import functools
+import logging
+from contextvars import ContextVar
+from workout_api.configs.database import settings
+from workout_api.configs.statement_timing import subscribe
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+# Orçamentos ativos na tarefa atual (um bloco pode estar dentro de outro)
+_active: ContextVar[tuple] = ContextVar('query_budgets', default=())
+
+
+class QueryBudget:
+    """Conta os comandos SQL executados em um bloco e avisa ou falha acima do orçamento.
+    
+    Funciona como context manager (`with QueryBudget(2):`) e como decorator de rotas
+    assíncronas (`@QueryBudget(2)`). mode: 'raise', 'warn' ou 'off'; o padrão vem de
+    QUERY_BUDGET_MODE.
+    """
+    
+    def __init__(self, max_queries: int, label: str = None, mode: str = None):
+        self.max_queries = max_queries
+        self.label = label
+        self.mode = mode
+        self.statements: list[str] = []
+    
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+    
+    def __enter__(self) -> 'QueryBudget':
+        self._token = _active.set(_active.get() + (self,))
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _active.reset(self._token)
+        if exc_type is None:
+            self.check()
+    
+    def check(self) -> None:
+        mode = self.mode or settings.QUERY_BUDGET_MODE
+        if mode == 'off' or self.count <= self.max_queries:
+            return
+        
+        message = '\n'.join([
+            f'{self.label or "bloco"}: {self.count} consultas para um orçamento de {self.max_queries}',
+            *(f'  {i}. {" ".join(statement.split())}' for i, statement in enumerate(self.statements, 1))
+        ])
+        if mode == 'raise':
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+    
+    def __call__(self, fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            with QueryBudget(self.max_queries, self.label or fn.__qualname__, self.mode):
+                return await fn(*args, **kwargs)
+        return wrapper
+
+
+@subscribe
+def _count_statement(conn, statement, parameters, executemany, elapsed):
+    for budget in _active.get():
+        budget.statements.append(statement)
@@ -0,0 +1,37 @@
+import time
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+SAFE_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+
+class ReadYourWritesMiddleware:
+    """Marca o cliente, após uma escrita bem-sucedida, para ler do primário por alguns segundos.
+    
+    A janela segue em um cookie e em um cabeçalho de resposta; clientes sem cookies
+    podem reenviar o cabeçalho nas leituras seguintes.
+    """
+    
+    def __init__(self, app: ASGIApp, window: int, cookie: str, header: str):
+        self.app = app
+        self.window = window
+        self.cookie = cookie
+        self.header = header
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['method'] in SAFE_METHODS or self.window <= 0:
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_wrapper(message: Message) -> None:
+            if message['type'] == 'http.response.start' and message['status'] < 400:
+                until = f'{time.time() + self.window:.3f}'
+                headers = MutableHeaders(scope=message)
+                headers.append(self.header, until)
+                headers.append(
+                    'set-cookie',
+                    f'{self.cookie}={until}; Max-Age={self.window}; Path=/; HttpOnly; SameSite=Lax'
+                )
+            await send(message)
+        
+        await self.app(scope, receive, send_wrapper)
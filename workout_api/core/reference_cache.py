@@ -0,0 +1,111 @@
+import asyncio
+from typing import Optional
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from workout_api.core.etag import make_etag
+from workout_api.models.categoria_model import CategoriaModel
+from workout_api.models.centro_treinamento_model import CentroTreinamentoModel
+from workout_api.schemas.categoria_schema import CategoriaOut
+from workout_api.schemas.centro_treinamento_schema import CentroTreinamentoOut
+
+
+class ReferenceTable:
+    """Cópia em memória de uma tabela pequena, recarregada por inteiro quando invalidada."""
+    
+    def __init__(self, model, schema):
+        self.model = model
+        self.schema = schema
+        self.version = 0
+        self.etag: Optional[str] = None
+        self._rows: Optional[dict[int, object]] = None
+        self._lock = asyncio.Lock()
+    
+    @property
+    def loaded(self) -> bool:
+        return self._rows is not None
+    
+    def _to_schema(self, row):
+        return self.schema.model_construct(**row._mapping)
+    
+    async def load(self, db_session: AsyncSession) -> dict:
+        async with self._lock:
+            if self._rows is not None:
+                return self._rows
+            
+            version = self.version
+            # Fica em memória até a próxima invalidação: sempre carrega do primário, nunca de réplica
+            result = await db_session.execute(
+                select(*self.model.__table__.c).order_by(self.model.pk_id),
+                execution_options={'read_primary': True}
+            )
+            rows = {row.pk_id: self._to_schema(row) for row in result}
+            
+            # Uma invalidação durante a carga descarta o resultado para a próxima leitura
+            if version == self.version:
+                self._rows = rows
+                self._refresh_etag()
+                self.version += 1
+            
+            return rows
+    
+    def _refresh_etag(self) -> None:
+        self.etag = make_etag(self.model.__tablename__, [item.model_dump() for item in self._rows.values()])
+    
+    def invalidate(self) -> None:
+        self._rows = None
+        self.etag = None
+        self.version += 1
+    
+    async def get_etag(self, db_session: AsyncSession) -> Optional[str]:
+        # Conhecido em memória: validar o ETag não custa consulta ao banco
+        if not self.loaded:
+            await self.load(db_session)
+        return self.etag
+    
+    async def _get_rows(self, db_session: AsyncSession) -> dict:
+        rows = self._rows
+        if rows is None:
+            rows = await self.load(db_session)
+        return rows
+    
+    async def get_all(self, db_session: AsyncSession) -> list:
+        rows = await self._get_rows(db_session)
+        return list(rows.values())
+    
+    async def get(self, db_session: AsyncSession, id: int):
+        rows = await self._get_rows(db_session)
+        item = rows.get(id)
+        if item is None:
+            # Linha criada por outro processo depois da carga
+            result = await db_session.execute(
+                select(*self.model.__table__.c).filter(self.model.pk_id == id),
+                execution_options={'read_primary': True}
+            )
+            row = result.one_or_none()
+            if row is not None:
+                item = rows[id] = self._to_schema(row)
+                # A listagem agora inclui a linha: o ETag muda junto para o GET condicional não responder 304
+                if rows is self._rows:
+                    self._refresh_etag()
+        
+        return item
+
+
+class ReferenceCache:
+    """Dados de referência (categorias e centros de treinamento) lidos em todas as consultas de atletas."""
+    
+    def __init__(self):
+        self.categorias = ReferenceTable(CategoriaModel, CategoriaOut)
+        self.centros_treinamento = ReferenceTable(CentroTreinamentoModel, CentroTreinamentoOut)
+    
+    async def load(self, db_session: AsyncSession) -> None:
+        self.invalidate()
+        await self.categorias.load(db_session)
+        await self.centros_treinamento.load(db_session)
+    
+    def invalidate(self) -> None:
+        self.categorias.invalidate()
+        self.centros_treinamento.invalidate()
+
+
+reference_cache = ReferenceCache()
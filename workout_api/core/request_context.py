@@ -0,0 +1,34 @@
+from contextvars import ContextVar
+from typing import Optional
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Scope ASGI da requisição em andamento; o roteador grava nele a rota escolhida
+current_scope: ContextVar[Optional[Scope]] = ContextVar('current_scope', default=None)
+
+
+def current_route() -> Optional[str]:
+    """Método e template da rota em andamento (ex.: 'GET /atletas/{id}'), se houver."""
+    scope = current_scope.get()
+    if scope is None:
+        return None
+    
+    route = scope.get('route')
+    return f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+
+
+class RequestContextMiddleware:
+    """Publica o scope da requisição para código fora da rota (ex.: eventos do engine)."""
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        
+        token = current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_scope.reset(token)
@@ -0,0 +1,58 @@
+from sqlalchemy import Integer, String, column, func, select, table
+from workout_api.models.atleta_model import AtletaModel
+
+# Tabela FTS5 mantida por triggers no SQLite (ver atleta_model.SQLITE_FTS_DDL)
+atletas_fts = table('atletas_fts', column('rowid', Integer), column('nome', String), column('rank'))
+
+# O tokenizador trigram do FTS5 só encontra termos com pelo menos 3 caracteres
+FTS_MIN_LENGTH = 3
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _fts_query(nome: str, aproximada: bool) -> str:
+    if not aproximada:
+        return _fts_phrase(nome)
+    
+    # Busca aproximada: qualquer trigrama do termo, ordenado depois por relevância (bm25)
+    term = nome.lower()
+    trigrams = sorted({term[i:i + FTS_MIN_LENGTH] for i in range(len(term) - FTS_MIN_LENGTH + 1)})
+    return ' OR '.join(_fts_phrase(trigram) for trigram in trigrams)
+
+
+def _uses_fts(dialect: str, nome: str) -> bool:
+    return dialect == 'sqlite' and len(nome) >= FTS_MIN_LENGTH
+
+
+def nome_filter(dialect: str, nome: str, aproximada: bool = False):
+    if dialect == 'postgresql' and aproximada:
+        # Operador de similaridade do pg_trgm, atendido pelo índice GIN
+        return AtletaModel.nome.op('%')(nome)
+    
+    if _uses_fts(dialect, nome):
+        return AtletaModel.pk_id.in_(
+            select(atletas_fts.c.rowid).where(atletas_fts.c.nome.match(_fts_query(nome, aproximada)))
+        )
+    
+    # ILIKE '%nome%' (o índice GIN gin_trgm_ops também atende esse padrão no Postgres)
+    return AtletaModel.nome.icontains(nome, autoescape=True)
+
+
+def nome_rank(dialect: str, nome: str, aproximada: bool = False):
+    if dialect == 'postgresql':
+        return func.similarity(AtletaModel.nome, nome).desc()
+    
+    if _uses_fts(dialect, nome):
+        # rank do FTS5 (bm25): quanto menor, mais relevante
+        return (
+            select(atletas_fts.c.rank)
+            .where(
+                atletas_fts.c.rowid == AtletaModel.pk_id,
+                atletas_fts.c.nome.match(_fts_query(nome, aproximada))
+            )
+            .scalar_subquery()
+        )
+    
+    return func.length(AtletaModel.nome)
@@ -0,0 +1,87 @@
+import functools
+from typing import Any
+from fastapi import Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+from workout_api.configs.database import settings
+from workout_api.schemas import AtletaListOut, AtletaOut, CategoriaOut, CentroTreinamentoOut
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+except ImportError:
+    orjson = None
+    ORJSONResponse = None
+
+
+def default_response_class(fast_json: bool) -> type[JSONResponse]:
+    # FAST_JSON=false volta inteiramente ao caminho padrão, inclusive a classe de resposta
+    return ORJSONResponse if fast_json and ORJSONResponse is not None else JSONResponse
+
+
+DefaultJSONResponse = default_response_class(settings.FAST_JSON)
+
+_adapters: dict[Any, TypeAdapter] = {}
+
+
+def get_adapter(response_model) -> TypeAdapter:
+    # Um TypeAdapter compilado por response_model, reaproveitado por todas as requisições
+    adapter = _adapters.get(response_model)
+    if adapter is None:
+        adapter = _adapters[response_model] = TypeAdapter(response_model)
+    return adapter
+
+
+for _schema in (AtletaOut, AtletaListOut, CategoriaOut, CentroTreinamentoOut):
+    get_adapter(_schema)
+
+
+class FastJSONRoute(APIRoute):
+    """Rota que serializa o response_model direto para bytes JSON com o pydantic-core.
+    
+    Substitui o caminho padrão do FastAPI (model_dump, nova validação, jsonable_encoder
+    e json.dumps) produzindo o mesmo JSON. Desligado com FAST_JSON=false.
+    """
+    
+    def get_route_handler(self):
+        response_model = self.response_model
+        if (
+            settings.FAST_JSON
+            and response_model is not None
+            and not isinstance(response_model, DefaultPlaceholder)
+            and not getattr(self.dependant.call, '__fast_json__', False)
+        ):
+            self.dependant.call = self._fast_json_call(get_adapter(response_model))
+        
+        return super().get_route_handler()
+    
+    def _fast_json_call(self, adapter: TypeAdapter):
+        call = self.dependant.call
+        # O Response injetado carrega status e cabeçalhos definidos pelas dependências (ex.: ETag)
+        injected = self.dependant.response_param_name is None
+        response_param_name = self.dependant.response_param_name or '__fast_json_response__'
+        self.dependant.response_param_name = response_param_name
+        status_code = self.status_code
+        exclude_none = self.response_model_exclude_none
+        
+        @functools.wraps(call)
+        async def endpoint(**values):
+            sub_response: Response = values.pop(response_param_name) if injected else values[response_param_name]
+            content = await call(**values)
+            if isinstance(content, Response):
+                return content
+            
+            body = adapter.dump_json(adapter.validate_python(content, from_attributes=True), exclude_none=exclude_none)
+            response = Response(
+                content=body,
+                status_code=sub_response.status_code or status_code or 200,
+                media_type='application/json'
+            )
+            response.headers.raw.extend(sub_response.headers.raw)
+            return response
+        
+        endpoint.__fast_json__ = True
+        return endpoint
+
@@ -1,13 +1,56 @@
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi_pagination import add_pagination
-from workout_api.routers import atleta_router, categoria_router, centro_treinamento_router
+from sqlalchemy.exc import SQLAlchemyError
+from workout_api.configs.database import READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER, async_session, replicas, settings
+from workout_api.core.entity_cache import entity_cache
+from workout_api.core.metrics import MetricsMiddleware
+from workout_api.core.read_your_writes import ReadYourWritesMiddleware
+from workout_api.core.reference_cache import reference_cache
+from workout_api.core.request_context import RequestContextMiddleware
+from workout_api.core.serialization import DefaultJSONResponse
+from workout_api.routers import admin_router, atleta_router, categoria_router, centro_treinamento_router, metrics_router
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Carrega categorias e centros de treinamento antes da primeira requisição
+    try:
+        async with async_session() as session:
+            await reference_cache.load(session)
+    except (OSError, SQLAlchemyError):
+        logger.warning('Cache de referência não carregado na inicialização; será carregado sob demanda', exc_info=True)
+    
+    # Recebe as invalidações publicadas pelos outros workers
+    await entity_cache.start()
+    
+    yield
+    
+    await entity_cache.stop()
 
 app = FastAPI(
     title='WorkOut API',
     description='API para gerenciamento de academia de CrossFit',
-    version='1.0.0'
+    version='1.0.0',
+    lifespan=lifespan,
+    default_response_class=DefaultJSONResponse
 )
 
+# Sem réplicas toda leitura já vai ao primário: não há janela a marcar no cliente
+if replicas.engines:
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        window=settings.READ_YOUR_WRITES_SECONDS,
+        cookie=READ_PRIMARY_COOKIE,
+        header=READ_PRIMARY_HEADER
+    )
+app.add_middleware(RequestContextMiddleware)
+# Adicionado por último para ser o mais externo e medir a requisição inteira
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 app.include_router(
     atleta_router.router, 
     prefix='/atletas', 
@@ -23,6 +66,13 @@ app.include_router(
     prefix='/centros_treinamento', 
     tags=['centros_treinamento']
 )
+app.include_router(
+    admin_router.router, 
+    prefix='/admin', 
+    tags=['admin']
+)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router.router)
 
 # Configurar paginação
 add_pagination(app) 
\ No newline at end of file
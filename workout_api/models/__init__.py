@@ -1,3 +1,4 @@
 from workout_api.models.atleta_model import AtletaModel
+from workout_api.models.atleta_estatistica_model import AtletaEstatisticaModel, AtletaHistogramaModel
 from workout_api.models.categoria_model import CategoriaModel
 from workout_api.models.centro_treinamento_model import CentroTreinamentoModel 
\ No newline at end of file
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Float, Integer, String
+from workout_api.configs.database import BaseModel
+
+# Resumo dos atletas mantido a cada escrita: contagem e somas por dimensão (categoria, centro, sexo);
+# o total é a soma das linhas por sexo, sem uma linha única atualizada por toda escrita
+class AtletaEstatisticaModel(BaseModel):
+    __tablename__ = 'atletas_estatisticas'
+    
+    dimensao = Column(String(20), primary_key=True)
+    chave = Column(String(20), primary_key=True)
+    contagem = Column(Integer, nullable=False, default=0)
+    soma_peso = Column(Float, nullable=False, default=0)
+    soma_altura = Column(Float, nullable=False, default=0)
+    soma_idade = Column(Integer, nullable=False, default=0)
+
+# Histograma de idade (anos), peso (kg) e altura (cm) para os percentis
+class AtletaHistogramaModel(BaseModel):
+    __tablename__ = 'atletas_histograma'
+    
+    medida = Column(String(10), primary_key=True)
+    bucket = Column(Integer, primary_key=True)
+    contagem = Column(Integer, nullable=False, default=0) 
\ No newline at end of file
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index, DDL, event
 from sqlalchemy.orm import relationship
 from workout_api.configs.database import BaseModel
 
@@ -13,8 +14,55 @@ class AtletaModel(BaseModel):
     altura = Column(Float, nullable=False)
     sexo = Column(String(1), nullable=False)
     created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     categoria_id = Column(Integer, ForeignKey("categorias.pk_id"), nullable=False)
     centro_treinamento_id = Column(Integer, ForeignKey("centros_treinamento.pk_id"), nullable=False)
     
     categoria = relationship("CategoriaModel", lazy="selectin")
-    centro_treinamento = relationship("CentroTreinamentoModel", lazy="selectin") 
\ No newline at end of file
+    centro_treinamento = relationship("CentroTreinamentoModel", lazy="selectin")
+    
+    __table_args__ = (
+        # Chave da paginação por cursor (keyset)
+        Index('ix_atletas_nome_pk_id', 'nome', 'pk_id'),
+        # Filtros da listagem: igualdade na primeira coluna, ordem do cursor nas seguintes
+        Index('ix_atletas_centro_nome_pk_id', 'centro_treinamento_id', 'nome', 'pk_id'),
+        Index('ix_atletas_categoria_nome_pk_id', 'categoria_id', 'nome', 'pk_id'),
+        Index('ix_atletas_sexo_idade', 'sexo', 'idade'),
+        Index('ix_atletas_created_at', 'created_at'),
+        # Busca por substring/similaridade no nome (pg_trgm)
+        Index(
+            'ix_atletas_nome_trgm',
+            'nome',
+            postgresql_using='gin',
+            postgresql_ops={'nome': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
+
+# Índice FTS5 (tokenizador trigram) usado como alternativa ao pg_trgm no SQLite, criado junto com a
+# tabela pelo create_all. Bancos migrados recebem o índice da revisão 8b4e6d2f0a31, que guarda a sua
+# própria cópia do DDL: alterar esta lista não altera a migração
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE atletas_fts USING fts5("
+    "nome, content='atletas', content_rowid='pk_id', tokenize='trigram')",
+    "CREATE TRIGGER atletas_fts_ai AFTER INSERT ON atletas BEGIN "
+    "INSERT INTO atletas_fts(rowid, nome) VALUES (new.pk_id, new.nome); END",
+    "CREATE TRIGGER atletas_fts_ad AFTER DELETE ON atletas BEGIN "
+    "INSERT INTO atletas_fts(atletas_fts, rowid, nome) VALUES ('delete', old.pk_id, old.nome); END",
+    "CREATE TRIGGER atletas_fts_au AFTER UPDATE OF nome ON atletas BEGIN "
+    "INSERT INTO atletas_fts(atletas_fts, rowid, nome) VALUES ('delete', old.pk_id, old.nome); "
+    "INSERT INTO atletas_fts(rowid, nome) VALUES (new.pk_id, new.nome); END",
+]
+
+for statement in SQLITE_FTS_DDL:
+    event.listen(AtletaModel.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+
+event.listen(
+    AtletaModel.__table__,
+    'before_drop',
+    DDL('DROP TABLE IF EXISTS atletas_fts').execute_if(dialect='sqlite')
+)
+event.listen(
+    BaseModel.metadata,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql')
+) 
\ No newline at end of file
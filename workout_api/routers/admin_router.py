@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Query, status
+from workout_api.configs.database import engine, slow_queries
+from workout_api.configs.pool import pool_snapshot
+from workout_api.core.serialization import FastJSONRoute
+from workout_api.schemas.admin_schema import PoolOut, SlowQueryOut
+
+router = APIRouter(route_class=FastJSONRoute)
+
+@router.get(
+    '/pool', 
+    summary='Estatísticas do pool de conexões do banco',
+    status_code=status.HTTP_200_OK,
+    response_model=PoolOut,
+    response_model_exclude_none=True
+)
+async def get_pool() -> PoolOut:
+    return PoolOut(**pool_snapshot(engine.pool))
+
+@router.get(
+    '/slow-queries', 
+    summary='Consultas lentas mais recentes',
+    status_code=status.HTTP_200_OK,
+    response_model=list[SlowQueryOut]
+)
+async def get_slow_queries(
+    limit: int = Query(None, ge=1, description="Quantidade máxima de ocorrências, das mais recentes")
+) -> list[SlowQueryOut]:
+    return slow_queries.entries_newest_first(limit) 
\ No newline at end of file
@@ -1,11 +1,20 @@
-from fastapi import APIRouter, Body, Depends, Query, status
-from fastapi_pagination import Page
+from datetime import datetime
+from typing import Literal
+from fastapi import APIRouter, Body, Depends, File, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from workout_api.configs.database import get_session
+from workout_api.configs.database import get_read_session, get_session, get_stream_session
 from workout_api.controllers.atleta_controller import AtletaController
-from workout_api.schemas.atleta_schema import AtletaIn, AtletaOut, AtletaUpdate, AtletaListOut
+from workout_api.controllers.atleta_stats_controller import AtletaStatsController
+from workout_api.core.etag import ConditionalRequest
+from workout_api.core.query_budget import QueryBudget
+from workout_api.core.serialization import FastJSONRoute
+from workout_api.core.export import to_csv, to_ndjson
+from workout_api.core.fieldsets import sparse_json_response
+from workout_api.schemas.atleta_schema import AtletaIn, AtletaOut, AtletaUpdate, AtletaListOut, AtletaBulkOut, AtletaBatchOut, AtletaImportOut, AtletaStatsOut
+from workout_api.schemas.pagination_schema import PageOut
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 @router.post(
     '/', 
@@ -19,22 +28,150 @@ async def post(
 ) -> AtletaOut:
     return await AtletaController.create(db_session=db_session, atleta_in=atleta_in)
 
+@router.post(
+    '/bulk', 
+    summary='Criar atletas em lote',
+    status_code=status.HTTP_207_MULTI_STATUS,
+    response_model=AtletaBulkOut
+)
+async def post_bulk(
+    atletas_in: list[dict] = Body(..., min_length=1, max_length=5000),
+    db_session: AsyncSession = Depends(get_session)
+) -> AtletaBulkOut:
+    return await AtletaController.create_bulk(db_session=db_session, atletas_in=atletas_in)
+
+@router.post(
+    '/import', 
+    summary='Importar atletas de um arquivo CSV',
+    status_code=status.HTTP_207_MULTI_STATUS,
+    response_model=AtletaImportOut
+)
+async def post_import(
+    arquivo: UploadFile = File(
+        ..., 
+        description='CSV com cabeçalho nome,cpf,idade,peso,altura,sexo,categoria_id,centro_treinamento_id'
+    ),
+    db_session: AsyncSession = Depends(get_session)
+) -> AtletaImportOut:
+    return await AtletaController.import_csv(db_session=db_session, arquivo=arquivo.file)
+
+def filtros_atleta(
+    categoria_id: int = Query(None, description="Filtrar pela categoria"),
+    centro_treinamento_id: int = Query(None, description="Filtrar pelo centro de treinamento"),
+    sexo: Literal['M', 'F'] = Query(None, description="Filtrar por sexo"),
+    idade_min: int = Query(None, ge=0, description="Idade mínima"),
+    idade_max: int = Query(None, ge=0, description="Idade máxima"),
+    criado_desde: datetime = Query(None, description="Cadastrados a partir desta data"),
+    criado_ate: datetime = Query(None, description="Cadastrados até esta data")
+) -> dict:
+    return dict(
+        categoria_id=categoria_id,
+        centro_treinamento_id=centro_treinamento_id,
+        sexo=sexo,
+        idade_min=idade_min,
+        idade_max=idade_max,
+        criado_desde=criado_desde,
+        criado_ate=criado_ate
+    )
+
 @router.get(
     '/', 
     summary='Consultar todos os atletas',
     status_code=status.HTTP_200_OK,
-    response_model=Page[AtletaListOut]
+    response_model=PageOut[AtletaListOut]
 )
+# Orçamento com caches frios: total, página e a carga das duas tabelas de referência
+@QueryBudget(4)
 async def query(
-    db_session: AsyncSession = Depends(get_session),
+    db_session: AsyncSession = Depends(get_read_session),
     nome: str = Query(None, description="Filtrar por nome do atleta"),
-    cpf: str = Query(None, description="Filtrar por CPF do atleta")
-) -> Page[AtletaListOut]:
-    return await AtletaController.get_all(
+    busca: Literal['contem', 'aproximada'] = Query('contem', description="Busca por nome: contem (substring) ou aproximada (similaridade)"),
+    ordenar: Literal['nome', 'relevancia'] = Query(None, description="Ordenar por nome ou pela relevância da busca por nome"),
+    cpf: str = Query(None, description="Filtrar por CPF do atleta"),
+    paginacao: Literal['offset', 'cursor'] = Query('offset', description="Modo de paginação: offset (page/size) ou cursor (keyset)"),
+    cursor: str = Query(None, description="Cursor retornado em next_cursor da página anterior"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query(None, description="Como calcular o total: exata (COUNT), estimada ou nenhuma"),
+    fields: str = Query(None, description="Campos de cada item separados por vírgula (ex.: nome,categoria)"),
+    filtros: dict = Depends(filtros_atleta),
+    response: Response = None,
+    condicional: ConditionalRequest = Depends()
+) -> PageOut[AtletaListOut]:
+    page = await AtletaController.get_all(
         db_session=db_session, 
         nome=nome, 
-        cpf=cpf
+        cpf=cpf,
+        paginacao=paginacao,
+        cursor=cursor,
+        contagem=contagem,
+        busca=busca,
+        ordenar=ordenar,
+        fields=fields,
+        condicional=condicional,
+        **filtros
     )
+    return sparse_json_response(page, response) if fields else page
+
+@router.get(
+    '/export', 
+    summary='Exportar atletas em NDJSON ou CSV',
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse
+)
+async def export(
+    db_session: AsyncSession = Depends(get_stream_session),
+    formato: Literal['ndjson', 'csv'] = Query('ndjson', alias='format', description="Formato do arquivo exportado"),
+    nome: str = Query(None, description="Filtrar por nome do atleta"),
+    busca: Literal['contem', 'aproximada'] = Query('contem', description="Busca por nome: contem (substring) ou aproximada (similaridade)"),
+    cpf: str = Query(None, description="Filtrar por CPF do atleta"),
+    filtros: dict = Depends(filtros_atleta)
+) -> StreamingResponse:
+    partitions = AtletaController.export(db_session=db_session, nome=nome, cpf=cpf, busca=busca, **filtros)
+    
+    if formato == 'csv':
+        return StreamingResponse(
+            to_csv(partitions),
+            media_type='text/csv',
+            headers={'Content-Disposition': 'attachment; filename="atletas.csv"'}
+        )
+    
+    return StreamingResponse(
+        to_ndjson(partitions),
+        media_type='application/x-ndjson',
+        headers={'Content-Disposition': 'attachment; filename="atletas.ndjson"'}
+    )
+
+@router.get(
+    '/stats', 
+    summary='Estatísticas dos atletas',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaStatsOut
+)
+@QueryBudget(2)
+async def get_stats(db_session: AsyncSession = Depends(get_read_session)) -> AtletaStatsOut:
+    return await AtletaStatsController.get(db_session=db_session)
+
+@router.post(
+    '/stats/recompute', 
+    summary='Recalcular as estatísticas dos atletas a partir da tabela',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaStatsOut
+)
+async def post_stats_recompute(db_session: AsyncSession = Depends(get_session)) -> AtletaStatsOut:
+    return await AtletaStatsController.recompute(db_session=db_session)
+
+@router.get(
+    '/batch', 
+    summary='Consultar vários atletas pelos ids',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaBatchOut
+)
+@QueryBudget(3)
+async def get_batch(
+    ids: list[int] = Query(..., description="Ids dos atletas, ex.: ?ids=1&ids=2"),
+    db_session: AsyncSession = Depends(get_read_session),
+    condicional: ConditionalRequest = Depends()
+) -> AtletaBatchOut:
+    return await AtletaController.get_batch(db_session=db_session, ids=ids, condicional=condicional)
 
 @router.get(
     '/{id}', 
@@ -42,11 +179,16 @@ async def query(
     status_code=status.HTTP_200_OK,
     response_model=AtletaOut
 )
+@QueryBudget(3)
 async def get(
     id: int,
-    db_session: AsyncSession = Depends(get_session)
+    db_session: AsyncSession = Depends(get_read_session),
+    fields: str = Query(None, description="Campos do atleta separados por vírgula (ex.: nome,cpf,categoria)"),
+    response: Response = None,
+    condicional: ConditionalRequest = Depends()
 ) -> AtletaOut:
-    return await AtletaController.get_by_id(db_session=db_session, id=id)
+    atleta = await AtletaController.get_by_id(db_session=db_session, id=id, fields=fields, condicional=condicional)
+    return sparse_json_response(atleta, response) if fields else atleta
 
 @router.patch(
     '/{id}', 
@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Body, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from workout_api.configs.database import get_session
+from workout_api.configs.database import get_read_session, get_session
 from workout_api.controllers.categoria_controller import CategoriaController
+from workout_api.core.etag import ConditionalRequest
+from workout_api.core.query_budget import QueryBudget
+from workout_api.core.serialization import FastJSONRoute
 from workout_api.schemas.categoria_schema import CategoriaIn, CategoriaOut
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 @router.post(
     '/', 
@@ -24,10 +27,12 @@ async def post(
     status_code=status.HTTP_200_OK,
     response_model=list[CategoriaOut]
 )
+@QueryBudget(1)
 async def query(
-    db_session: AsyncSession = Depends(get_session)
+    db_session: AsyncSession = Depends(get_read_session),
+    condicional: ConditionalRequest = Depends()
 ) -> list[CategoriaOut]:
-    return await CategoriaController.get_all(db_session=db_session)
+    return await CategoriaController.get_all(db_session=db_session, condicional=condicional)
 
 @router.get(
     '/{id}', 
@@ -35,8 +40,10 @@ async def query(
     status_code=status.HTTP_200_OK,
     response_model=CategoriaOut
 )
+@QueryBudget(2)
 async def get(
     id: int,
-    db_session: AsyncSession = Depends(get_session)
+    db_session: AsyncSession = Depends(get_read_session),
+    condicional: ConditionalRequest = Depends()
 ) -> CategoriaOut:
-    return await CategoriaController.get_by_id(db_session=db_session, id=id) 
\ No newline at end of file
+    return await CategoriaController.get_by_id(db_session=db_session, id=id, condicional=condicional) 
\ No newline at end of file
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+from workout_api.core.metrics import metrics
+
+router = APIRouter()
+
+@router.get(
+    '/metrics', 
+    summary='Métricas no formato de texto do Prometheus',
+    status_code=status.HTTP_200_OK,
+    response_class=PlainTextResponse,
+    include_in_schema=False
+)
+async def get_metrics() -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type='text/plain; version=0.0.4') 
\ No newline at end of file
@@ -1,3 +1,5 @@
-from workout_api.schemas.atleta_schema import AtletaIn, AtletaOut, AtletaUpdate, AtletaListOut
+from workout_api.schemas.atleta_schema import AtletaIn, AtletaOut, AtletaUpdate, AtletaListOut, AtletaBulkOut, AtletaBulkResultOut, AtletaBatchOut, AtletaImportOut, AtletaImportErroOut, AtletaStatsOut
 from workout_api.schemas.categoria_schema import CategoriaIn, CategoriaOut
-from workout_api.schemas.centro_treinamento_schema import CentroTreinamentoIn, CentroTreinamentoOut 
\ No newline at end of file
+from workout_api.schemas.centro_treinamento_schema import CentroTreinamentoIn, CentroTreinamentoOut
+from workout_api.schemas.pagination_schema import PageOut
+from workout_api.schemas.admin_schema import PoolOut, SlowQueryOut 
\ No newline at end of file
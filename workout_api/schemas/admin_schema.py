@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+from typing import Annotated, Any, Optional
+from datetime import datetime
+
+class PoolOut(BaseModel):
+    classe: Annotated[str, Field(description='Classe do pool de conexões')]
+    tamanho: Annotated[Optional[int], Field(None, description='Conexões mantidas no pool (pool_size)')]
+    em_uso: Annotated[Optional[int], Field(None, description='Conexões em uso no momento')]
+    ociosas: Annotated[Optional[int], Field(None, description='Conexões abertas disponíveis no pool')]
+    overflow: Annotated[Optional[int], Field(None, description='Conexões abertas além do pool_size no momento')]
+    max_overflow: Annotated[Optional[int], Field(None, description='Limite de conexões além do pool_size')]
+    timeout: Annotated[Optional[float], Field(None, description='Espera máxima por uma conexão, em segundos')]
+    checkouts: Annotated[Optional[int], Field(None, description='Conexões entregues desde a inicialização')]
+    espera_total: Annotated[Optional[float], Field(None, description='Tempo total de checkout, em segundos')]
+    espera_media: Annotated[Optional[float], Field(None, description='Tempo médio de checkout, em segundos')]
+    espera_maxima: Annotated[Optional[float], Field(None, description='Maior tempo de checkout, em segundos')]
+    espera_histograma: Annotated[Optional[dict[str, int]], Field(None, description='Checkouts por limite superior de espera, em segundos')]
+    overflows: Annotated[Optional[int], Field(None, description='Conexões criadas além do pool_size')]
+    timeouts: Annotated[Optional[int], Field(None, description='Checkouts que estouraram o pool_timeout')]
+    pico_em_uso: Annotated[Optional[int], Field(None, description='Maior número de conexões em uso ao mesmo tempo')]
+
+class SlowQueryOut(BaseModel):
+    id: Annotated[int, Field(description='Identificador da ocorrência')]
+    sql: Annotated[str, Field(description='Comando SQL, com CPFs mascarados')]
+    parametros: Annotated[Any, Field(None, description='Parâmetros do comando, com CPFs mascarados')]
+    duracao_ms: Annotated[float, Field(description='Duração em milissegundos')]
+    rota: Annotated[Optional[str], Field(None, description='Método e rota que executaram o comando')]
+    ocorrido_em: Annotated[datetime, Field(description='Quando o comando terminou')]
+    plano: Annotated[Optional[list[str]], Field(None, description='EXPLAIN capturado em segundo plano (Postgres)')] 
\ No newline at end of file
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, validator
-from typing import Annotated, Optional
+from typing import Annotated, Literal, Optional
 from datetime import datetime
 from workout_api.schemas.categoria_schema import CategoriaOut
 from workout_api.schemas.centro_treinamento_schema import CentroTreinamentoOut
@@ -40,4 +40,54 @@ class AtletaUpdate(BaseModel):
 class AtletaListOut(BaseModel):
     nome: Annotated[str, Field(description='Nome do atleta')]
     centro_treinamento: CentroTreinamentoOut
-    categoria: CategoriaOut 
\ No newline at end of file
+    categoria: CategoriaOut
+
+# Resultado por linha da criação em lote
+class AtletaBulkResultOut(BaseModel):
+    indice: Annotated[int, Field(description='Posição do atleta no lote enviado')]
+    status: Annotated[Literal['criado', 'conflito', 'invalido'], Field(description='Resultado da linha')]
+    detalhe: Annotated[Optional[str], Field(None, description='Motivo da rejeição')]
+    atleta: Annotated[Optional[AtletaOut], Field(None, description='Atleta criado')]
+
+class AtletaBulkOut(BaseModel):
+    criados: Annotated[int, Field(description='Quantidade de atletas criados')]
+    rejeitados: Annotated[int, Field(description='Quantidade de linhas rejeitadas')]
+    resultados: list[AtletaBulkResultOut]
+
+# Busca de vários atletas por id, na ordem pedida
+class AtletaBatchOut(BaseModel):
+    atletas: Annotated[list[AtletaOut], Field(description='Atletas encontrados, na ordem dos ids informados')]
+    nao_encontrados: Annotated[list[int], Field(description='Ids sem atleta correspondente')]
+
+# Estatísticas dos atletas
+class AtletaContagemOut(BaseModel):
+    id: Annotated[int, Field(description='Identificador da categoria ou do centro de treinamento')]
+    nome: Annotated[Optional[str], Field(None, description='Nome da categoria ou do centro de treinamento')]
+    total: Annotated[int, Field(description='Quantidade de atletas')]
+
+class AtletaMedidaOut(BaseModel):
+    media: Annotated[Optional[float], Field(None, description='Média')]
+    p50: Annotated[Optional[float], Field(None, description='Mediana (aproximada à largura do bucket)')]
+    p90: Annotated[Optional[float], Field(None, description='Percentil 90 (aproximado à largura do bucket)')]
+    p99: Annotated[Optional[float], Field(None, description='Percentil 99 (aproximado à largura do bucket)')]
+
+class AtletaStatsOut(BaseModel):
+    total: Annotated[int, Field(description='Quantidade de atletas')]
+    por_categoria: list[AtletaContagemOut]
+    por_centro_treinamento: list[AtletaContagemOut]
+    por_sexo: Annotated[dict[str, int], Field(description='Quantidade de atletas por sexo')]
+    idade: AtletaMedidaOut
+    peso: AtletaMedidaOut
+    altura: AtletaMedidaOut
+
+# Relatório da importação de CSV
+class AtletaImportErroOut(BaseModel):
+    linha: Annotated[int, Field(description='Linha do arquivo CSV')]
+    cpf: Annotated[Optional[str], Field(None, description='CPF informado na linha')]
+    detalhe: Annotated[str, Field(description='Motivo da rejeição')]
+
+class AtletaImportOut(BaseModel):
+    importados: Annotated[int, Field(description='Quantidade de atletas importados')]
+    rejeitados: Annotated[int, Field(description='Quantidade de linhas rejeitadas')]
+    erros: Annotated[list[AtletaImportErroOut], Field(description='Linhas rejeitadas (limitado às primeiras)')]
+    erros_truncados: Annotated[bool, Field(False, description='Indica que há mais rejeições do que as listadas')]
\ No newline at end of file
@@ -0,0 +1,10 @@
+from typing import Annotated, Generic, Literal, Optional, TypeVar
+from fastapi_pagination import Page
+from pydantic import Field
+
+T = TypeVar('T')
+
+# Página padrão acrescida do cursor (paginação por keyset) e do modo de contagem do total
+class PageOut(Page[T], Generic[T]):
+    contagem: Annotated[Optional[Literal['exata', 'estimada', 'nenhuma']], Field(None, description='Como o total foi obtido')]
+    next_cursor: Annotated[Optional[str], Field(None, description='Cursor opaco para a próxima página (paginação por cursor)')]